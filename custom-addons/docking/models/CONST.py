@@ -103,3 +103,6 @@ PRIORITY_SELECTION = [
     (LOW, "Low"),
     (HIGH, "High"),
 ]
+
+# number of compiled job cost formulas kept in memory
+COST_FORMULA_CACHE_SIZE = 256
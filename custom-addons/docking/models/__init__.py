@@ -21,6 +21,7 @@ from . import inspection_event
 from . import contract
 from . import contract_payment_instalment
 from . import cost_settlement_report
+from . import cost_formula
 from . import job_final_cost_formula
 from . import job_final_cost_predefined_factor
 from . import job_quote_final_parameter_set
@@ -13,7 +13,12 @@ from collections import defaultdict
 class Contract(models.Model):
     _name = "docking.contract"
     _description = "Contract records"
-    _inherit = ["utilities.approval.status", "mail.thread", "mail.activity.mixin"]
+    _inherit = [
+        "utilities.approval.status",
+        "mail.thread",
+        "mail.activity.mixin",
+        "utilities.sequence.mixin",
+    ]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -93,8 +98,7 @@ class Contract(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.contract")
+        self._fill_sequence_refs(vals_list, "docking.contract")
         result = super(Contract, self).create(vals_list)
 
         for record in result:
@@ -146,7 +150,7 @@ class Contract(models.Model):
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
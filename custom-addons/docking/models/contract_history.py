@@ -8,7 +8,7 @@ from . import CONST
 class ContractHistory(models.Model):
     _name = "docking.contract.history"
     _description = "Contract History records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     html = fields.Html("Html", tracking=True)
@@ -30,9 +30,7 @@ class ContractHistory(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.contract.history"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.contract.history")
         return super(ContractHistory, self).create(vals_list)
 
     def name_get(self):
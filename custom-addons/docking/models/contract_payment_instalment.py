@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class ContractPaymentInstalment(models.Model):
     _name = "docking.contract.payment.instalment"
     _description = "Contract payment instalment records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     status = fields.Selection(
@@ -43,9 +43,7 @@ class ContractPaymentInstalment(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.contract.payment.instalment"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.contract.payment.instalment")
         return super(ContractPaymentInstalment, self).create(vals_list)
 
     def name_get(self):
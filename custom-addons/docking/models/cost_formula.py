@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import ast
+import logging
+from collections import defaultdict
+from functools import lru_cache, reduce
+
+import numpy as np
+
+from . import CONST
+
+_logger = logging.getLogger(__name__)
+
+VARIABLES = (
+    "quantity",
+    "weight",
+    "length",
+    "width",
+    "height",
+    "factor",
+    "unit_price",
+)
+
+
+def _minimum(*values):
+    return reduce(np.minimum, values)
+
+
+def _maximum(*values):
+    return reduce(np.maximum, values)
+
+
+def _round(value, ndigits=0):
+    # the constants of a formula are floats, numpy wants an int
+    return np.round(value, int(ndigits))
+
+
+FUNCTIONS = {
+    "abs": np.abs,
+    "min": _minimum,
+    "max": _maximum,
+    "round": _round,
+}
+OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+class FormulaError(ValueError):
+    pass
+
+
+def _check_round_digits(args):
+    """
+    The digits of round apply to every row at once, they must be a number
+    written in the formula.
+    """
+    digits = args[0]
+    if isinstance(digits, ast.UnaryOp) and isinstance(digits.op, (ast.UAdd, ast.USub)):
+        digits = digits.operand
+    if len(args) > 1 or not isinstance(digits, ast.Constant):
+        raise FormulaError("The digits of round must be a number")
+
+
+def _check_node(node):
+    if isinstance(node, ast.Expression):
+        _check_node(node.body)
+    elif isinstance(node, ast.BinOp):
+        if not isinstance(node.op, OPERATORS):
+            raise FormulaError(f"Operator not allowed: {type(node.op).__name__}")
+        _check_node(node.left)
+        _check_node(node.right)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, OPERATORS):
+            raise FormulaError(f"Operator not allowed: {type(node.op).__name__}")
+        _check_node(node.operand)
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise FormulaError(f"Value not allowed: {node.value!r}")
+    elif isinstance(node, ast.Name):
+        if node.id not in VARIABLES:
+            raise FormulaError(f"Unknown variable: {node.id}")
+    elif isinstance(node, ast.Call):
+        if (
+            not isinstance(node.func, ast.Name)
+            or node.func.id not in FUNCTIONS
+            or node.keywords
+        ):
+            raise FormulaError("Function not allowed")
+        if node.func.id == "round" and len(node.args) > 1:
+            _check_round_digits(node.args[1:])
+        for arg in node.args:
+            _check_node(arg)
+    else:
+        raise FormulaError(f"Expression not allowed: {type(node).__name__}")
+
+
+@lru_cache(maxsize=CONST.COST_FORMULA_CACHE_SIZE)
+def compile_formula(formula):
+    """
+    Parse a cost formula once. Only numbers, arithmetic operators, the
+    functions of FUNCTIONS and the variables of VARIABLES are allowed.
+    :raise FormulaError: when the formula is not valid
+    :return: the compiled code of the formula
+    """
+    try:
+        tree = ast.parse(formula.strip(), mode="eval")
+    except SyntaxError as e:
+        raise FormulaError(str(e))
+    _check_node(tree)
+    # float constants make huge powers overflow instead of computing
+    # arbitrarily large integers
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant):
+            node.value = float(node.value)
+    return compile(tree, "<cost formula>", "eval")
+
+
+def evaluate_formula(formula, variables):
+    """
+    :param variables: {variable: a number or an array of numbers}
+    :return: the value(s) of the formula, inf or NaN where a division by
+        zero happens
+    """
+    code = compile_formula(formula)
+    namespace = dict.fromkeys(VARIABLES, 0.0)
+    namespace.update(variables)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return eval(code, {"__builtins__": {}, **FUNCTIONS}, namespace)
+
+
+def evaluate_costs(formulas, values, defaults):
+    """
+    Evaluate the formula of each row, the rows sharing a formula are
+    evaluated together as arrays.
+    :param formulas: the formula of each row
+    :param values: {variable: the value of each row}
+    :param defaults: the cost of each row without formula or when its
+        formula gives no finite number
+    :return: the cost of each row
+    """
+    results = np.array(defaults, dtype=float)
+    columns = {name: np.array(column, dtype=float) for name, column in values.items()}
+
+    positions_by_formula = defaultdict(list)
+    for position, formula in enumerate(formulas):
+        if formula and formula.strip():
+            positions_by_formula[formula].append(position)
+
+    for formula, positions in positions_by_formula.items():
+        variables = {name: column[positions] for name, column in columns.items()}
+        try:
+            costs = evaluate_formula(formula, variables)
+        except (FormulaError, ArithmeticError, TypeError) as e:
+            _logger.warning("Invalid cost formula %r: %s", formula, e)
+            continue
+        costs = np.broadcast_to(np.asarray(costs, dtype=float), (len(positions),))
+        results[positions] = np.where(np.isfinite(costs), costs, results[positions])
+    return results.tolist()
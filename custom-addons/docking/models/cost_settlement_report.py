@@ -6,12 +6,9 @@ from . import CONST
 from odoo.exceptions import ValidationError
 import io
 import os
-import base64  # Add this import for base64 encoding
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 import openpyxl
 from datetime import datetime
-import tempfile
 from odoo.exceptions import UserError
 from odoo import _, api, fields, models
 from datetime import datetime, timedelta
@@ -21,7 +18,11 @@ from openpyxl.styles import Alignment
 class CostSettlementReport(models.Model):
     _name = "docking.cost.settlement.report"
     _description = "Cost Settlement Report records"
-    _inherit = ["utilities.approval.status", "utilities.notification"]
+    _inherit = [
+        "utilities.approval.status",
+        "utilities.notification",
+        "utilities.sequence.mixin",
+    ]
     _check_company_auto = True
 
     comment = fields.Char("Comment", tracking=True)
@@ -76,9 +77,7 @@ class CostSettlementReport(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.cost.settlement.report"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.cost.settlement.report")
 
         result = super(CostSettlementReport, self).create(vals_list)
 
@@ -129,18 +128,15 @@ class CostSettlementReport(models.Model):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/hmsc.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("hmsc.xlsx")
+        worksheet = workbook.active
 
         ###
         row = 3
         index = 0
+        xlsx_template._insert_rows(worksheet, row, len(self.job_quote_ids))
         for job_quote in self.job_quote_ids:
-            worksheet.insert_rows(row)
             index += 1
             worksheet.cell(row=row, column=1, value=index)
             worksheet.cell(
@@ -166,62 +162,24 @@ class CostSettlementReport(models.Model):
             worksheet.cell(row=row, column=14, value=job_quote.final_cost)
             row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Quyết toán công việc.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def custom_export_material_to_xlsx(self):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = (
-            "/mnt/extra-addons/report_template/vt.xlsx"  # Replace with the actual path
-        )
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("vt.xlsx")
+        worksheet = workbook.active
 
         ###
         row = 3
         index = 0
+        xlsx_template._insert_rows(worksheet, row, len(self.material_quote_ids))
         for material_quote in self.material_quote_ids:
-            worksheet.insert_rows(row)
             index += 1
             worksheet.cell(row=row, column=1, value=index)
             worksheet.cell(
@@ -250,43 +208,10 @@ class CostSettlementReport(models.Model):
             worksheet.cell(row=row, column=10, value=material_quote.note)
             row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Quyết toán vật tư.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def action_propose(self):
         # if it is about to be proposed to the last approval level,
@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class ExpectedCostReport(models.Model):
     _name = "docking.expected.cost.report"
     _description = "Expected cost report records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
 
     comment = fields.Char("Comment", tracking=True)
 
@@ -49,9 +49,7 @@ class ExpectedCostReport(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.expected.cost.report"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.expected.cost.report")
 
         results = super(ExpectedCostReport, self).create(vals_list)
         return results
@@ -11,7 +11,7 @@ from datetime import timedelta
 class DockingPlain(models.Model):
     _name = "docking.docking.plan"
     _description = "Docking plain records"
-    _inherit = ["ship.date", "utilities.notification"]
+    _inherit = ["ship.date", "utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -30,6 +30,15 @@ class DockingPlain(models.Model):
     supplier_emails = fields.Char(
         "Supplier emails", compute="_get_supplier_emails", store=True, tracking=True
     )
+    supplier_ids = fields.Many2many(
+        "docking.supplier",
+        "docking_docking_plan_docking_supplier_rel",
+        "docking_plan_id",
+        "supplier_id",
+        string="Suppliers",
+        compute="_get_supplier_ids",
+        store=True,
+    )
     is_allow_create_report = fields.Boolean(
         "Is allow create report", compute="_calc_is_allow_create_report"
     )
@@ -102,8 +111,7 @@ class DockingPlain(models.Model):
     def create(self, vals_list):
         self._is_not_completed_docking_plan(raise_error=True)
 
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.docking.plan")
+        self._fill_sequence_refs(vals_list, "docking.docking.plan")
         result = super(DockingPlain, self).create(vals_list)
 
         for record in result:
@@ -165,6 +173,15 @@ class DockingPlain(models.Model):
 
             record.supplier_emails = string_emails
 
+    @api.depends(
+        "material_survey_data_ids.material_quote_ids.material_supplier_quote_ids.supplier_id"
+    )
+    def _get_supplier_ids(self):
+        for record in self:
+            record.supplier_ids = (
+                record.material_survey_data_ids.material_quote_ids.material_supplier_quote_ids.supplier_id
+            )
+
     @api.depends("material_survey_data_ids", "equipment_survey_data_ids")
     def _calc_is_allow_create_report(self):
         for record in self:
@@ -335,8 +352,7 @@ class DockingPlain(models.Model):
         subject = "Thiếu ngày docking cho kế hoạch Docking!!"
         message = f"Bản ghi {self.ref}({self.expected_start_date}) cần điền ngày Docking thực tế!!!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _noti_docking_plan_before_3_months(self):
         self.ensure_one()
@@ -350,8 +366,7 @@ class DockingPlain(models.Model):
         subject = "Chuẩn bị docking cho 3 tháng tới!!"
         message = f"3 tháng tới đến ngày {self.expected_start_date} dự kiến có docking, người dùng kiểm tra và chuẩn bị các hạng mục!!!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _noti_docking_plan_before_6_months(self):
         self.ensure_one()
@@ -365,12 +380,11 @@ class DockingPlain(models.Model):
         subject = "Chuẩn bị docking cho 6 tháng tới!!"
         message = f"6 tháng tới đến ngày {self.expected_start_date} dự kiến có docking, user kiểm tra và chuẩn bị các hạng mục quan trọng cần làm trước!!!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class EquipmentSurveyData(models.Model):
     _name = "docking.equipment.survey.data"
     _description = "Equipment survey data records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     code = fields.Char("Code", tracking=True)
@@ -52,9 +52,7 @@ class EquipmentSurveyData(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.equipment.survey.data"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.equipment.survey.data")
         result = super(EquipmentSurveyData, self).create(vals_list)
         for record in result:
             if record._is_arise():
@@ -8,7 +8,7 @@ from . import CONST
 class EquipmentSurveyGroup(models.Model):
     _name = "docking.equipment.survey.group"
     _description = "Equipment survey group records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -40,10 +40,7 @@ class EquipmentSurveyGroup(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "docking.equipment.survey.group"
-            )
+        self._fill_sequence_refs(vals_list, "docking.equipment.survey.group")
         return super(EquipmentSurveyGroup, self).create(vals_list)
 
     def name_get(self):
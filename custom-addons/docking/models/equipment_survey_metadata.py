@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class EquipmentSurveyMetadata(models.Model):
     _name = "docking.equipment.survey.metadata"
     _description = "Equipment survey metadata records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -51,10 +51,7 @@ class EquipmentSurveyMetadata(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "docking.equipment.survey.metadata"
-            )
+        self._fill_sequence_refs(vals_list, "docking.equipment.survey.metadata")
         return super(EquipmentSurveyMetadata, self).create(vals_list)
 
     def name_get(self):
@@ -6,12 +6,9 @@ from . import CONST
 from odoo.exceptions import ValidationError
 import io
 import os
-import base64  # Add this import for base64 encoding
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 import openpyxl
 from datetime import datetime
-import tempfile
 from odoo.exceptions import UserError
 from odoo import _, api, fields, models
 from datetime import datetime, timedelta
@@ -21,7 +18,7 @@ from openpyxl.styles import Alignment
 class ExpectedCostReport(models.Model):
     _name = "docking.expected.cost.report"
     _description = "Expected cost report records"
-    _inherit = ["utilities.approval.status", "mail.thread"]
+    _inherit = ["utilities.approval.status", "mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     comment = fields.Char("Comment", tracking=True)
@@ -70,9 +67,7 @@ class ExpectedCostReport(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.expected.cost.report"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.expected.cost.report")
 
         results = super(ExpectedCostReport, self).create(vals_list)
         return results
@@ -272,18 +267,15 @@ class ExpectedCostReport(models.Model):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/hmsc.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("hmsc.xlsx")
+        worksheet = workbook.active
 
         ###
         row = 3
         index = 0
+        xlsx_template._insert_rows(worksheet, row, len(self.job_quote_ids))
         for job_quote in self.job_quote_ids:
-            worksheet.insert_rows(row)
             index += 1
             worksheet.cell(row=row, column=1, value=index)
             worksheet.cell(
@@ -309,62 +301,24 @@ class ExpectedCostReport(models.Model):
             worksheet.cell(row=row, column=14, value=job_quote.final_cost)
             row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
+        binary_data = xlsx_template._save_workbook(workbook)
 
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
-
-        # Create an attachment
         filename = f"Dự toán công việc.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def custom_export_material_to_xlsx(self):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = (
-            "/mnt/extra-addons/report_template/vt.xlsx"  # Replace with the actual path
-        )
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("vt.xlsx")
+        worksheet = workbook.active
 
         ###
         row = 3
         index = 0
+        xlsx_template._insert_rows(worksheet, row, len(self.material_quote_ids))
         for material_quote in self.material_quote_ids:
-            worksheet.insert_rows(row)
             index += 1
             worksheet.cell(row=row, column=1, value=index)
             worksheet.cell(
@@ -393,40 +347,7 @@ class ExpectedCostReport(models.Model):
             worksheet.cell(row=row, column=10, value=material_quote.note)
             row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Dự toán vật tư.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
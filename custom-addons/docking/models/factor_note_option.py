@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class FactorNoteOption(models.Model):
     _name = "docking.factor.note.option"
     _description = "Factor note option records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -36,9 +36,7 @@ class FactorNoteOption(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.factor.note.option"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.factor.note.option")
         return super(FactorNoteOption, self).create(vals_list)
 
     def name_get(self):
@@ -10,7 +10,7 @@ from odoo.exceptions import ValidationError
 class InspectionEvent(models.Model):
     _name = "docking.inspection.event"
     _description = "Inspection event records"
-    _inherit = ["ship.date", "utilities.notification"]
+    _inherit = ["ship.date", "utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char(
@@ -46,9 +46,7 @@ class InspectionEvent(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.inspection.event"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.inspection.event")
         result = super(InspectionEvent, self).create(vals_list)
 
         return result
@@ -97,12 +95,11 @@ class InspectionEvent(models.Model):
         subject = f"Thông báo xác nhận đăng kiểm cho {self.name}"
         message = f"{self.description}"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
@@ -117,5 +114,4 @@ class InspectionEvent(models.Model):
         classes = "title_docking_date_color"
         subject = "Thay đổi ngày đăng kiểm!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
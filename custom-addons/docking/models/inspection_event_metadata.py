@@ -8,7 +8,7 @@ from . import CONST
 class InspectionEventMetadata(models.Model):
     _name = "docking.inspection.event.metadata"
     _description = "Inspection event metadata records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -35,9 +35,7 @@ class InspectionEventMetadata(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.inspection.event.metadata"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.inspection.event.metadata")
         return super(InspectionEventMetadata, self).create(vals_list)
 
     def name_get(self):
@@ -8,7 +8,7 @@ from . import CONST
 class Job(models.Model):
     _name = "docking.job"
     _description = "Job records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -50,8 +50,7 @@ class Job(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.job")
+        self._fill_sequence_refs(vals_list, "docking.job")
         return super(Job, self).create(vals_list)
 
     def name_get(self):
@@ -1,5 +1,8 @@
+import numpy as np
+
 from odoo import api, fields, models, _
 from . import CONST
+from .cost_formula import evaluate_formula, FormulaError, VARIABLES
 from odoo.exceptions import ValidationError
 
 
@@ -24,38 +27,22 @@ class JobFinalCostFormula(models.Model):
     @api.model_create_multi
     def create(self, vals_list):
         for vals in vals_list:
-            formula = vals.get("formula")
-            # check if formula is valid by using dummy data
-            quantity = 1
-            weight = 1
-            length = 1
-            width = 1
-            height = 1
-            factor = 1
-            unit_price = 1
-            try:
-                eval(formula)
-            except ZeroDivisionError:
-                raise ValidationError(_("Cannot divide by zero"))
-            except NameError:
-                raise ValidationError(_("Final cost mathematic formula is not valid."))
+            self._check_formula(vals.get("formula"))
         return super(JobFinalCostFormula, self).create(vals_list)
 
     def write(self, vals):
         if "formula" in vals:
-            formula = vals.get("formula")
-            # check if formula is valid by using dummy data
-            quantity = 1
-            weight = 1
-            length = 1
-            width = 1
-            height = 1
-            factor = 1
-            unit_price = 1
-            try:
-                eval(formula)
-            except ZeroDivisionError:
-                raise ValidationError(_("Cannot divide by zero"))
-            except NameError:
-                raise ValidationError(_("Final cost mathematic formula is not valid."))
+            self._check_formula(vals.get("formula"))
         return super(JobFinalCostFormula, self).write(vals)
+
+    def _check_formula(self, formula):
+        # check if formula is valid by using dummy data
+        variables = dict.fromkeys(VARIABLES, 1.0)
+        try:
+            final_cost = evaluate_formula(formula or "", variables)
+        except ZeroDivisionError:
+            raise ValidationError(_("Cannot divide by zero"))
+        except (FormulaError, ArithmeticError, TypeError):
+            raise ValidationError(_("Final cost mathematic formula is not valid."))
+        if not np.isfinite(final_cost):
+            raise ValidationError(_("Cannot divide by zero"))
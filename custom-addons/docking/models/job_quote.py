@@ -3,6 +3,7 @@
 
 from odoo import api, fields, models, _
 from . import CONST
+from .cost_formula import evaluate_costs
 from ...ship_management.models import CONST as SHIP_CONST
 from odoo.exceptions import ValidationError
 
@@ -10,7 +11,7 @@ from odoo.exceptions import ValidationError
 class JobQuote(models.Model):
     _name = "docking.job.quote"
     _description = "Job quote records"
-    _inherit = ["ship.job.quote.template"]
+    _inherit = ["ship.job.quote.template", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     unit = fields.Char("Unit", tracking=True)
@@ -210,8 +211,7 @@ class JobQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.job.quote")
+        self._fill_sequence_refs(vals_list, "docking.job.quote")
 
         result = super(JobQuote, self).create(vals_list)
 
@@ -291,21 +291,22 @@ class JobQuote(models.Model):
         "expected_factor",
     )
     def _calculate_final_cost(self):
-        for record in self:
-            quantity = record.quantity or record.expected_quantity or 0
-            weight = record.weight or record.expected_weight or 0
-            length = record.length or record.expected_length or 0
-            width = record.width or record.expected_width or 0
-            height = record.height or record.expected_height or 0
-            factor = record.factor or record.expected_factor or 0
-            unit_price = record.unit_price or 0
-            if record.final_cost_mathematic_formula:
-                final_cost = eval(record.final_cost_mathematic_formula)
-                # if final cost is not integer or float, raise error
-                if isinstance(final_cost, (int, float)):
-                    record.final_cost = final_cost
-                else:
-                    record.final_cost = unit_price
+        values = {
+            "quantity": [r.quantity or r.expected_quantity or 0 for r in self],
+            "weight": [r.weight or r.expected_weight or 0 for r in self],
+            "length": [r.length or r.expected_length or 0 for r in self],
+            "width": [r.width or r.expected_width or 0 for r in self],
+            "height": [r.height or r.expected_height or 0 for r in self],
+            "factor": [r.factor or r.expected_factor or 0 for r in self],
+            "unit_price": [r.unit_price or 0 for r in self],
+        }
+        final_costs = evaluate_costs(
+            self.mapped("final_cost_mathematic_formula"),
+            values,
+            values["unit_price"],
+        )
+        for record, final_cost in zip(self, final_costs):
+            record.final_cost = final_cost
 
     @api.depends(
         "expected_quantity",
@@ -316,21 +317,22 @@ class JobQuote(models.Model):
         "expected_factor",
     )
     def _calculate_expected_final_cost(self):
-        for record in self:
-            quantity = record.expected_quantity or 0
-            weight = record.expected_weight or 0
-            length = record.expected_length or 0
-            width = record.expected_width or 0
-            height = record.expected_height or 0
-            factor = record.expected_factor or 0
-            unit_price = record.unit_price or 0
-            if record.final_cost_mathematic_formula:
-                final_cost = eval(record.final_cost_mathematic_formula)
-                # if final cost is not integer or float, raise error
-                if isinstance(final_cost, (int, float)):
-                    record.expected_final_cost = final_cost
-                else:
-                    record.expected_final_cost = unit_price
+        values = {
+            "quantity": [r.expected_quantity or 0 for r in self],
+            "weight": [r.expected_weight or 0 for r in self],
+            "length": [r.expected_length or 0 for r in self],
+            "width": [r.expected_width or 0 for r in self],
+            "height": [r.expected_height or 0 for r in self],
+            "factor": [r.expected_factor or 0 for r in self],
+            "unit_price": [r.unit_price or 0 for r in self],
+        }
+        expected_final_costs = evaluate_costs(
+            self.mapped("final_cost_mathematic_formula"),
+            values,
+            values["unit_price"],
+        )
+        for record, expected_final_cost in zip(self, expected_final_costs):
+            record.expected_final_cost = expected_final_cost
 
     def _arise_or_approved_survey(self):
         self.ensure_one()
@@ -3,12 +3,13 @@
 
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
+from .cost_formula import evaluate_costs
 
 
 class JobQuoteExpectedParameterSet(models.Model):
     _name = "docking.job.quote.expected.parameter.set"
     _description = "Job Quote expected parameter set records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     quantity = fields.Float("Quantity", tracking=True)
@@ -71,9 +72,7 @@ class JobQuoteExpectedParameterSet(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.job.quote.expected.parameter.set"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.job.quote.expected.parameter.set")
 
         result = super(JobQuoteExpectedParameterSet, self).create(vals_list)
 
@@ -122,19 +121,15 @@ class JobQuoteExpectedParameterSet(models.Model):
 
     @api.depends("quantity", "weight", "length", "width", "height", "factor", "unit")
     def _calculate_final_cost(self):
-        for record in self:
-            quantity = record.quantity or 0
-            weight = record.weight or 0
-            length = record.length or 0
-            width = record.width or 0
-            height = record.height or 0
-            factor = record.factor or 0
-            unit_price = record.unit_price or 0
-            if record.final_cost_mathematic_formula:
-                final_cost = eval(record.final_cost_mathematic_formula)
-                # if final cost is not integer or float, raise error
-                if isinstance(final_cost, (int, float)):
-                    record.final_cost = final_cost
-
-            else:
-                record.final_cost = unit_price
+        values = {
+            name: [record[name] or 0 for record in self]
+            for name in ("quantity", "weight", "length", "width", "height", "factor")
+        }
+        values["unit_price"] = [record.unit_price or 0 for record in self]
+        final_costs = evaluate_costs(
+            self.mapped("final_cost_mathematic_formula"),
+            values,
+            values["unit_price"],
+        )
+        for record, final_cost in zip(self, final_costs):
+            record.final_cost = final_cost
@@ -10,7 +10,7 @@ from ...ship_management.models import CONST as SHIP_CONST
 class JobQuoteRequest(models.Model):
     _name = "docking.job.quote.request"
     _description = "Job quote request records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     comment = fields.Char("Comment", tracking=True)
@@ -60,9 +60,7 @@ class JobQuoteRequest(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.job.quote.request"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.job.quote.request")
 
         result = super(JobQuoteRequest, self).create(vals_list)
         return result
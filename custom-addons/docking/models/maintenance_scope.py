@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class MaintenanceScope(models.Model):
     _name = "docking.maintenance.scope"
     _description = "Maintenance scope records"
-    _inherit = ["ship.maintenance.scope.template"]
+    _inherit = ["ship.maintenance.scope.template", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # relations
@@ -52,10 +52,7 @@ class MaintenanceScope(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "docking.maintenance.scope"
-            )
+        self._fill_sequence_refs(vals_list, "docking.maintenance.scope")
         result = super(MaintenanceScope, self).create(vals_list)
         return result
 
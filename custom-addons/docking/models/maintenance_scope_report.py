@@ -10,7 +10,11 @@ from odoo.exceptions import ValidationError
 class MaintenanceScopeReport(models.Model):
     _name = "docking.maintenance.scope.report"
     _description = "Maintenance scope report records"
-    _inherit = ["ship.maintenance.scope.report.template", "utilities.approval.status"]
+    _inherit = [
+        "ship.maintenance.scope.report.template",
+        "utilities.approval.status",
+        "utilities.sequence.mixin",
+    ]
     _check_company_auto = True
 
     result_evaluate = fields.Char("Result Evaluation", tracking=True)
@@ -93,10 +97,7 @@ class MaintenanceScopeReport(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "docking.maintenance.scope.report"
-            )
+        self._fill_sequence_refs(vals_list, "docking.maintenance.scope.report")
         result = super(MaintenanceScopeReport, self).create(vals_list)
 
         for record in result:
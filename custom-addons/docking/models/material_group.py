@@ -8,7 +8,7 @@ from . import CONST
 class MaterialGroup(models.Model):
     _name = "docking.material.group"
     _description = "Material group records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -35,8 +35,7 @@ class MaterialGroup(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.material.group")
+        self._fill_sequence_refs(vals_list, "docking.material.group")
         return super(MaterialGroup, self).create(vals_list)
 
     def name_get(self):
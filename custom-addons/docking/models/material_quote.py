@@ -10,7 +10,7 @@ from ...supplier_portal.help_func import generate_qr_code_base64
 class MaterialQuote(models.Model):
     _name = "docking.material.quote"
     _description = "Material quote records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     note = fields.Char("Note", tracking=True)
@@ -124,8 +124,7 @@ class MaterialQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.material.quote")
+        self._fill_sequence_refs(vals_list, "docking.material.quote")
 
         results = super(MaterialQuote, self).create(vals_list)
         return results
@@ -10,7 +10,7 @@ from ...ship_management.models import CONST as SHIP_CONST
 class MaterialQuoteRequest(models.Model):
     _name = "docking.material.quote.request"
     _description = "Material quote request records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     comment = fields.Char("Comment", tracking=True)
@@ -47,9 +47,7 @@ class MaterialQuoteRequest(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.material.quote.request"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.material.quote.request")
 
         results = super(MaterialQuoteRequest, self).create(vals_list)
         return results
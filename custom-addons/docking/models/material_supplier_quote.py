@@ -8,7 +8,7 @@ from . import CONST
 class MaterialSupplierQuote(models.Model):
     _name = "docking.material.supplier.quote"
     _description = "Material supplier quote records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     unit_price = fields.Integer("Unit price", tracking=True)
@@ -45,10 +45,7 @@ class MaterialSupplierQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "docking.material.supplier.quote"
-            )
+        self._fill_sequence_refs(vals_list, "docking.material.supplier.quote")
         return super(MaterialSupplierQuote, self).create(vals_list)
 
     def write(self, vals):
@@ -90,5 +87,38 @@ class MaterialSupplierQuote(models.Model):
         return self.search(conditions)
 
     def action_send_emails_to_all_unsent_supplier_quotes(self):
-        for record in self.get_all_unsent_supplier_quotes():
-            record.send_mail_to_supplier()
+        self.get_all_unsent_supplier_quotes()._send_mails_to_suppliers()
+
+    def _send_mails_to_suppliers(self):
+        """
+        Send one mail per supplier listing the docking plans of its quotes,
+        and mark the quotes of the mailed suppliers as sent.
+        """
+        rfq_mail = self.env["ship.rfq.mail"]
+        template = self.env.ref("docking.material_quote_for_supplier_template")
+        base_url = rfq_mail._get_base_url()
+
+        values_by_supplier = {}
+        for record in self:
+            supplier = record.supplier_id
+            values = values_by_supplier.setdefault(
+                supplier,
+                {
+                    "email_to": supplier.email,
+                    "supplier_name": supplier.name,
+                    "docking_plans": [],
+                },
+            )
+            docking_plan_id = (
+                record.material_quote_id.material_survey_data_id.docking_plan_id
+            )
+            docking_plan_values = supplier._get_docking_plan_quote_values(
+                docking_plan_id.ref, base_url
+            )
+            if docking_plan_values not in values["docking_plans"]:
+                values["docking_plans"].append(docking_plan_values)
+
+        sent_suppliers = rfq_mail._send_batch(template, values_by_supplier)
+        # write is restricted to one record
+        for record in self.filtered(lambda r: r.supplier_id in sent_suppliers):
+            record.is_email_sent = True
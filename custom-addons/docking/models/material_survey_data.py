@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class MaterialSurveyData(models.Model):
     _name = "docking.material.survey.data"
     _description = "Material survey data records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     quantity = fields.Float("Quantity", tracking=True)
@@ -56,9 +56,7 @@ class MaterialSurveyData(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "docking.material.survey.data"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "docking.material.survey.data")
 
         result = super(MaterialSurveyData, self).create(vals_list)
         for record in result:
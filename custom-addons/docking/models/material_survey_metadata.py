@@ -8,7 +8,7 @@ from . import CONST
 class MaterialSurveyMetadata(models.Model):
     _name = "docking.material.survey.metadata"
     _description = "Material survey metadata records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -47,10 +47,7 @@ class MaterialSurveyMetadata(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "docking.material.survey.metadata"
-            )
+        self._fill_sequence_refs(vals_list, "docking.material.survey.metadata")
         return super(MaterialSurveyMetadata, self).create(vals_list)
 
     def name_get(self):
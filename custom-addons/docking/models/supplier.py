@@ -11,7 +11,7 @@ from odoo.exceptions import ValidationError
 class Supplier(models.Model):
     _name = "docking.supplier"
     _description = "Supplier records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
 
     name = fields.Char("Name", required=True, tracking=True)
     email = fields.Char("Email", required=True, tracking=True)
@@ -41,12 +41,11 @@ class Supplier(models.Model):
     )
 
     # sequential
-    ref = fields.Char(string="Code", default=lambda self: _("New"))
+    ref = fields.Char(string="Code", default=lambda self: _("New"), index=True)
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("docking.supplier")
+        self._fill_sequence_refs(vals_list, "docking.supplier")
         return super(Supplier, self).create(vals_list)
 
     def name_get(self):
@@ -59,14 +58,12 @@ class Supplier(models.Model):
     def send_material_quote_for_supplier_email(self, quote_ref):
         self.ensure_one()
         try:
-            path = f"docking/docking-plan/{quote_ref}"
             template = self.env.ref("docking.material_quote_for_supplier_template").id
-            portal_access_url = self._get_portal_access_url(path)
             email_values = self._get_email_values()
 
             context = {
                 "supplier_name": self.name,
-                "portal_access_url": portal_access_url,
+                "docking_plans": [self._get_docking_plan_quote_values(quote_ref)],
             }
 
             self._send_email(self.id, template, context, email_values)
@@ -155,8 +152,16 @@ class Supplier(models.Model):
             "email_to": self.email,
         }
 
-    def _get_portal_access_url(self, path):
-        base_url = self.env["ir.config_parameter"].sudo().get_param("web.base.url")
+    def _get_docking_plan_quote_values(self, quote_ref, base_url=None):
+        path = f"docking/docking-plan/{quote_ref}"
+        return {
+            "quote_ref": quote_ref,
+            "portal_access_url": self._get_portal_access_url(path, base_url),
+        }
+
+    def _get_portal_access_url(self, path, base_url=None):
+        if not base_url:
+            base_url = self.env["ship.rfq.mail"]._get_base_url()
         params = f"supplier_ref={self.ref}&access_token={self.access_token}"
         portal_access_url = f"{base_url}/{path}?{params}"
 
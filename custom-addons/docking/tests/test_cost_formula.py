@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo.tests.common import BaseCase
+
+from ..models.cost_formula import FormulaError, evaluate_costs, evaluate_formula
+
+
+class TestCostFormula(BaseCase):
+    def test_round_digits(self):
+        cost = evaluate_formula(
+            "round(quantity*unit_price, 2)", {"quantity": 1.234, "unit_price": 1.0}
+        )
+        self.assertEqual(cost, 1.23)
+
+    def test_round_digits_must_be_a_number(self):
+        self.assertEqual(
+            evaluate_formula("round(quantity, -1)", {"quantity": 16.0}), 20.0
+        )
+        with self.assertRaises(FormulaError):
+            evaluate_formula("round(quantity*unit_price, weight)", {})
+
+    def test_min_max_of_many_values(self):
+        variables = {"quantity": 1.0, "weight": 5.0}
+        self.assertEqual(evaluate_formula("max(quantity, weight, 3)", variables), 5.0)
+        self.assertEqual(evaluate_formula("min(quantity, weight, 3)", variables), 1.0)
+
+    def test_costs_by_row(self):
+        costs = evaluate_costs(
+            ["round(quantity*unit_price, 1)", "max(quantity, weight, factor)", ""],
+            {
+                "quantity": [1.26, 1.0, 1.0],
+                "unit_price": [1.0, 1.0, 1.0],
+                "weight": [0.0, 9.0, 0.0],
+                "factor": [3.0, 3.0, 3.0],
+            },
+            [0.0, 0.0, 7.0],
+        )
+        self.assertEqual(costs, [1.3, 9.0, 7.0])
+
+    def test_forbidden_expression(self):
+        with self.assertRaises(FormulaError):
+            evaluate_formula("__import__('os')", {})
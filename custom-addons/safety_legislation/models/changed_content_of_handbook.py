@@ -13,7 +13,7 @@ import logging
 class ChangedContentOfHandbook(models.Model):
     _name = "legis.changed.content.of.handbook"
     _description = "Changed Content Of Handbook records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     control_number = fields.Char(string="control number", tracking=True)
@@ -80,9 +80,7 @@ class ChangedContentOfHandbook(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.changed.content.of.handbook"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.changed.content.of.handbook")
         result = super(ChangedContentOfHandbook, self).create(vals_list)
 
         return result
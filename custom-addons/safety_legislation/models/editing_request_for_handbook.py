@@ -10,7 +10,7 @@ import logging
 class EditingRequestForHandbook(models.Model):
     _name = "legis.editing.request.for.handbook"
     _description = "Editing request for handbook records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     request_date = fields.Date(string="Request date", tracking=True)
@@ -43,9 +43,7 @@ class EditingRequestForHandbook(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.editing.request.for.handbook"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.editing.request.for.handbook")
         result = super(EditingRequestForHandbook, self).create(vals_list)
 
         return result
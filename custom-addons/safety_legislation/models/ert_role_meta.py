@@ -8,7 +8,7 @@ from . import CONST
 class ErtRoleModel(models.Model):
     _name = "legis.ert.role.meta"
     _description = "Ert role meta records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # relations
@@ -40,9 +40,7 @@ class ErtRoleModel(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.ert.role.meta"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.ert.role.meta")
         result = super(ErtRoleModel, self).create(vals_list)
 
         return result
@@ -8,7 +8,7 @@ from . import CONST
 class ErtTask(models.Model):
     _name = "legis.ert.task"
     _description = "Ert task records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # relations
@@ -35,9 +35,7 @@ class ErtTask(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.ert.task"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.ert.task")
         result = super(ErtTask, self).create(vals_list)
 
         return result
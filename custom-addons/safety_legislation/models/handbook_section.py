@@ -11,7 +11,7 @@ from bs4 import BeautifulSoup
 class HandbookSection(models.Model):
     _name = "legis.handbook.section"
     _description = "Handbook section records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     control_number = fields.Char("Control number", tracking=True)
@@ -67,9 +67,7 @@ class HandbookSection(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.handbook.section"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.handbook.section")
         result = super(HandbookSection, self).create(vals_list)
 
         for record in result:
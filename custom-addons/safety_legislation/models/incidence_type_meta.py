@@ -8,7 +8,7 @@ from . import CONST
 class Incidence_type_meta(models.Model):
     _name = "legis.incidence.type.meta"
     _description = "Incidence type meta records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -31,9 +31,7 @@ class Incidence_type_meta(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.incidence.type.meta"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.incidence.type.meta")
         result = super(Incidence_type_meta, self).create(vals_list)
 
         return result
@@ -9,7 +9,7 @@ from ...utilities.models import CONST as UTILITIES_CONST
 class SafetyManagementHandbook(models.Model):
     _name = "legis.safety.management.handbook"
     _description = "Safety management handbook records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     revision_no = fields.Integer("Revision no", tracking=True)
@@ -33,9 +33,8 @@ class SafetyManagementHandbook(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
+        self._fill_sequence_refs(vals_list, "legis.safety.management.handbook")
         for vals in vals_list:
-            model_name = "legis.safety.management.handbook"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
             if not vals.get("revision_no"):
                 vals["revision_no"] = self._increase_revision()
         result = super(SafetyManagementHandbook, self).create(vals_list)
@@ -62,7 +61,7 @@ class SafetyManagementHandbook(models.Model):
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
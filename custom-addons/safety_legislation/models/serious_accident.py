@@ -8,7 +8,7 @@ from . import CONST
 class SeriousAccident(models.Model):
     _name = "legis.serious.accident"
     _description = "Serious accident records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     accident_report_html = fields.Html("Accident report html", tracking=True)
@@ -36,9 +36,7 @@ class SeriousAccident(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.serious.accident"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.serious.accident")
         result = super(SeriousAccident, self).create(vals_list)
 
         return result
@@ -8,7 +8,7 @@ from . import CONST
 class SeriousAccidentTask(models.Model):
     _name = "legis.serious.accident.task"
     _description = "Serious accident task records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char(string="Name", tracking=True)
@@ -27,9 +27,7 @@ class SeriousAccidentTask(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.serious.accident.task"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.serious.accident.task")
         result = super(SeriousAccidentTask, self).create(vals_list)
 
         return result
@@ -11,7 +11,7 @@ import logging
 class TechnicalIncident(models.Model):
     _name = "legis.technical.incident"
     _description = "Technical incident records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     finished_at = fields.Date("Finished at", tracking=True)
@@ -185,9 +185,7 @@ class TechnicalIncident(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.technical.incident"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.technical.incident")
         result = super(TechnicalIncident, self).create(vals_list)
 
         for record in result:
@@ -8,7 +8,7 @@ from . import CONST
 class TechnicalIncidentInsurance(models.Model):
     _name = "legis.technical.incident.insurance"
     _description = "Technical incident insurance records"
-    _inherit = ["utilities.required.all.approval"]
+    _inherit = ["utilities.required.all.approval", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     total_price = fields.Float(
@@ -39,9 +39,7 @@ class TechnicalIncidentInsurance(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.technical.incident.insurance"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.technical.incident.insurance")
         result = super(TechnicalIncidentInsurance, self).create(vals_list)
 
         for record in result:
@@ -10,7 +10,7 @@ from odoo.exceptions import ValidationError
 class TechnicalIncidentJob(models.Model):
     _name = "legis.technical.incident.job"
     _description = "Technical incident job records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -43,9 +43,7 @@ class TechnicalIncidentJob(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "legis.technical.incident.job"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "legis.technical.incident.job")
         result = super(TechnicalIncidentJob, self).create(vals_list)
 
         for record in result:
@@ -29,6 +29,8 @@
         "data/material_paint_quotes_request_cron.xml",
         "data/expired_material_entity_replacement_proposal_cron.xml",
         "data/inspection_plan_cron.xml",
+        "data/export_artifact_cron.xml",
+        "data/image_variants.xml",
         "views/menu.xml",
         "views/supplier.xml",
         "views/material.xml",
@@ -89,6 +91,7 @@
         "views/inspection_image.xml",
         "wizard/create_utilization_time_wiz.xml",
         "wizard/export_report.xml",
+        "wizard/sounding_book_import_wiz.xml",
         "reports/report.xml",
         "reports/medicine.xml",
         "reports/ship_e_bunkering_safety_checklist_pdf.xml",
@@ -530,3 +530,25 @@ CHECK_TYPE = [
 ]
 
 EMPTY = "EMPTY.EMPTY"
+
+# sounding tables
+SOUNDING_PRECISION_DIGITS = 3
+SOUNDING_MEMO_SIZE = 4096
+SOUNDING_TRIMS = (0, 1, 2, 3)
+SOUNDING_IMPORT_MAX_ERRORS = 20
+
+# xlsx exports
+REPORT_TEMPLATE_DIR = "/mnt/extra-addons/report_template"
+EXPORT_ARTIFACT_TTL_HOURS = 24
+EXPORT_ATTACHMENT_FIELDS = ["custom_export", "custom_export_diary_to_xlsx"]
+# rewritten with the save time by openpyxl, left out of the export checksums
+EXPORT_VOLATILE_MEMBERS = ["docProps/core.xml"]
+
+# pending work queues
+PENDING_UNINFORMED_QUOTES_REQUEST = "uninformed_quotes_request"
+
+# uploaded photos
+IMAGE_MAX_SIZE = 1920
+IMAGE_JPEG_QUALITY = 85
+# images read at once when the images stored before the variants are processed
+IMAGE_INIT_BATCH_SIZE = 20
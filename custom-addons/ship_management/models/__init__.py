@@ -1,4 +1,9 @@
 from .utility import date
+from .utility import xlsx_template
+from .utility import export_artifact
+from .utility import rfq_mail
+from .utility import pending_work
+from .utility import image_mixin
 from . import material
 from . import material_entity
 from . import material_usage_type
@@ -37,6 +42,7 @@ from . import replacement_diary
 from . import proposed_liquidation
 from . import liquidation_minute
 from . import expired_material_entity_replacement_proposal
+from . import sounding_engine
 from . import fuel_internal_calculator
 from . import fuel_internal_recevied
 from . import fuel_external_calculator
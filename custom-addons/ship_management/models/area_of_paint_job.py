@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class AreaOfPaintJob(models.Model):
     _name = "ship.area.of.paint.job"
     _description = "Area of paint job records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     paint_area_m2 = fields.Float("Paint Area")
@@ -55,8 +55,8 @@ class AreaOfPaintJob(models.Model):
     @api.model_create_multi
     def create(self, vals_list):
         new_paint_history_event_list = []
+        self._fill_sequence_refs(vals_list, "ship.area.of.paint.job")
         for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.area.of.paint.job")
             # get job paint requirement
             job_paint_requirement = self.env["ship.job.paint.requirement"].browse(
                 vals["job_paint_requirement_id"]
@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class Classify(models.Model):
     _name = "ship.classify"
     _description = "Classify records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
 
     name = fields.Char("Name", tracking=True)
     description = fields.Char("Description", tracking=True)
@@ -29,8 +29,7 @@ class Classify(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.classify")
+        self._fill_sequence_refs(vals_list, "ship.classify")
         return super(Classify, self).create(vals_list)
 
     def name_get(self):
@@ -8,7 +8,7 @@ from . import CONST
 class Equipment(models.Model):
     _name = "ship.equipment"
     _description = "Equipment records"
-    _inherit = ["ship.date", "utilities.notification"]
+    _inherit = ["ship.date", "utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -58,8 +58,7 @@ class Equipment(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.equipment")
+        self._fill_sequence_refs(vals_list, "ship.equipment")
         return super(Equipment, self).create(vals_list)
 
     def name_get(self):
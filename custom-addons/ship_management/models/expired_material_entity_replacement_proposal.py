@@ -12,7 +12,7 @@ from . import CONST
 class ExpiredMaterialEntityReplacementProposal(models.Model):
     _name = "ship.expired.material.entity.replacement.proposal"
     _description = "Expired material entity replacement proposal records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # company
@@ -42,9 +42,9 @@ class ExpiredMaterialEntityReplacementProposal(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.expired.material.entity.replacement.proposal"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(
+            vals_list, "ship.expired.material.entity.replacement.proposal"
+        )
         result = super(ExpiredMaterialEntityReplacementProposal, self).create(vals_list)
 
         for record in result:
@@ -48,8 +48,7 @@ class ShipFuelConsumptionReportBatch(models.Model):
             [("res_field", "=", "custom_export")]
         )
         # Delete them
-        for attachment in temporary_attachments:
-            attachment.unlink()
+        temporary_attachments.unlink()
 
     def generate_report(self):
         self.ensure_one()
@@ -185,14 +184,9 @@ class ShipFuelConsumptionReportBatch(models.Model):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = (
-            "/mnt/extra-addons/report_template/bcd.xlsx"  # Replace with the actual path
-        )
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("bcd.xlsx")
+        worksheet = workbook.active
 
         # week_number = self.date_start.isocalendar()[1]
 
@@ -624,55 +618,22 @@ class ShipFuelConsumptionReportBatch(models.Model):
             worksheet.cell(row=row, column=9, value=result[8])
             worksheet.cell(row=row, column=10, value=result[9])
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            for row in temp_worksheet.iter_rows():
-                for cell in row:
-                    if cell.value == False:
-                        # Get column index (1-based)
-                        column_index = cell.column
-
-                        # Check if column index is not between 18 and 26
-                        if not (18 <= column_index <= 26) and not (
-                            2 <= column_index <= 11
-                        ):
-                            cell.value = None
+        for row in worksheet.iter_rows():
+            for cell in row:
+                if cell.value == False:
+                    # Get column index (1-based)
+                    column_index = cell.column
 
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
+                    # Check if column index is not between 18 and 26
+                    if not (18 <= column_index <= 26) and not (
+                        2 <= column_index <= 11
+                    ):
+                        cell.value = None
 
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Báo cáo từ__{self.date_start}_{self.date_end}.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
 
 class ShipFuelConsumptionReport(models.Model):
@@ -773,7 +734,7 @@ class ShipFuelConsumption(models.Model):
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
@@ -27,7 +27,7 @@ _logger = logging.getLogger(__name__)
 class FuelExternalDiary(models.Model):
     _name = "ship.fuel.external.diary"
     _description = "Ship Fuel External Diary"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     ##Phần mềm ghi nhận lịch tàu
@@ -83,10 +83,7 @@ class FuelExternalDiary(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.fuel.external.diary"
-            )
+        self._fill_sequence_refs(vals_list, "ship.fuel.external.diary")
         return super(FuelExternalDiary, self).create(vals_list)
 
     def name_get(self):
@@ -189,7 +186,7 @@ class FuelExternalDiary(models.Model):
 class FuelExternalCalculator(models.Model):
     _name = "ship.fuel.external.calculator"
     _description = "Request for fuel external calculator"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     order_date = fields.Datetime("Order date", tracking=True)
@@ -450,9 +447,7 @@ class FuelExternalCalculator(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.fuel.external.calculator"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.fuel.external.calculator")
 
         return super(FuelExternalCalculator, self).create(vals_list)
 
@@ -27,7 +27,7 @@ _logger = logging.getLogger(__name__)
 class FuelInternalCalculator(models.Model):
     _name = "ship.fuel.internal.calculator"
     _description = "Request for fuel internal calculator"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     order_date = fields.Datetime("Order date", tracking=True)
@@ -277,9 +277,7 @@ class FuelInternalCalculator(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.fuel.internal.calculator"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.fuel.internal.calculator")
 
         return super(FuelInternalCalculator, self).create(vals_list)
 
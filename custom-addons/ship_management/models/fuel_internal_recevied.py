@@ -22,7 +22,7 @@ from openpyxl.styles import Alignment
 class FuelInternalReceiving(models.Model):
     _name = "ship.fuel.internal.receiving"
     _description = "Fuel Internal Receiving"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
 
     arrival_datetime = fields.Datetime(string="Datetime", default=fields.Datetime.now)
     bunkering_safety_checklist_html = fields.Html(
@@ -117,7 +117,7 @@ class FuelInternalReceiving(models.Model):
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
@@ -523,9 +523,7 @@ class FuelInternalReceiving(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.fuel.internal.receiving"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.fuel.internal.receiving")
         result = super(FuelInternalReceiving, self).create(vals_list)
 
         for record in result:
@@ -931,7 +929,7 @@ class FuelTankMeasurement(models.Model):
     measure_type = fields.Selection(
         [("sound", "Sound"), ("ullage", "Ullage")],
         string="Measure Type",
-        compute="_compute_measure_type",
+        compute="_compute_values_before_bunkering",
     )
     FUEL_TYPE_SELECTION = [("hfo", "HFO"), ("do", "DO")]
     fuel_type = fields.Selection(FUEL_TYPE_SELECTION, string="Fuel Type")
@@ -948,10 +946,14 @@ class FuelTankMeasurement(models.Model):
     )
     ##remain on board
     measure_adjustment = fields.Float(
-        string="Measure/Adjust (m)", compute="_compute_measurement", digits=(10, 3)
+        string="Measure/Adjust (m)",
+        compute="_compute_values_before_bunkering",
+        digits=(10, 3),
     )
     volume_m3 = fields.Float(
-        string="Volume - m3", compute="_compute_volume", digits=(10, 3)
+        string="Volume - m3",
+        compute="_compute_values_before_bunkering",
+        digits=(10, 3),
     )
     ###Receiving
     receiving_volume = fields.Float(string="Receiving Volume (m3)", digits=(10, 3))
@@ -965,22 +967,22 @@ class FuelTankMeasurement(models.Model):
 
     tank_measurement_at_0 = fields.Float(
         string="Tank Measurement (m) when trim is 0.0m",
-        compute="_compute_tank_measurement_trim_0",
+        compute="_compute_tank_measurements",
         digits=(10, 3),
     )
     tank_measurement_at_1 = fields.Float(
         string="Tank Measurement (m) when trim is 1.0 m",
-        compute="_compute_tank_measurement_trim_1",
+        compute="_compute_tank_measurements",
         digits=(10, 3),
     )
     tank_measurement_at_2 = fields.Float(
         string="Tank Measurement (m) when trim is 2.0 m",
-        compute="_compute_tank_measurement_trim_2",
+        compute="_compute_tank_measurements",
         digits=(10, 3),
     )
     tank_measurement_at_3 = fields.Float(
         string="Tank Measurement (m) when trim is 3.0 m",
-        compute="_compute_tank_measurement_trim_3",
+        compute="_compute_tank_measurements",
         digits=(10, 3),
     )
     percentage_fill = fields.Float(
@@ -1012,707 +1014,60 @@ class FuelTankMeasurement(models.Model):
         for record in self:
             record.tank_measurement_at_85 = record.tank_measurement_at_100 * 0.85
 
-    @api.depends("after_bunkering_estimate")
-    def _compute_tank_measurement_trim_0(self):
-        for record in self:
-
-            # Calculate tank measurement at trim 0
-            # Initialize total_volume
-            trim = 0
-            final_sound = 0
-            final_ullage = 0
-            volume = record.after_bunkering_estimate
-            nearest_volume_record_above = False
-            nearest_volume_record_below = False
-
-            # Define search criteria based on tank name and measurement type (sound or ullage)
-            search_criteria = [("tank_name", "=", record.tank_name)]
-
-            # Search for sounding records based on trim
-            search_criteria_trim = search_criteria + [("table_type", "=", "trim")]
-            sounding_trim_books = self.env["ship.sounding.book"].search(
-                search_criteria_trim
+    @api.depends("after_bunkering_estimate", "measure_type", "tank_name", "company_id")
+    def _compute_tank_measurements(self):
+        measurements = self.env["ship.sounding.engine"].measurements_for(
+            self, self.mapped("after_bunkering_estimate"), CONST.SOUNDING_TRIMS
+        )
+        for record, row in zip(self, measurements):
+            record.update(
+                {
+                    f"tank_measurement_at_{trim}": measurement
+                    for trim, measurement in zip(CONST.SOUNDING_TRIMS, row)
+                }
             )
-            for sounding_book in sounding_trim_books:
-                # Search for sounding records based on provided trim and volume
-                sounding_table_records = self.env["ship.sounding.table"].search(
-                    [
-                        ("sounding_book_id", "=", sounding_book.id),
-                        ("volume", "=", volume),
-                        ("table_value", "=", trim),
-                    ]
-                )
-                # If exact match found, retrieve volume
-                if sounding_table_records:
-                    record.tank_measurement_at_0 = sum(
-                        sounding_table_records.mapped(record.measure_type)
-                    )
 
-                else:
-                    # Find the two nearest trim values
-                    nearest_volume_records = self.env["ship.sounding.table"].search(
-                        [
-                            ("sounding_book_id", "=", sounding_book.id),
-                            ("table_value", "=", trim),
-                        ]
-                    )
-                    if nearest_volume_records:
-                        nearest_volume_records_sorted = nearest_volume_records.sorted(
-                            key=lambda r: abs(r.volume - volume)
-                        )
-                        for measure_record in nearest_volume_records_sorted:
-                            if measure_record.volume < volume:
-                                nearest_volume_record_below = measure_record
-                            elif measure_record.volume > volume:
-                                nearest_volume_record_above = measure_record
-                            if (
-                                nearest_volume_record_above
-                                and nearest_volume_record_below
-                            ):
-                                above_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                below_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                above_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                below_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                if (
-                                    nearest_volume_record_above.volume
-                                    != nearest_volume_record_below.volume
-                                ):
-                                    final_ullage = below_measure_ullage + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (
-                                        above_measure_ullage - below_measure_ullage
-                                    ) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-                                    final_sound = below_measure_sound + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (above_measure_sound - below_measure_sound) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-
-            if record.measure_type == "sound":
-                record.tank_measurement_at_0 = final_sound
-            elif record.measure_type == "ullage":
-                record.tank_measurement_at_0 = final_ullage
-            else:
-                record.tank_measurement_at_0 = 0
-
-    @api.depends("after_bunkering_estimate")
-    def _compute_tank_measurement_trim_1(self):
-        for record in self:
-
-            # Calculate tank measurement at trim 0
-            # Initialize total_volume
-            trim = 1
-            final_sound = 0
-            final_ullage = 0
-            volume = record.after_bunkering_estimate
-            nearest_volume_record_above = False
-            nearest_volume_record_below = False
-            # Define search criteria based on tank name and measurement type (sound or ullage)
-            search_criteria = [("tank_name", "=", record.tank_name)]
-
-            # Search for sounding records based on trim
-            search_criteria_trim = search_criteria + [("table_type", "=", "trim")]
-            sounding_trim_books = self.env["ship.sounding.book"].search(
-                search_criteria_trim
-            )
-            for sounding_book in sounding_trim_books:
-                # Search for sounding records based on provided trim and volume
-                sounding_table_records = self.env["ship.sounding.table"].search(
-                    [
-                        ("sounding_book_id", "=", sounding_book.id),
-                        ("volume", "=", volume),
-                        ("table_value", "=", trim),
-                    ]
-                )
-                # If exact match found, retrieve volume
-                if sounding_table_records:
-                    record.tank_measurement_at_1 = sum(
-                        sounding_table_records.mapped(record.measure_type)
-                    )
+    @api.depends("tank_name", "fuel_internal_receiving_id")
+    def _compute_values_before_bunkering(self):
+        # read the "before" tank of every receiving in two queries instead of
+        # two queries per line and per field
+        receivings = self.fuel_internal_receiving_id._origin
+        fuel_condition_ids = self.env["ship.fuel.oil.tank.condition"].search(
+            [
+                ("condition", "=", "before"),
+                ("fuel_internal_receiving_id", "in", receivings.ids),
+            ]
+        )
+        condition_by_receiving = {}
+        for fuel_condition_id in fuel_condition_ids:
+            receiving_id = fuel_condition_id.fuel_internal_receiving_id.id
+            condition_by_receiving.setdefault(receiving_id, fuel_condition_id)
 
-                else:
-                    # Find the two nearest trim values
-                    nearest_volume_records = self.env["ship.sounding.table"].search(
-                        [
-                            ("sounding_book_id", "=", sounding_book.id),
-                            ("table_value", "=", trim),
-                        ]
-                    )
-                    if nearest_volume_records:
-                        nearest_volume_records_sorted = nearest_volume_records.sorted(
-                            key=lambda r: abs(r.volume - volume)
-                        )
-                        for measure_record in nearest_volume_records_sorted:
-                            if measure_record.volume < volume:
-                                nearest_volume_record_below = measure_record
-                            elif measure_record.volume > volume:
-                                nearest_volume_record_above = measure_record
-                            # Once both above and below records are found, exit the loop
-                            if (
-                                nearest_volume_record_above
-                                and nearest_volume_record_below
-                            ):
-                                above_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                below_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                above_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                below_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                if (
-                                    nearest_volume_record_above.volume
-                                    != nearest_volume_record_below.volume
-                                ):
-                                    final_ullage = below_measure_ullage + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (
-                                        above_measure_ullage - below_measure_ullage
-                                    ) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-                                    final_sound = below_measure_sound + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (above_measure_sound - below_measure_sound) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-
-                                break
-            if record.measure_type == "sound":
-                record.tank_measurement_at_1 = final_sound
-            elif record.measure_type == "ullage":
-                record.tank_measurement_at_1 = final_ullage
-            else:
-                record.tank_measurement_at_1 = 0
+        fuel_tanks = self.env["ship.fuel.tank"].search(
+            [
+                ("fuel_oil_tank_condition_id", "in", fuel_condition_ids.ids),
+                ("tank_name", "in", self.mapped("tank_name")),
+            ]
+        )
+        tank_by_condition_and_name = {}
+        for fuel_tank in fuel_tanks:
+            key = (fuel_tank.fuel_oil_tank_condition_id.id, fuel_tank.tank_name)
+            tank_by_condition_and_name.setdefault(key, fuel_tank)
 
-    @api.depends("after_bunkering_estimate")
-    def _compute_tank_measurement_trim_2(self):
         for record in self:
-
-            # Calculate tank measurement at trim 0
-            # Initialize total_volume
-            trim = 2
-            final_sound = 0
-            final_ullage = 0
-            volume = record.after_bunkering_estimate
-            nearest_volume_record_above = False
-            nearest_volume_record_below = False
-            # Define search criteria based on tank name and measurement type (sound or ullage)
-            search_criteria = [("tank_name", "=", record.tank_name)]
-
-            # Search for sounding records based on trim
-            search_criteria_trim = search_criteria + [("table_type", "=", "trim")]
-            sounding_trim_books = self.env["ship.sounding.book"].search(
-                search_criteria_trim
+            fuel_condition_id = condition_by_receiving.get(
+                record.fuel_internal_receiving_id._origin.id
             )
-            for sounding_book in sounding_trim_books:
-                # Search for sounding records based on provided trim and volume
-                sounding_table_records = self.env["ship.sounding.table"].search(
-                    [
-                        ("sounding_book_id", "=", sounding_book.id),
-                        ("volume", "=", volume),
-                        ("table_value", "=", trim),
-                    ]
-                )
-                # If exact match found, retrieve volume
-                if sounding_table_records:
-                    record.tank_measurement_at_2 = sum(
-                        sounding_table_records.mapped(record.measure_type)
-                    )
-
-                else:
-                    # Find the two nearest trim values
-                    nearest_volume_records = self.env["ship.sounding.table"].search(
-                        [
-                            ("sounding_book_id", "=", sounding_book.id),
-                            ("table_value", "=", trim),
-                        ]
-                    )
-                    if nearest_volume_records:
-                        nearest_volume_records_sorted = nearest_volume_records.sorted(
-                            key=lambda r: abs(r.volume - volume)
-                        )
-                        for measure_record in nearest_volume_records_sorted:
-                            if measure_record.volume < volume:
-                                nearest_volume_record_below = measure_record
-                            elif measure_record.volume > volume:
-                                nearest_volume_record_above = measure_record
-                            # Once both above and below records are found, exit the loop
-                            if (
-                                nearest_volume_record_above
-                                and nearest_volume_record_below
-                            ):
-                                above_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                below_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                above_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                below_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                if (
-                                    nearest_volume_record_above.volume
-                                    != nearest_volume_record_below.volume
-                                ):
-                                    final_ullage = below_measure_ullage + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (
-                                        above_measure_ullage - below_measure_ullage
-                                    ) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-                                    final_sound = below_measure_sound + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (above_measure_sound - below_measure_sound) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-                                break
-            if record.measure_type == "sound":
-                record.tank_measurement_at_2 = final_sound
-            elif record.measure_type == "ullage":
-                record.tank_measurement_at_2 = final_ullage
-            else:
-                record.tank_measurement_at_2 = 0
-
-    @api.depends("after_bunkering_estimate")
-    def _compute_tank_measurement_trim_3(self):
-        for record in self:
-
-            # Calculate tank measurement at trim 0
-            # Initialize total_volume
-            trim = 3
-            final_sound = 0
-            final_ullage = 0
-            volume = record.after_bunkering_estimate
-            nearest_volume_record_above = False
-            nearest_volume_record_below = False
-            # Define search criteria based on tank name and measurement type (sound or ullage)
-            search_criteria = [("tank_name", "=", record.tank_name)]
-
-            # Search for sounding records based on trim
-            search_criteria_trim = search_criteria + [("table_type", "=", "trim")]
-            sounding_trim_books = self.env["ship.sounding.book"].search(
-                search_criteria_trim
+            fuel_tank = fuel_condition_id and tank_by_condition_and_name.get(
+                (fuel_condition_id.id, record.tank_name)
             )
-            for sounding_book in sounding_trim_books:
-                # Search for sounding records based on provided trim and volume
-                sounding_table_records = self.env["ship.sounding.table"].search(
-                    [
-                        ("sounding_book_id", "=", sounding_book.id),
-                        ("volume", "=", volume),
-                        ("table_value", "=", trim),
-                    ]
-                )
-                # If exact match found, retrieve volume
-                if sounding_table_records:
-                    record.tank_measurement_at_3 = sum(
-                        sounding_table_records.mapped(record.measure_type)
-                    )
-
-                else:
-                    # Find the two nearest trim values
-                    nearest_volume_records = self.env["ship.sounding.table"].search(
-                        [
-                            ("sounding_book_id", "=", sounding_book.id),
-                            ("table_value", "=", trim),
-                        ]
-                    )
-                    if nearest_volume_records:
-                        nearest_volume_records_sorted = nearest_volume_records.sorted(
-                            key=lambda r: abs(r.volume - volume)
-                        )
-                        for measure_record in nearest_volume_records_sorted:
-                            if measure_record.volume < volume:
-                                nearest_volume_record_below = measure_record
-                            elif measure_record.volume > volume:
-                                nearest_volume_record_above = measure_record
-                            # Once both above and below records are found, exit the loop
-                            if (
-                                nearest_volume_record_above
-                                and nearest_volume_record_below
-                            ):
-                                above_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                below_measure_ullage = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("ullage")
-                                )
-                                above_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_above.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                below_measure_sound = min(
-                                    self.env["ship.sounding.table"]
-                                    .search(
-                                        [
-                                            ("sounding_book_id", "=", sounding_book.id),
-                                            (
-                                                "volume",
-                                                "=",
-                                                nearest_volume_record_below.volume,
-                                            ),
-                                            ("table_value", "=", trim),
-                                        ]
-                                    )
-                                    .mapped("sound")
-                                )
-                                if (
-                                    nearest_volume_record_above.volume
-                                    != nearest_volume_record_below.volume
-                                ):
-                                    final_ullage = below_measure_ullage + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (
-                                        above_measure_ullage - below_measure_ullage
-                                    ) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-                                    final_sound = below_measure_sound + (
-                                        volume - nearest_volume_record_below.volume
-                                    ) * (above_measure_sound - below_measure_sound) / (
-                                        nearest_volume_record_above.volume
-                                        - nearest_volume_record_below.volume
-                                    )
-                                break
-
-            if record.measure_type == "sound":
-                record.tank_measurement_at_3 = final_sound
-            elif record.measure_type == "ullage":
-                record.tank_measurement_at_3 = final_ullage
-            else:
-                record.tank_measurement_at_3 = 0
-
-    @api.depends("tank_name", "fuel_internal_receiving_id")
-    def _compute_measure_type(self):
-        for record in self:
-            if record.tank_name:
-                fuel_internal_receiving_id = record.fuel_internal_receiving_id
-                if fuel_internal_receiving_id:
-                    fuel_condition_ids = self.env[
-                        "ship.fuel.oil.tank.condition"
-                    ].search(
-                        [
-                            ("condition", "=", "before"),
-                            (
-                                "fuel_internal_receiving_id",
-                                "=",
-                                fuel_internal_receiving_id.id,
-                            ),
-                        ],
-                        limit=1,
-                    )
-                    if fuel_condition_ids:
-                        for fuel_condition_id in fuel_condition_ids:
-                            fuel_tank = self.env["ship.fuel.tank"].search(
-                                [
-                                    ("tank_name", "=", record.tank_name),
-                                    (
-                                        "fuel_oil_tank_condition_id",
-                                        "=",
-                                        fuel_condition_id.id,
-                                    ),
-                                ],
-                                limit=1,
-                            )
-                            if fuel_tank:
-                                record.measure_type = fuel_tank.measure_type
-                            else:
-                                record.measure_type = "sound"
-                    else:
-                        record.measure_type = "sound"
-                else:
-                    record.measure_type = "sound"
+            if record.tank_name and fuel_tank:
+                record.measure_type = fuel_tank.measure_type
+                record.measure_adjustment = fuel_tank.measurement
+                record.volume_m3 = fuel_tank.volumetric_capacity
             else:
                 record.measure_type = "sound"
-
-    @api.depends("tank_name", "fuel_internal_receiving_id")
-    def _compute_measurement(self):
-        for record in self:
-            if record.tank_name:
-                fuel_internal_receiving_id = record.fuel_internal_receiving_id
-                if fuel_internal_receiving_id:
-                    fuel_condition_ids = self.env[
-                        "ship.fuel.oil.tank.condition"
-                    ].search(
-                        [
-                            ("condition", "=", "before"),
-                            (
-                                "fuel_internal_receiving_id",
-                                "=",
-                                fuel_internal_receiving_id.id,
-                            ),
-                        ],
-                        limit=1,
-                    )
-                    if fuel_condition_ids:
-                        for fuel_condition_id in fuel_condition_ids:
-                            fuel_tank = self.env["ship.fuel.tank"].search(
-                                [
-                                    ("tank_name", "=", record.tank_name),
-                                    (
-                                        "fuel_oil_tank_condition_id",
-                                        "=",
-                                        fuel_condition_id.id,
-                                    ),
-                                ],
-                                limit=1,
-                            )
-                            if fuel_tank:
-                                record.measure_adjustment = fuel_tank.measurement
-                            else:
-                                record.measure_adjustment = 0
-                    else:
-                        record.measure_adjustment = 0
-                else:
-                    record.measure_adjustment = 0
-            else:
                 record.measure_adjustment = 0
-
-    @api.depends("tank_name", "fuel_internal_receiving_id")
-    def _compute_volume(self):
-        for record in self:
-            if record.tank_name:
-                fuel_internal_receiving_id = record.fuel_internal_receiving_id
-                if fuel_internal_receiving_id:
-                    fuel_condition_ids = self.env[
-                        "ship.fuel.oil.tank.condition"
-                    ].search(
-                        [
-                            ("condition", "=", "before"),
-                            (
-                                "fuel_internal_receiving_id",
-                                "=",
-                                fuel_internal_receiving_id.id,
-                            ),
-                        ],
-                        limit=1,
-                    )
-                    if fuel_condition_ids:
-                        for fuel_condition_id in fuel_condition_ids:
-                            fuel_tank = self.env["ship.fuel.tank"].search(
-                                [
-                                    ("tank_name", "=", record.tank_name),
-                                    (
-                                        "fuel_oil_tank_condition_id",
-                                        "=",
-                                        fuel_condition_id.id,
-                                    ),
-                                ],
-                                limit=1,
-                            )
-                            if fuel_tank:
-                                record.volume_m3 = fuel_tank.volumetric_capacity
-                            else:
-                                record.volume_m3 = 0
-                    else:
-                        record.volume_m3 = 0
-                else:
-                    record.volume_m3 = 0
-            else:
                 record.volume_m3 = 0
 
     @api.depends("receiving_volume", "volume_m3")
@@ -1786,721 +1141,29 @@ class FuelTank(models.Model):
         "res.company", required=True, default=lambda self: self.env.company
     )
 
-    @api.depends("measurement", "fuel_oil_tank_condition_id")
+    @api.depends(
+        "measurement",
+        "measure_type",
+        "tank_name",
+        "company_id",
+        "fuel_oil_tank_condition_id.trim",
+        "fuel_oil_tank_condition_id.heel",
+    )
     def _compute_calculated_volume(self):
-        for record in self:
-            if record.measurement >= 0 and record.fuel_oil_tank_condition_id:
-                # Calculate volume based on sounding table values
-                fuel_oil_tank_condition = record.fuel_oil_tank_condition_id
-
-                # Extract the trim and heel values
-                trim = fuel_oil_tank_condition.trim
-                heel = fuel_oil_tank_condition.heel
-
-                # Initialize volume
-                total_volume = 0.0
-                final_trim_volume = 0
-                final_heel_volume = 0
-                # Define search criteria based on fuel type
-                search_criteria = [("tank_name", "=", record.tank_name)]
-
-                # Search for sounding records based on trim
-                if record.measure_type == "ullage":
-                    search_criteria_trim = search_criteria + [
-                        ("table_type", "=", "trim")
-                    ]
-                    sounding_trim_books = self.env["ship.sounding.book"].search(
-                        search_criteria_trim
-                    )
-                    for sounding_book in sounding_trim_books:
-                        sounding_table_records = self.env["ship.sounding.table"].search(
-                            [
-                                ("sounding_book_id", "=", sounding_book.id),
-                                ("ullage", "=", record.measurement),
-                                ("table_value", "=", trim),
-                            ]
-                        )
-                        final_trim_volume = sum(sounding_table_records.mapped("volume"))
-
-                        if not sounding_table_records:
-                            # If no records found for provided measurement, find the two nearest trim values
-                            nearest_measure_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_measure_records = sorted(
-                                nearest_measure_records,
-                                key=lambda r: abs(r.ullage - record.measurement),
-                            )
-                            if nearest_measure_records:
-                                exact_measure_record = next(
-                                    (
-                                        r
-                                        for r in nearest_measure_records
-                                        if abs(r.ullage - record.measurement) == 0
-                                    ),
-                                    False,
-                                )
-                                if exact_measure_record:
-                                    nearest_below_measure = exact_measure_record[
-                                        0
-                                    ].ullage
-                                    nearest_above_measure = exact_measure_record[
-                                        0
-                                    ].ullage
-                                else:
-                                    nearest_below_measure = None
-                                    nearest_above_measure = None
-                                    for r in nearest_measure_records:
-                                        if r.ullage < record.measurement:
-                                            nearest_below_measure = r.ullage
-                                        elif r.ullage > record.measurement:
-                                            nearest_above_measure = r.ullage
-                                        if (
-                                            nearest_below_measure
-                                            and nearest_above_measure
-                                        ):
-                                            break
-
-                            nearest_trim_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_trim_records = sorted(
-                                nearest_trim_records,
-                                key=lambda r: abs(r.table_value - trim),
-                            )
-
-                            if nearest_trim_records:
-                                exact_trim_record = self.env[
-                                    "ship.sounding.table"
-                                ].browse(
-                                    [
-                                        r.id
-                                        for r in nearest_trim_records
-                                        if abs(r.table_value - trim) == 0
-                                    ]
-                                )
-                                if exact_trim_record:
-                                    nearest_below_trim = exact_trim_record[
-                                        0
-                                    ].table_value
-                                    nearest_above_trim = exact_trim_record[
-                                        0
-                                    ].table_value
-                                else:
-                                    nearest_below_trim = None
-                                    nearest_above_trim = None
-                                    for r in nearest_trim_records:
-                                        if r.table_value < trim:
-                                            nearest_below_trim = r.table_value
-                                        elif r.table_value > trim:
-                                            nearest_above_trim = r.table_value
-                                        if nearest_below_trim and nearest_above_trim:
-                                            break
-
-                            ## find 4 point
-
-                            low_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_below_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_below_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            low_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_above_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_above_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            try:
-                                if nearest_above_measure != nearest_below_measure:
-                                    trim_low_volume = low_low_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_low_volume - low_low_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-                                    trim_high_volume = low_high_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_high_volume - low_high_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-
-                                else:
-                                    trim_low_volume = (
-                                        low_low_volume + high_low_volume
-                                    ) / 2
-                                    trim_high_volume = (
-                                        low_high_volume + high_high_volume
-                                    ) / 2
-
-                                if nearest_above_trim != nearest_below_trim:
-                                    final_trim_volume = trim_low_volume + (
-                                        trim - nearest_below_trim
-                                    ) * (trim_high_volume - trim_low_volume) / (
-                                        nearest_above_trim - nearest_below_trim
-                                    )
-                                else:
-                                    final_trim_volume = (
-                                        trim_low_volume + trim_high_volume
-                                    ) / 2
-                            except:
-                                final_trim_volume = 0
-
-                    # Search for sounding records based on heel
-                    search_criteria_heel = search_criteria + [
-                        ("table_type", "=", "heel")
-                    ]
-                    sounding_heel_books = self.env["ship.sounding.book"].search(
-                        search_criteria_heel
-                    )
-                    for sounding_book in sounding_heel_books:
-                        sounding_table_records = self.env["ship.sounding.table"].search(
-                            [
-                                ("sounding_book_id", "=", sounding_book.id),
-                                ("ullage", "=", record.measurement),
-                                ("table_value", "=", heel),
-                            ]
-                        )
-                        final_heel_volume = sum(sounding_table_records.mapped("volume"))
-                        if not sounding_table_records:
-                            # If no records found for provided measurement, find the two nearest heel values
-                            nearest_measure_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_measure_records = sorted(
-                                nearest_measure_records,
-                                key=lambda r: abs(r.ullage - record.measurement),
-                            )
-
-                            if nearest_measure_records:
-                                exact_measure_record = next(
-                                    (
-                                        r
-                                        for r in nearest_measure_records
-                                        if abs(r.ullage - record.measurement) == 0
-                                    ),
-                                    False,
-                                )
-                                if exact_measure_record:
-                                    nearest_below_measure = exact_measure_record[
-                                        0
-                                    ].ullage
-                                    nearest_above_measure = exact_measure_record[
-                                        0
-                                    ].ullage
-                                else:
-                                    nearest_below_measure = None
-                                    nearest_above_measure = None
-                                    for r in nearest_measure_records:
-                                        if r.ullage < record.measurement:
-                                            nearest_below_measure = r.ullage
-                                        elif r.ullage > record.measurement:
-                                            nearest_above_measure = r.ullage
-                                        if (
-                                            nearest_above_measure
-                                            and nearest_below_measure
-                                        ):
-                                            break
-
-                            nearest_heel_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_heel_records = sorted(
-                                nearest_heel_records,
-                                key=lambda r: abs(r.table_value - heel),
-                            )
-
-                            if nearest_heel_records:
-                                exact_heel_record = self.env[
-                                    "ship.sounding.table"
-                                ].browse(
-                                    [
-                                        r.id
-                                        for r in nearest_heel_records
-                                        if abs(r.table_value - heel) == 0
-                                    ]
-                                )
-                                if exact_heel_record:
-                                    nearest_below_heel = exact_heel_record[
-                                        0
-                                    ].table_value
-                                    nearest_above_heel = exact_heel_record[
-                                        0
-                                    ].table_value
-                                else:
-                                    nearest_below_heel = None
-                                    nearest_above_heel = None
-                                    for r in nearest_heel_records:
-                                        if r.table_value < heel:
-                                            nearest_below_heel = r.table_value
-                                        elif r.table_value > heel:
-                                            nearest_above_heel = r.table_value
-                                        if nearest_below_heel and nearest_above_heel:
-                                            break
-
-                            ## find 4 point
-
-                            low_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_below_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_below_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            low_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_above_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("ullage", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_above_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            try:
-                                if nearest_above_measure != nearest_below_measure:
-                                    heel_low_volume = low_low_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_low_volume - low_low_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-                                    heel_high_volume = low_high_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_high_volume - low_high_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-                                else:
-                                    heel_low_volume = (
-                                        low_low_volume + high_low_volume
-                                    ) / 2
-                                    heel_high_volume = (
-                                        low_high_volume + high_high_volume
-                                    ) / 2
-
-                                if nearest_above_heel != nearest_below_heel:
-                                    final_heel_volume = heel_low_volume + (
-                                        heel - nearest_below_heel
-                                    ) * (heel_high_volume - heel_low_volume) / (
-                                        nearest_above_heel - nearest_below_heel
-                                    )
-                                else:
-                                    final_heel_volume = (
-                                        heel_low_volume + heel_high_volume
-                                    ) / 2
-                            except:
-                                final_heel_volume = 0
-
-                    total_volume = final_heel_volume + final_trim_volume
-
-                else:
-                    search_criteria_trim = search_criteria + [
-                        ("table_type", "=", "trim")
-                    ]
-                    sounding_trim_books = self.env["ship.sounding.book"].search(
-                        search_criteria_trim
-                    )
-                    for sounding_book in sounding_trim_books:
-                        sounding_table_records = self.env["ship.sounding.table"].search(
-                            [
-                                ("sounding_book_id", "=", sounding_book.id),
-                                ("sound", "=", record.measurement),
-                                ("table_value", "=", trim),
-                            ]
-                        )
-                        final_trim_volume = sum(sounding_table_records.mapped("volume"))
-
-                        if not sounding_table_records:
-                            # If no records found for provided measurement, find the two nearest trim values
-                            nearest_measure_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_measure_records = sorted(
-                                nearest_measure_records,
-                                key=lambda r: abs(r.sound - record.measurement),
-                            )
-                            if nearest_measure_records:
-                                exact_measure_record = next(
-                                    (
-                                        r
-                                        for r in nearest_measure_records
-                                        if abs(r.sound - record.measurement) == 0
-                                    ),
-                                    False,
-                                )
-                                if exact_measure_record:
-                                    nearest_below_measure = exact_measure_record[
-                                        0
-                                    ].sound
-                                    nearest_above_measure = exact_measure_record[
-                                        0
-                                    ].sound
-                                else:
-                                    nearest_below_measure = None
-                                    nearest_above_measure = None
-                                    for r in nearest_measure_records:
-                                        if r.sound < record.measurement:
-                                            nearest_below_measure = r.sound
-                                        elif r.sound > record.measurement:
-                                            nearest_above_measure = r.sound
-                                        if (
-                                            nearest_below_measure
-                                            and nearest_above_measure
-                                        ):
-                                            break
-
-                            nearest_trim_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_trim_records = sorted(
-                                nearest_trim_records,
-                                key=lambda r: abs(r.table_value - trim),
-                            )
-
-                            if nearest_trim_records:
-                                exact_trim_record = self.env[
-                                    "ship.sounding.table"
-                                ].browse(
-                                    [
-                                        r.id
-                                        for r in nearest_trim_records
-                                        if abs(r.table_value - trim) == 0
-                                    ]
-                                )
-                                if exact_trim_record:
-                                    nearest_below_trim = exact_trim_record[
-                                        0
-                                    ].table_value
-                                    nearest_above_trim = exact_trim_record[
-                                        0
-                                    ].table_value
-                                else:
-                                    nearest_below_trim = None
-                                    nearest_above_trim = None
-                                    for r in nearest_trim_records:
-                                        if r.table_value < trim:
-                                            nearest_below_trim = r.table_value
-                                        elif r.table_value > trim:
-                                            nearest_above_trim = r.table_value
-                                        if nearest_below_trim and nearest_above_trim:
-                                            break
-
-                            ## find 4 point
-
-                            low_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_below_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_below_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            low_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_above_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_above_trim),
-                                    ]
-                                )
-                                .volume
-                            )
-                            try:
-                                if nearest_above_measure != nearest_below_measure:
-                                    trim_low_volume = low_low_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_low_volume - low_low_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-                                    trim_high_volume = low_high_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_high_volume - low_high_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-
-                                else:
-                                    trim_low_volume = (
-                                        low_low_volume + high_low_volume
-                                    ) / 2
-                                    trim_high_volume = (
-                                        low_high_volume + high_high_volume
-                                    ) / 2
-
-                                if nearest_above_trim != nearest_below_trim:
-                                    final_trim_volume = trim_low_volume + (
-                                        trim - nearest_below_trim
-                                    ) * (trim_high_volume - trim_low_volume) / (
-                                        nearest_above_trim - nearest_below_trim
-                                    )
-                                else:
-                                    final_trim_volume = (
-                                        trim_low_volume + trim_high_volume
-                                    ) / 2
-                            except:
-                                final_trim_volume = 0
-
-                    # Search for sounding records based on heel
-                    search_criteria_heel = search_criteria + [
-                        ("table_type", "=", "heel")
-                    ]
-                    sounding_heel_books = self.env["ship.sounding.book"].search(
-                        search_criteria_heel
-                    )
-                    for sounding_book in sounding_heel_books:
-                        sounding_table_records = self.env["ship.sounding.table"].search(
-                            [
-                                ("sounding_book_id", "=", sounding_book.id),
-                                ("sound", "=", record.measurement),
-                                ("table_value", "=", heel),
-                            ]
-                        )
-                        final_heel_volume = sum(sounding_table_records.mapped("volume"))
-                        if not sounding_table_records:
-                            # If no records found for provided measurement, find the two nearest heel values
-                            nearest_measure_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_measure_records = sorted(
-                                nearest_measure_records,
-                                key=lambda r: abs(r.sound - record.measurement),
-                            )
-
-                            if nearest_measure_records:
-                                exact_measure_record = next(
-                                    (
-                                        r
-                                        for r in nearest_measure_records
-                                        if abs(r.sound - record.measurement) == 0
-                                    ),
-                                    False,
-                                )
-                                if exact_measure_record:
-                                    nearest_below_measure = exact_measure_record[
-                                        0
-                                    ].sound
-                                    nearest_above_measure = exact_measure_record[
-                                        0
-                                    ].sound
-                                else:
-                                    nearest_below_measure = None
-                                    nearest_above_measure = None
-                                    for r in nearest_measure_records:
-                                        if r.sound < record.measurement:
-                                            nearest_below_measure = r.sound
-                                        elif r.sound > record.measurement:
-                                            nearest_above_measure = r.sound
-                                        if (
-                                            nearest_above_measure
-                                            and nearest_below_measure
-                                        ):
-                                            break
-
-                            nearest_heel_records = self.env[
-                                "ship.sounding.table"
-                            ].search([("sounding_book_id", "=", sounding_book.id)])
-                            nearest_heel_records = sorted(
-                                nearest_heel_records,
-                                key=lambda r: abs(r.table_value - heel),
-                            )
-
-                            if nearest_heel_records:
-                                exact_heel_record = self.env[
-                                    "ship.sounding.table"
-                                ].browse(
-                                    [
-                                        r.id
-                                        for r in nearest_heel_records
-                                        if abs(r.table_value - heel) == 0
-                                    ]
-                                )
-                                if exact_heel_record:
-                                    nearest_below_heel = exact_heel_record[
-                                        0
-                                    ].table_value
-                                    nearest_above_heel = exact_heel_record[
-                                        0
-                                    ].table_value
-                                else:
-                                    nearest_below_heel = None
-                                    nearest_above_heel = None
-                                    for r in nearest_heel_records:
-                                        if r.table_value < heel:
-                                            nearest_below_heel = r.table_value
-                                        elif r.table_value > heel:
-                                            nearest_above_heel = r.table_value
-                                        if nearest_below_heel and nearest_above_heel:
-                                            break
-
-                            ## find 4 point
-
-                            low_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_below_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_low_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_below_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            low_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_below_measure),
-                                        ("table_value", "=", nearest_above_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            high_high_volume = (
-                                self.env["ship.sounding.table"]
-                                .search(
-                                    [
-                                        ("sounding_book_id", "=", sounding_book.id),
-                                        ("sound", "=", nearest_above_measure),
-                                        ("table_value", "=", nearest_above_heel),
-                                    ]
-                                )
-                                .volume
-                            )
-                            try:
-                                if nearest_above_measure != nearest_below_measure:
-                                    heel_low_volume = low_low_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_low_volume - low_low_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-                                    heel_high_volume = low_high_volume + (
-                                        record.measurement - nearest_below_measure
-                                    ) * (high_high_volume - low_high_volume) / (
-                                        nearest_above_measure - nearest_below_measure
-                                    )
-                                else:
-                                    heel_low_volume = (
-                                        low_low_volume + high_low_volume
-                                    ) / 2
-                                    heel_high_volume = (
-                                        low_high_volume + high_high_volume
-                                    ) / 2
-
-                                if nearest_above_heel != nearest_below_heel:
-                                    print(nearest_below_heel)
-                                    print(nearest_above_heel)
-                                    final_heel_volume = heel_low_volume + (
-                                        heel - nearest_below_heel
-                                    ) * (heel_high_volume - heel_low_volume) / (
-                                        nearest_above_heel - nearest_below_heel
-                                    )
-                                else:
-                                    final_heel_volume = (
-                                        heel_low_volume + heel_high_volume
-                                    ) / 2
-                            except:
-                                final_heel_volume = 0
-
-                    total_volume = final_heel_volume + final_trim_volume
-
-                record.volumetric_capacity = total_volume
-
-            else:
-                record.volumetric_capacity = 0.0
+        tanks = self.filtered(
+            lambda record: record.measurement >= 0 and record.fuel_oil_tank_condition_id
+        )
+        fuel_oil_tank_conditions = [tank.fuel_oil_tank_condition_id for tank in tanks]
+        volumes = self.env["ship.sounding.engine"].volumes_for(
+            tanks,
+            tanks.mapped("measurement"),
+            [condition.trim for condition in fuel_oil_tank_conditions],
+            [condition.heel for condition in fuel_oil_tank_conditions],
+        )
+        for tank, volume in zip(tanks, volumes):
+            tank.volumetric_capacity = volume
+        for record in self - tanks:
+            record.volumetric_capacity = 0.0
 
     @api.depends("temperature", "volumetric_capacity")
     def _compute_volumetric_at_150c(self):
@@ -2575,6 +1238,19 @@ class SoundingBook(models.Model):
         "res.company", required=True, default=lambda self: self.env.company
     )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.env["ship.sounding.engine"].clear_caches()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env["ship.sounding.engine"].clear_caches()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["ship.sounding.engine"].clear_caches()
+        return super().unlink()
+
 
 class SoundingTable(models.Model):
     _name = "ship.sounding.table"
@@ -2590,6 +1266,19 @@ class SoundingTable(models.Model):
     volume = fields.Float("Volume (m3)")
     sounding_book_id = fields.Many2one("ship.sounding.book", string="Sounding Book")
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.env["ship.sounding.engine"].clear_caches()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env["ship.sounding.engine"].clear_caches()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["ship.sounding.engine"].clear_caches()
+        return super().unlink()
+
 
 class FuelOilSampleRecord(models.Model):
     _name = "ship.fuel.internal.oil.sample.record"
@@ -11,6 +11,7 @@ from odoo.exceptions import ValidationError
 class FuelQuote(models.Model):
     _name = "ship.fuel.quote"
     _description = "Fuel Quote"
+    _inherit = ["utilities.sequence.mixin"]
     FUEL_TYPES = [
         ('fo', 'FO'),
         ('do', 'DO'),]
@@ -61,10 +62,7 @@ class FuelQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.fuel.quote"
-            )
+        self._fill_sequence_refs(vals_list, "ship.fuel.quote")
         result = super(FuelQuote, self).create(vals_list)
         return result
     def name_get(self):
@@ -90,6 +88,7 @@ class FuelQuote(models.Model):
 class FuelQuoteGrease(models.Model):
     _name = "ship.fuel.quote.grease"
     _description = "Fuel Quote Grease"
+    _inherit = ["utilities.sequence.mixin"]
 
     FUEL_TYPES = [
         ('texmarine_700_sae_50', 'Texmarine 700 SAE 50'),
@@ -161,10 +160,7 @@ class FuelQuoteGrease(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.fuel.quote.grease"
-            )
+        self._fill_sequence_refs(vals_list, "ship.fuel.quote.grease")
         result = super(FuelQuoteGrease, self).create(vals_list)
         return result
     def name_get(self):
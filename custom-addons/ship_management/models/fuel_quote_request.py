@@ -27,7 +27,7 @@ _logger = logging.getLogger(__name__)
 class FuelQuotesRequest(models.Model):
     _name = "ship.fuel.quotes.request"
     _description = "Request for fuel quotes records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     order_date = fields.Date("Order date", tracking=True)
@@ -74,9 +74,7 @@ class FuelQuotesRequest(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.fuel.quotes.request"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.fuel.quotes.request")
         result = super(FuelQuotesRequest, self).create(vals_list)
 
         for record in result:
@@ -151,91 +149,63 @@ class FuelQuotesRequest(models.Model):
         return self.search(conditions)
 
     def action_send_emails_to_all_unsent_supplier_quotes(self):
-        for record in self.get_all_unsent_supplier_quotes():
-            record.action_send_email()
+        self.get_all_unsent_supplier_quotes().action_send_email()
 
     def action_send_email(self):
         """For sending email to suppliers for each fuel quote."""
-        self.ensure_one()
-        ##
-        for fuel_quote in self.fuel_quote_ids:
-            for fuel_supplier_quote_id in fuel_quote.fuel_supplier_quote_ids:
-                fuel_supplier_quote_id.is_email_sent = True
+        self.fuel_quote_ids.fuel_supplier_quote_ids.write({"is_email_sent": True})
 
-        fuel_quotes = (
-            self.env["ship.fuel.quote"]
-            .sudo()
-            .search([("fuel_quote_request_id", "=", self.id)])
+        records = self.filtered(
+            lambda record: record.is_at_this_approval_level(CONST.SUPPLIER)
         )
+        if not records:
+            return
+
+        rfq_mail = self.env["ship.rfq.mail"]
+        template = self.env.ref("ship_management.email_template_fuel_quote_request")
+        base_url = rfq_mail._get_base_url()
+        values_by_record = {
+            record: record._get_rfq_mail_values(base_url) for record in records
+        }
+        # write is restricted to one record
+        for record in rfq_mail._send_batch(template, values_by_record):
+            record.is_email_sent = True
 
-        try:
-            template = self.env.ref(
-                "ship_management.email_template_fuel_quote_request"
-            ).id
-            base_url = self.env["ir.config_parameter"].sudo().get_param("web.base.url")
-
-            reply_quote_url = (
-                "{base_url}/vendor_rfuq/{ref}?access_token={token}".format(
-                    base_url=base_url,
-                    ref=self.ref,
-                    token=self.access_token,
-                )
-            )
-            fuel_quotes = []
-            for fuel_quote in self.fuel_quote_ids:
-                fuel_quotes.append(
-                    {
-                        "name": fuel_quote.name,
-                        "quantity": fuel_quote.quantity,  # Assuming quantity is stored in the related table
-                        "unit": fuel_quote.unit,  # Assuming unit is stored in the related table
-                    }
-                )
-
-            for fuel_quote_grease in self.fuel_quote_grease_ids:
-                fuel_quotes.append(
-                    {
-                        "name": fuel_quote_grease.name,
-                        "quantity": fuel_quote_grease.quantity,  # Assuming quantity is stored in the related table
-                        "unit": fuel_quote_grease.unit,  # Assuming unit is stored in the related table
-                    }
-                )
-
-            context = {
-                "supplier_name": self.port_id.supplier_id.name,
-                "reply_quote_url": reply_quote_url,
-                "fuel_quotes": fuel_quotes,
-            }
-            email_values = {
-                "email_to": self.port_id.supplier_id.email,
+    def _get_rfq_mail_values(self, base_url):
+        self.ensure_one()
+        reply_quote_url = (
+            f"{base_url}/vendor_rfuq/{self.ref}?access_token={self.access_token}"
+        )
+        fuel_quotes = [
+            {
+                "name": fuel_quote.name,
+                "quantity": fuel_quote.quantity,
+                "unit": fuel_quote.unit,
             }
-            if self.is_at_this_approval_level(CONST.SUPPLIER):
-                self.is_email_sent = True
-                self.env["mail.template"].browse(template).with_context(
-                    context
-                ).send_mail(self.id, email_values=email_values, force_send=False)
-
-        except Exception as e:
-            self.is_email_sent = False
-            logging.error(f"Error sending email for fuel quote request {self.id}: {e}")
+            for fuel_quote in (*self.fuel_quote_ids, *self.fuel_quote_grease_ids)
+        ]
+        return {
+            "email_to": self.port_id.supplier_id.email,
+            "supplier_name": self.port_id.supplier_id.name,
+            "reply_quote_url": reply_quote_url,
+            "fuel_quotes": fuel_quotes,
+        }
 
     def custom_export_to_xlsx(self):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/ycnl.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("ycnl.xlsx")
+        worksheet = workbook.active
 
         worksheet.cell(row=7, column=5, value=self.order_date.strftime("%d/%m/%Y"))
 
         ###
         row = 12
         index = 0
+        xlsx_template._insert_rows(worksheet, row, len(self.fuel_quote_ids))
         for fuel_quote in self.fuel_quote_ids:
-            worksheet.insert_rows(row)
             index += 1
             worksheet.cell(row=row, column=1, value=index)
             worksheet.cell(row=row, column=2, value=fuel_quote.full_name)
@@ -267,40 +237,7 @@ class FuelQuotesRequest(models.Model):
         worksheet[f"C{row+7}"].alignment = align_center
         worksheet[f"C{row+8}"].alignment = align_center
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Yêu cầu nhiên liệu ngày {self.order_date}.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
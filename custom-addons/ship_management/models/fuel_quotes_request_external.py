@@ -27,7 +27,7 @@ _logger = logging.getLogger(__name__)
 class FuelQuotesRequestExternal(models.Model):
     _name = "ship.fuel.quotes.request.external"
     _description = "Request for external fuel quotes records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     order_date = fields.Date("Order date", tracking=True)
@@ -67,9 +67,7 @@ class FuelQuotesRequestExternal(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.fuel.quotes.request.external"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.fuel.quotes.request.external")
         result = super(FuelQuotesRequestExternal, self).create(vals_list)
         for record in result:
             external_fo = record.external_bunker_request_mt_fo
@@ -118,6 +116,7 @@ class FuelQuotesRequestExternal(models.Model):
 class FuelQuoteExternal(models.Model):
     _name = "ship.fuel.quote.external"
     _description = "Fuel Quote External"
+    _inherit = ["utilities.sequence.mixin"]
     FUEL_TYPES = [
         ("fo", "FO"),
         ("do", "DO"),
@@ -166,10 +165,7 @@ class FuelQuoteExternal(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.fuel.quote.external"
-            )
+        self._fill_sequence_refs(vals_list, "ship.fuel.quote.external")
         result = super(FuelQuoteExternal, self).create(vals_list)
         return result
 
@@ -10,7 +10,7 @@ import logging
 class FuelSupplierQuote(models.Model):
     _name = "ship.fuel.supplier.quote"
     _description = "Fuel supplier quote records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     unit_price = fields.Float("Unit price", tracking=True)
@@ -47,10 +47,7 @@ class FuelSupplierQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.fuel.supplier.quote"
-            )
+        self._fill_sequence_refs(vals_list, "ship.fuel.supplier.quote")
         result = super(FuelSupplierQuote, self).create(vals_list)
 
 
@@ -85,7 +82,7 @@ class FuelSupplierQuote(models.Model):
 class GreaseSupplierQuote(models.Model):
     _name = "ship.fuel.supplier.quote.grease"
     _description = "Grease supplier quote records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     unit_price = fields.Float("Unit price", tracking=True)
@@ -122,10 +119,7 @@ class GreaseSupplierQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.fuel.supplier.quote.grease"
-            )
+        self._fill_sequence_refs(vals_list, "ship.fuel.supplier.quote.grease")
         result = super(GreaseSupplierQuote, self).create(vals_list)
         return result
 
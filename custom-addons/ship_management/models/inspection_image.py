@@ -8,10 +8,13 @@ from . import CONST
 class InspectionImage(models.Model):
     _name = "ship.inspection.image"
     _description = "Inspection image records"
-    _inherit = ["utilities.notification"]
+    _inherit = [
+        "utilities.notification",
+        "utilities.sequence.mixin",
+        "ship.image.mixin",
+    ]
     _check_company_auto = True
 
-    image = fields.Image("Image", tracking=True)
     description = fields.Char("Description", tracking=True)
 
     # relations
@@ -36,9 +39,7 @@ class InspectionImage(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.inspection.image"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.inspection.image")
         return super(InspectionImage, self).create(vals_list)
 
     def name_get(self):
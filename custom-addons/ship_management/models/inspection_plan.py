@@ -11,7 +11,7 @@ from odoo.exceptions import ValidationError
 class InspectionPlan(models.Model):
     _name = "ship.inspection.plan"
     _description = "Inspection plan records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
     _edit_field_permissions_list = {
         "ship_management_inspection_scope_ids": [],
@@ -68,10 +68,8 @@ class InspectionPlan(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
+        self._fill_sequence_refs(vals_list, "ship.inspection.plan")
         for vals in vals_list:
-            model_name = "ship.inspection.plan"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
-
             real_or_expected_date = vals.get("real_or_expected_date")
             expected_date = vals.get("expected_date")
 
@@ -209,8 +207,7 @@ class InspectionPlan(models.Model):
         subject = "Cần chuẩn bị cho đợt kiểm tra tàu hàng tháng!!"
         message = f"Ngày dự kiến rơi vào {self.expected_date}!!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _send_noti_for_people_need_to_fill_in_real_date(self):
         self.ensure_one()
@@ -224,8 +221,7 @@ class InspectionPlan(models.Model):
         subject = "Cần điền ngày kiểm tra thực tế cho kế hoạch kiểm tra tàu hằng tháng"
         message = f"Ngày dự kiến rơi vào {self.expected_date}!!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _get_real_or_expected_date(self):
         self.ensure_one()
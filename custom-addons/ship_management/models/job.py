@@ -39,7 +39,7 @@ class LearningApp(models.Model):
 class Job(models.Model):
     _name = "ship.job"
     _description = "Job records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -91,8 +91,7 @@ class Job(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.job")
+        self._fill_sequence_refs(vals_list, "ship.job")
         return super(Job, self).create(vals_list)
 
     def name_get(self):
@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class JobMaterialRequirement(models.Model):
     _name = "ship.job.material.requirement"
     _description = "Job material requirement records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     required_quantity = fields.Float("Required quantity", tracking=True)
@@ -33,10 +33,7 @@ class JobMaterialRequirement(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.job.material.requirement"
-            )
+        self._fill_sequence_refs(vals_list, "ship.job.material.requirement")
         return super(JobMaterialRequirement, self).create(vals_list)
 
     def name_get(self):
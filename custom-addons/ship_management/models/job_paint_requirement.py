@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class JobPaintRequirement(models.Model):
     _name = "ship.job.paint.requirement"
     _description = "Job paint requirement records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     required_quantity_liter_m2 = fields.Integer(
@@ -30,10 +30,7 @@ class JobPaintRequirement(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.job.paint.requirement"
-            )
+        self._fill_sequence_refs(vals_list, "ship.job.paint.requirement")
         return super(JobPaintRequirement, self).create(vals_list)
 
     def name_get(self):
@@ -484,7 +484,7 @@ class JobQuoteTemplate(models.Model):
 class JobQuote(models.Model):
     _name = "ship.job.quote"
     _description = "Job quote records"
-    _inherit = ["ship.job.quote.template"]
+    _inherit = ["ship.job.quote.template", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     _order = "implement_date ASC"
@@ -565,8 +565,7 @@ class JobQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.job.quote")
+        self._fill_sequence_refs(vals_list, "ship.job.quote")
 
         result = super(JobQuote, self).create(vals_list)
 
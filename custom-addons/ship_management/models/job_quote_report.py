@@ -104,12 +104,9 @@ class JobQuoteReportBatch(models.Model):
 
 
         # Load the custom XLSX template
-        template_path = '/mnt/extra-addons/report_template/bgt.xlsx'  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env['ship.xlsx.template']
+        workbook = xlsx_template._load_template('bgt.xlsx')
+        worksheet = workbook.active
         
 
         week_number = self.date_start.isocalendar()[1]
@@ -201,46 +198,16 @@ class JobQuoteReportBatch(models.Model):
         #     # Adjust the height (example: you might need to fine-tune the multiplication factor)
         #     worksheet.row_dimensions[row_number].height = max_len * 1,2
 
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
+        # Loop through the worksheet and replace "FALSE" with None
+        for row in worksheet.iter_rows():
+            for cell in row:
+                if cell.value == False:
+                    cell.value = '  '
 
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
+        binary_data = xlsx_template._save_workbook(workbook)
 
-            # Loop through the worksheet and replace "FALSE" with None
-            for row in temp_worksheet.iter_rows():
-                for cell in row:
-                    if cell.value == False:
-                        cell.value = '  '
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, 'rb') as file:
-            binary_data = file.read()
-
-        # Create an attachment
         filename = f"Báo cáo tuần_{week_number}__{self.date_start}_{self.date_end}.xlsx"
-        attachment = self.env['ir.attachment'].create({
-            'name': filename,
-            'type': 'binary',
-            'datas': base64.b64encode(binary_data),
-            'res_model': self._name,
-            'res_id': self.id,
-            'public': True,
-            'res_field': 'custom_export',  # Replace with the appropriate field name
-        })
-
-        # Return an action to open the attachment
-        return {
-            'name': filename,
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}/{filename}',
-            'target': 'self',
-        }
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
 
 class JobQuoteReport(models.Model):
@@ -116,7 +116,7 @@ class JobSupplierQuoteTemplate(models.Model):
 class JobSupplierQuote(models.Model):
     _name = "ship.job.supplier.quote"
     _description = "Job supplier quote records"
-    _inherit = ["ship.job.supplier.quote.template"]
+    _inherit = ["ship.job.supplier.quote.template", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # sequential
@@ -143,10 +143,7 @@ class JobSupplierQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.job.supplier.quote"
-            )
+        self._fill_sequence_refs(vals_list, "ship.job.supplier.quote")
         result = super(JobSupplierQuote, self).create(vals_list)
 
         for record in result:
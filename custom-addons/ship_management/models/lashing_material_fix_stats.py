@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class LashingMaterialFixStats(models.Model):
     _name = "ship.lashing.material.fix.stats"
     _description = "Lashing material fix stats records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     update_date = fields.Char(
@@ -31,9 +31,7 @@ class LashingMaterialFixStats(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.lashing.material.fix.stats"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.lashing.material.fix.stats")
         return super(LashingMaterialFixStats, self).create(vals_list)
 
     def name_get(self):
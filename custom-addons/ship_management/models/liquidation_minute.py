@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class LiquidationMinute(models.Model):
     _name = "ship.liquidation.minute"
     _description = "Liquidation minute records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -44,9 +44,7 @@ class LiquidationMinute(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.liquidation.minute"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.liquidation.minute")
         result = super(LiquidationMinute, self).create(vals_list)
 
         for record in result:
@@ -86,7 +86,7 @@ class MaintenanceScopeTemplate(models.Model):
 class MaintenanceScope(models.Model):
     _name = "ship.maintenance.scope"
     _description = "Maintenance scope records"
-    _inherit = ["ship.maintenance.scope.template"]
+    _inherit = ["ship.maintenance.scope.template", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     is_docking = fields.Boolean("Is docking", tracking=True)
@@ -114,8 +114,7 @@ class MaintenanceScope(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.maintenance.scope")
+        self._fill_sequence_refs(vals_list, "ship.maintenance.scope")
 
         records = super(MaintenanceScope, self).create(vals_list)
 
@@ -469,7 +469,7 @@ class MaintenanceScopeReportTemplate(models.Model):
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
@@ -500,7 +500,7 @@ class MaintenanceScopeReportTemplate(models.Model):
 class MaintenanceScopeReport(models.Model):
     _name = "ship.maintenance.scope.report"
     _description = "Maintenance scope report records"
-    _inherit = ["ship.maintenance.scope.report.template"]
+    _inherit = ["ship.maintenance.scope.report.template", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # relation field
@@ -560,10 +560,7 @@ class MaintenanceScopeReport(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.maintenance.scope.report"
-            )
+        self._fill_sequence_refs(vals_list, "ship.maintenance.scope.report")
         result = super(MaintenanceScopeReport, self).create(vals_list)
 
         for record in result:
@@ -712,14 +709,9 @@ class MaintenanceScopeReport(models.Model):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = (
-            "/mnt/extra-addons/report_template/pms.xlsx"  # Replace with the actual path
-        )
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("pms.xlsx")
+        worksheet = workbook.active
 
         ###
 
@@ -767,8 +759,8 @@ class MaintenanceScopeReport(models.Model):
             row = 6
             index = 0
             worksheet = workbook[department_name]
+            xlsx_template._insert_rows(worksheet, row, len(pms_data_dep))
             for maintainance_data in pms_data_dep:
-                worksheet.insert_rows(row)
                 index += 1
                 worksheet.cell(row=row, column=1, value=index)
                 worksheet.cell(
@@ -833,68 +825,30 @@ class MaintenanceScopeReport(models.Model):
                         )
                 row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            border_style = Border(
-                left=Side(border_style="thin"),
-                right=Side(border_style="thin"),
-                top=Side(border_style="thin"),
-                bottom=Side(border_style="thin"),
-            )
-            worksheet_name = ["Boong", "Máy"]
-            for ws in worksheet_name:
-                worksheet = workbook[ws]
-                for row in range(6, index + 1):
-                    for col in range(1, 19):
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.border = border_style
-
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
+        border_style = Border(
+            left=Side(border_style="thin"),
+            right=Side(border_style="thin"),
+            top=Side(border_style="thin"),
+            bottom=Side(border_style="thin"),
+        )
+        worksheet_name = ["Boong", "Máy"]
+        for ws in worksheet_name:
+            worksheet = workbook[ws]
+            for row in range(6, index + 1):
+                for col in range(1, 19):
+                    cell = worksheet.cell(row=row, column=col)
+                    cell.border = border_style
 
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Kế hoạch PMS.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def custom_export_pms_review_to_xlsx(self):
         # Load the custom XLSX template
-        template_path = (
-            "/mnt/extra-addons/report_template/pms.xlsx"  # Replace with the actual path
-        )
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("pms.xlsx")
+        worksheet = workbook.active
 
         ###
 
@@ -945,8 +899,8 @@ class MaintenanceScopeReport(models.Model):
             row = 6
             index = 0
             worksheet = workbook[department_name]
+            xlsx_template._insert_rows(worksheet, row, len(pms_data_dep))
             for maintainance_data in pms_data_dep:
-                worksheet.insert_rows(row)
                 index += 1
                 worksheet.cell(row=row, column=1, value=index)
                 worksheet.cell(
@@ -1020,57 +974,24 @@ class MaintenanceScopeReport(models.Model):
                         )
                 row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            border_style = Border(
-                left=Side(border_style="thin"),
-                right=Side(border_style="thin"),
-                top=Side(border_style="thin"),
-                bottom=Side(border_style="thin"),
-            )
-            worksheet_name = ["Boong", "Máy"]
-            for ws in worksheet_name:
-                worksheet = workbook[ws]
-                for row in range(6, index + 1):
-                    for col in range(1, 19):
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.border = border_style
-
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
+        border_style = Border(
+            left=Side(border_style="thin"),
+            right=Side(border_style="thin"),
+            top=Side(border_style="thin"),
+            bottom=Side(border_style="thin"),
+        )
+        worksheet_name = ["Boong", "Máy"]
+        for ws in worksheet_name:
+            worksheet = workbook[ws]
+            for row in range(6, index + 1):
+                for col in range(1, 19):
+                    cell = worksheet.cell(row=row, column=col)
+                    cell.border = border_style
 
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Review PMS.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def action_is_docking(self):
         self.ensure_one()
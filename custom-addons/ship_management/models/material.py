@@ -20,7 +20,7 @@ WAREHOUSES = [
 class Material(models.Model):
     _name = "ship.material"
     _description = "Material records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", required=True, tracking=True)
@@ -31,10 +31,14 @@ class Material(models.Model):
     note = fields.Char("Note", tracking=True)
     unit = fields.Char("Unit", tracking=True)
     min_quantity = fields.Float("Min quantity", tracking=True)
-    available_quantity = fields.Float("Available quantity", compute="_cacl_quantity")
+    available_quantity = fields.Float(
+        "Available quantity", compute="_cacl_quantity", store=True
+    )
     transfer_quantity = fields.Float("Transfer quantity", tracking=True)
     origin = fields.Char("Origin", tracking=True)
-    is_quantity_low = fields.Boolean("Is quantity low", default=False, readonly=True)
+    is_quantity_low = fields.Boolean(
+        "Is quantity low", compute="_compute_is_quantity_low", store=True, index=True
+    )
     is_essential_material = fields.Boolean("Is essential material", tracking=True)
     is_used_for_lifespan = fields.Boolean("Is used for lifespan", tracking=True)
     warehouse = fields.Selection(
@@ -108,16 +112,41 @@ class Material(models.Model):
     # sequential
     ref = fields.Char(string="Code", default=lambda self: _("New"))
 
-    @api.depends("material_entity_ids")
+    @api.depends("material_entity_ids.available_quantity")
     def _cacl_quantity(self):
         for record in self:
             available_quantity = record.material_entity_ids.mapped("available_quantity")
             record.available_quantity = sum(available_quantity)
 
+    @api.depends("available_quantity", "min_quantity")
+    def _compute_is_quantity_low(self):
+        for record in self:
+            record.is_quantity_low = record.available_quantity < record.min_quantity
+
+    def _sync_is_quantity_low(self):
+        """
+        Set is_quantity_low of the materials whose stored flag disagrees with
+        their stock. A value assigned by a compute does not trigger the
+        computes depending on it, so the flag is not set when the stored
+        available_quantity is filled on update.
+        """
+        self.flush_model(["available_quantity", "min_quantity", "is_quantity_low"])
+        self.env.cr.execute(
+            """
+            UPDATE ship_material
+            SET is_quantity_low = (
+                COALESCE(available_quantity, 0) < COALESCE(min_quantity, 0)
+            )
+            WHERE is_quantity_low IS DISTINCT FROM (
+                COALESCE(available_quantity, 0) < COALESCE(min_quantity, 0)
+            )
+            """
+        )
+        self.invalidate_model(["is_quantity_low"])
+
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.material")
+        self._fill_sequence_refs(vals_list, "ship.material")
         return super(Material, self).create(vals_list)
 
     def write(self, vals):
@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class MaterialAssignment(models.Model):
     _name = "ship.material.assignment"
     _description = "Material Assignment records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     quantity = fields.Float("Quantity", default=1, tracking=True)
@@ -86,10 +86,8 @@ class MaterialAssignment(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
+        self._fill_sequence_refs(vals_list, "ship.material.assignment")
         for vals in vals_list:
-            model = "ship.material.assignment"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model)
-
             self.raise_if_material_entity_quantity_equal_or_less_than_0(vals)
 
         return super(MaterialAssignment, self).create(vals_list)
@@ -104,9 +102,6 @@ class MaterialAssignment(models.Model):
             message = "Làm ơn tạo mới bản ghi, không thể thay đổi vật tư!"
             raise ValidationError(message)
 
-        if "start_time_of_use" in vals or "end_time_of_use" in vals:
-            self.material_entity_id._cacl_quantity()
-
         return result
 
     def unlink(self):
@@ -11,7 +11,11 @@ import logging
 class MaterialEntity(models.Model):
     _name = "ship.material.entity"
     _description = "Material entity records"
-    _inherit = ["utilities.notification"]
+    _inherit = [
+        "utilities.notification",
+        "utilities.sequence.mixin",
+        "ship.image.mixin",
+    ]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -19,7 +23,6 @@ class MaterialEntity(models.Model):
     available_quantity = fields.Float(
         "Available quantity", compute="_cacl_quantity", store=True
     )
-    image = fields.Image("Image", tracking=True)
     expiration_date = fields.Date("Expiration date", tracking=True)
     min_life_span_hours = fields.Integer(
         "Min life span in hours",
@@ -117,7 +120,12 @@ class MaterialEntity(models.Model):
                     raise ValidationError(message)
 
     @api.depends(
-        "quantity", "is_discarded", "is_used_for_lifespan", "material_assignment_ids"
+        "quantity",
+        "is_discarded",
+        "is_used_for_lifespan",
+        "material_assignment_ids.quantity",
+        "material_assignment_ids.start_time_of_use",
+        "material_assignment_ids.end_time_of_use",
     )
     def _cacl_quantity(self):
         for record in self:
@@ -141,8 +149,7 @@ class MaterialEntity(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.material.entity")
+        self._fill_sequence_refs(vals_list, "ship.material.entity")
         records = super(MaterialEntity, self).create(vals_list)
         for record in records:
             record._set_default_expiration_date_if_not()
@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class MaterialUsageType(models.Model):
     _name = "ship.material.group"
     _description = "Material group records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -23,8 +23,7 @@ class MaterialUsageType(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.material.group")
+        self._fill_sequence_refs(vals_list, "ship.material.group")
         return super(MaterialUsageType, self).create(vals_list)
 
     def name_get(self):
@@ -11,7 +11,7 @@ from datetime import timedelta
 class MaterialPaintQuotesRequest(models.Model):
     _name = "ship.material.paint.quotes.request"
     _description = "Request for material and paint quotes records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
     _edit_field_permissions_list = {
         "material_quote_ids": ["utilities.group_ship_captain"],
@@ -23,6 +23,15 @@ class MaterialPaintQuotesRequest(models.Model):
     supplier_emails = fields.Char(
         "Supplier emails", compute="_get_supplier_emails", store=True, tracking=True
     )
+    supplier_ids = fields.Many2many(
+        "ship.supplier",
+        "ship_material_paint_quotes_request_ship_supplier_rel",
+        "material_paint_quotes_request_id",
+        "supplier_id",
+        string="Suppliers",
+        compute="_get_supplier_ids",
+        store=True,
+    )
     not_allowed_to_see_price = fields.Boolean(
         "Not allow crew", compute="_calc_not_allowed_to_see_price"
     )
@@ -92,10 +101,7 @@ class MaterialPaintQuotesRequest(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.material.paint.quotes.request"
-            )
+        self._fill_sequence_refs(vals_list, "ship.material.paint.quotes.request")
         result = super(MaterialPaintQuotesRequest, self).create(vals_list)
 
         for record in result:
@@ -110,10 +116,8 @@ class MaterialPaintQuotesRequest(models.Model):
 
     def create_material_quotes_when_it_is_reached_min(self):
         self.ensure_one()
-        material_ids = (
-            self.env["ship.material"]
-            .search([("company_id", "=", self.company_id.id)])
-            .filtered(lambda e: e.min_quantity > e.available_quantity)
+        material_ids = self.env["ship.material"].search(
+            [("company_id", "=", self.company_id.id), ("is_quantity_low", "=", True)]
         )
 
         for material_id in material_ids:
@@ -216,8 +220,23 @@ class MaterialPaintQuotesRequest(models.Model):
                     for paint_quote in self.paint_quote_ids:
                         paint_quote._get_lowest_paint_supplier_price()
 
+            if self.approval_status == CONST.APPROVED:
+                self._enqueue_uninformed_requests()
+
         return result
 
+    def _enqueue_uninformed_requests(self):
+        """
+        Queue the requests whose selected suppliers may have to be informed
+        """
+        self.env["ship.pending.work"]._enqueue(
+            CONST.PENDING_UNINFORMED_QUOTES_REQUEST, self
+        )
+
+    def _enqueue_all_approved_requests(self):
+        requests = self.search([("approval_status", "=", CONST.APPROVED)])
+        requests._enqueue_uninformed_requests()
+
     def _handle_removed_material_quotes(self, removed_ids):
         self.ensure_one()
         if self._are_send_quotes_to_suppliers():
@@ -325,7 +344,7 @@ class MaterialPaintQuotesRequest(models.Model):
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
@@ -386,6 +405,19 @@ class MaterialPaintQuotesRequest(models.Model):
             string_emails = ",".join(emails)
             record.supplier_emails = string_emails
 
+    @api.depends(
+        "material_quote_ids.material_id.supplier_ids",
+        "spare_part_quote_ids.material_id.supplier_ids",
+        "paint_quote_ids.paint_id.supplier_ids",
+    )
+    def _get_supplier_ids(self):
+        for record in self:
+            record.supplier_ids = (
+                record.material_quote_ids.material_id.supplier_ids
+                | record.spare_part_quote_ids.material_id.supplier_ids
+                | record.paint_quote_ids.paint_id.supplier_ids
+            )
+
     def _get_total_prices(self):
         for record in self:
             material_quote_ids = self.env["ship.material.quote"].search(
@@ -449,7 +481,10 @@ class MaterialPaintQuotesRequest(models.Model):
         self.supplier_for_filter_id = False
 
     def action_send_emails_to_all_uninformed_requests(self):
-        for request in self.search([]):
+        requests = self.env["ship.pending.work"]._pop(
+            CONST.PENDING_UNINFORMED_QUOTES_REQUEST, self._name
+        )
+        for request in requests:
             supplier_ids = request.approved_but_uninformed_quotes(
                 return_type="supplier"
             )
@@ -11,7 +11,7 @@ from odoo.exceptions import ValidationError
 class MaterialQuote(models.Model):
     _name = "ship.material.quote"
     _description = "Material quote records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     quantity = fields.Float("Quantity", tracking=True)
@@ -128,8 +128,7 @@ class MaterialQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.material.quote")
+        self._fill_sequence_refs(vals_list, "ship.material.quote")
         return super(MaterialQuote, self).create(vals_list)
 
     def write(self, vals):
@@ -143,6 +142,10 @@ class MaterialQuote(models.Model):
             if "quantity" in vals:
                 record._not_allow_editing_quantity_once_the_quote_has_been_sent_to_ncc()
 
+        if "quote_state" in vals or "material_supplier_quote_id" in vals:
+            requests = self.mapped("material_paint_quotes_request_id")
+            requests._enqueue_uninformed_requests()
+
         return result
 
     def _get_chatter_message_on_write(self, old_values, vals):
@@ -230,8 +233,7 @@ class MaterialQuote(models.Model):
     def action_send_email_batch(self):
         """For sending email to suppliers"""
         self.ensure_one()
-        for supplier_quote in self.material_supplier_quote_ids:
-            supplier_quote.action_send_email()
+        self.material_supplier_quote_ids.action_send_email()
 
     def send_email_to_selected_provider(self):
         self.ensure_one()
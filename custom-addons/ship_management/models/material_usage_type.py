@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class MaterialUsageType(models.Model):
     _name = "ship.material.usage.type"
     _description = "Material usage type records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -25,10 +25,7 @@ class MaterialUsageType(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.material.usage.type"
-            )
+        self._fill_sequence_refs(vals_list, "ship.material.usage.type")
         return super(MaterialUsageType, self).create(vals_list)
 
     def name_get(self):
@@ -10,7 +10,7 @@ from odoo.exceptions import ValidationError
 class Paint(models.Model):
     _name = "ship.paint"
     _description = "Paint records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -20,7 +20,9 @@ class Paint(models.Model):
     min_quantity_liter = fields.Float("Min quantity liter", tracking=True)
     available_quantity_liter = fields.Float("Available quantity", readonly=True)
     origin = fields.Char("Origin", tracking=True)
-    is_quantity_low = fields.Boolean("Is quantity low", default=False, readonly=True)
+    is_quantity_low = fields.Boolean(
+        "Is quantity low", compute="_compute_is_quantity_low", store=True, index=True
+    )
 
     # company
     company_id = fields.Many2one(
@@ -49,11 +51,37 @@ class Paint(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.paint")
-        result = super(Paint, self).create(vals_list)
-        self.compute_all_paints_available_quantity()
-        return result
+        self._fill_sequence_refs(vals_list, "ship.paint")
+        return super(Paint, self).create(vals_list)
+
+    @api.depends("available_quantity_liter", "min_quantity_liter")
+    def _compute_is_quantity_low(self):
+        for record in self:
+            record.is_quantity_low = (
+                record.available_quantity_liter < record.min_quantity_liter
+            )
+
+    def _sync_is_quantity_low(self):
+        """
+        Set is_quantity_low of the paints whose stored flag disagrees with
+        their stock, the flag is not computed for the existing paints when
+        it becomes a stored compute on update.
+        """
+        self.flush_model(
+            ["available_quantity_liter", "min_quantity_liter", "is_quantity_low"]
+        )
+        self.env.cr.execute(
+            """
+            UPDATE ship_paint
+            SET is_quantity_low = (
+                COALESCE(available_quantity_liter, 0) < COALESCE(min_quantity_liter, 0)
+            )
+            WHERE is_quantity_low IS DISTINCT FROM (
+                COALESCE(available_quantity_liter, 0) < COALESCE(min_quantity_liter, 0)
+            )
+            """
+        )
+        self.invalidate_model(["is_quantity_low"])
 
     def unlink(self):
         for paint in self:
@@ -84,35 +112,73 @@ class Paint(models.Model):
         return count > 0
 
     def compute_all_paints_available_quantity(self):
-        all_paint = self.search([])
-        for paint in all_paint:
-            paint.compute_single_paint_available_quantity()
+        self.search([]).compute_paints_available_quantity()
 
     def compute_single_paint_available_quantity(self):
         self.ensure_one()
-        count = 0.0
-        for record in self.paint_history_ids:
-            if record.action == ADD_ACTION:
-                count += record.quantity_liter
-            elif record.action == MINUS_ACTION:
-                count -= record.quantity_liter
-        self.available_quantity_liter = count
-        if count < self.min_quantity_liter:
-            self.is_quantity_low = True
-        else:
-            self.is_quantity_low = False
+        self.compute_paints_available_quantity()
+
+    def compute_paints_available_quantity(self):
+        """
+        Rebuild the balance of the paints from their whole paint history
+        with one grouped query
+        """
+        quantities = dict.fromkeys(self.ids, 0.0)
+        groups = self.env["ship.paint.history"].read_group(
+            [("paint_id", "in", self.ids)],
+            ["quantity_liter:sum"],
+            ["paint_id", "action"],
+            lazy=False,
+        )
+        for group in groups:
+            paint_id = group["paint_id"][0]
+            if group["action"] == ADD_ACTION:
+                quantities[paint_id] += group["quantity_liter"]
+            elif group["action"] == MINUS_ACTION:
+                quantities[paint_id] -= group["quantity_liter"]
+
+        for paint in self:
+            paint.available_quantity_liter = quantities[paint.id]
+
+    def _add_to_available_quantity(self, quantity):
+        """
+        Move the balance of the paint by ``quantity``. The paint row is
+        locked until the end of the transaction, so concurrent movements
+        of the same paint are applied one after the other.
+        :return: the balance before the movement
+        """
+        self.ensure_one()
+        self.flush_recordset(["available_quantity_liter"])
+        self.env.cr.execute(
+            "SELECT available_quantity_liter FROM ship_paint WHERE id = %s FOR UPDATE",
+            [self.id],
+        )
+        previous_quantity = self.env.cr.fetchone()[0] or 0.0
+        self.invalidate_recordset(["available_quantity_liter"])
+        self.available_quantity_liter = previous_quantity + quantity
+        return previous_quantity
 
     def _get_paints_below_minimum_quantity(self):
-        # update available quantity first
-        self.compute_all_paints_available_quantity()
         return self.search([("is_quantity_low", "=", True)])
 
     def action_create_paint_quote_when_min(self):
         paints = self._get_paints_below_minimum_quantity()
+        in_progress_paint_ids = set(
+            self.env["ship.paint.quote"]
+            .search(
+                [
+                    ("paint_id", "in", paints.ids),
+                    ("approval_status", "!=", CONST.APPROVED),
+                    ("approval_status", "!=", CONST.REJECTED),
+                ]
+            )
+            .mapped("paint_id")
+            .ids
+        )
         new_paint_quotes = []
         for paint in paints:
             # check if paint has in progress quotes
-            if not paint._has_in_progress_paint_quote():
+            if paint.id not in in_progress_paint_ids:
                 new_paint_quotes.append(
                     {
                         "paint_id": paint.id,
@@ -16,7 +16,7 @@ ACTIONS = [
 class PaintHistory(models.Model):
     _name = "ship.paint.history"
     _description = "Paint history records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     previous_quantity = fields.Float(string="Previous quantity", tracking=True)
@@ -25,6 +25,8 @@ class PaintHistory(models.Model):
         "Occured at", default=lambda self: fields.Datetime.now(), tracking=True
     )
     quantity_liter = fields.Float("Quantity liter", tracking=True)
+    # running balance of the paint after this movement
+    balance = fields.Float("Balance", readonly=True)
     note = fields.Text("Note", tracking=True)
 
     # company
@@ -64,15 +66,23 @@ class PaintHistory(models.Model):
         if record_len >= 2:
             raise ValidationError(message)
 
+        self._fill_sequence_refs(vals_list, "ship.paint.history")
         for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.paint.history")
+            # the stock moves by the action the record is created with,
+            # including a default action of the context
+            if not vals.get("action"):
+                vals["action"] = self.default_get(["action"]).get("action")
             paint_id = vals.get("paint_id")
             if vals.get("paint_id"):
                 paint = self.env["ship.paint"].browse(paint_id)
-                vals["previous_quantity"] = paint.available_quantity_liter
+                quantity = vals.get("quantity_liter") or 0.0
+                if vals["action"] == MINUS_ACTION:
+                    quantity = -quantity
+                previous_quantity = paint._add_to_available_quantity(quantity)
+                vals["previous_quantity"] = previous_quantity
+                vals["balance"] = previous_quantity + quantity
         result = super(PaintHistory, self).create(vals_list)
         for record in result:
-            record.paint_id.compute_single_paint_available_quantity()
             if record.action == MINUS_ACTION:
                 if record.quantity_liter > record.previous_quantity:
                     raise ValidationError("Số lượng sơn trong kho không đủ để lấy!")
@@ -83,13 +93,10 @@ class PaintHistory(models.Model):
         raise ValidationError("Update is not allowed.")
 
     def unlink(self):
-        paint_list = []
-        for record in self:
-            paint_list.append(record.paint_id)
+        paints = self.paint_id
         result = super(PaintHistory, self).unlink()
-        # recompute paint available quantity
-        for paint in paint_list:
-            paint.compute_single_paint_available_quantity()
+        # rebuild the balance of the paints from their remaining history
+        paints.exists().compute_paints_available_quantity()
         return result
 
     def name_get(self):
@@ -12,7 +12,7 @@ from odoo.exceptions import ValidationError
 class PaintQuote(models.Model):
     _name = "ship.paint.quote"
     _description = "PaintQuote records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     quantity_liter = fields.Float("Quantity liter", tracking=True)
@@ -94,8 +94,7 @@ class PaintQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.paint.quote")
+        self._fill_sequence_refs(vals_list, "ship.paint.quote")
         return super(PaintQuote, self).create(vals_list)
 
     def write(self, vals):
@@ -110,6 +109,10 @@ class PaintQuote(models.Model):
             if "quantity_liter" in vals:
                 record._not_allow_editing_quantity_once_the_quote_has_been_sent_to_ncc()
 
+        if "quote_state" in vals or "paint_supplier_quote_id" in vals:
+            requests = self.mapped("material_paint_quotes_request_id")
+            requests._enqueue_uninformed_requests()
+
         return result
 
     def _get_chatter_message_on_write(self, old_values, vals):
@@ -194,8 +197,7 @@ class PaintQuote(models.Model):
     def action_send_email_batch(self):
         """For sending email to suppliers"""
         self.ensure_one()
-        for supplier_quote in self.paint_supplier_quote_ids:
-            supplier_quote.action_send_email()
+        self.paint_supplier_quote_ids.action_send_email()
 
     def send_email_to_selected_provider(self):
         self.ensure_one()
@@ -4,13 +4,12 @@
 from odoo import api, fields, models, _
 from .common_utils import generate_token, format_field_date
 from . import CONST
-import logging
 
 
 class PaintSupplierQuote(models.Model):
     _name = "ship.paint.supplier.quote"
     _description = "Paint supplier quote records"
-    _inherit = ["mail.thread"]
+    _inherit = ["mail.thread", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     unit_price = fields.Float("Unit price", tracking=True)
@@ -56,10 +55,7 @@ class PaintSupplierQuote(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code(
-                "ship.paint.supplier.quote"
-            )
+        self._fill_sequence_refs(vals_list, "ship.paint.supplier.quote")
         result = super(PaintSupplierQuote, self).create(vals_list)
 
         for record in result:
@@ -122,52 +118,39 @@ class PaintSupplierQuote(models.Model):
         return self.search(conditions)
 
     def action_send_emails_to_all_unsent_supplier_quotes(self):
-        for record in self.get_all_unsent_supplier_quotes():
-            record.action_send_email()
+        self.get_all_unsent_supplier_quotes().action_send_email()
 
     def action_send_email(self):
         """For sending email to suppliers"""
+        rfq_mail = self.env["ship.rfq.mail"]
+        template = self.env.ref("ship_management.email_template_paint_rfq_request")
+        base_url = rfq_mail._get_base_url()
+        values_by_record = {
+            record: record._get_rfq_mail_values(base_url) for record in self
+        }
+        sent_quotes = rfq_mail._send_batch(template, values_by_record)
+        sent_quotes.write({"is_email_sent": True})
+
+    def _get_rfq_mail_values(self, base_url):
         self.ensure_one()
-        self.is_email_sent = True
-        try:
-            # get paint info
-            paint = self.env["ship.paint"].search(
-                [("id", "=", self.paint_quote_id.paint_id.id)]
-            )
-            template = self.env.ref(
-                "ship_management.email_template_paint_rfq_request"
-            ).id
-            reply_quote_url = (
-                "{base_url}/vendor_rfpq/{ref}?access_token={token}".format(
-                    base_url=self.env["ir.config_parameter"]
-                    .sudo()
-                    .get_param("web.base.url"),
-                    ref=self.ref,
-                    token=self.access_token,
-                )
-            )
-            context = {
-                "supplier_name": self.supplier_id.name,
-                "prod_name": paint.name,
-                "prod_origin": paint.origin,
-                "prod_description": paint.description,
-                "unit": "lít",
-                "quantity": self.paint_quote_id.quantity_liter,
-                "expected_delivery_date": format_field_date(
-                    self.paint_quote_id.expected_delivery_date
-                ),
-                "deadline": format_field_date(self.paint_quote_id.deadline),
-                "reply_quote_url": reply_quote_url,
-            }
-            email_values = {
-                "email_to": self.supplier_id.email,
-            }
-            self.env["mail.template"].browse(template).with_context(context).send_mail(
-                self.id, email_values=email_values, force_send=False
-            )
-        except Exception as e:
-            self.is_email_sent = False
-            logging.error(e)
+        paint = self.paint_quote_id.paint_id
+        reply_quote_url = (
+            f"{base_url}/vendor_rfpq/{self.ref}?access_token={self.access_token}"
+        )
+        return {
+            "email_to": self.supplier_id.email,
+            "supplier_name": self.supplier_id.name,
+            "prod_name": paint.name,
+            "prod_origin": paint.origin,
+            "prod_description": paint.description,
+            "unit": "lít",
+            "quantity": self.paint_quote_id.quantity_liter,
+            "expected_delivery_date": format_field_date(
+                self.paint_quote_id.expected_delivery_date
+            ),
+            "deadline": format_field_date(self.paint_quote_id.deadline),
+            "reply_quote_url": reply_quote_url,
+        }
 
     def action_inform_selected_email(self):
         """Send email when the supplier is selected"""
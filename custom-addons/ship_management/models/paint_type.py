@@ -7,7 +7,7 @@ from odoo import api, fields, models, _
 class PaintType(models.Model):
     _name = "ship.paint.type"
     _description = "Paint type records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -23,8 +23,7 @@ class PaintType(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.paint.type")
+        self._fill_sequence_refs(vals_list, "ship.paint.type")
         return super(PaintType, self).create(vals_list)
 
     def name_get(self):
@@ -8,7 +8,7 @@ from . import CONST
 class Port(models.Model):
     _name = "ship.port"
     _description = "port records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -34,8 +34,7 @@ class Port(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.port")
+        self._fill_sequence_refs(vals_list, "ship.port")
         return super(Port, self).create(vals_list)
 
     def name_get(self):
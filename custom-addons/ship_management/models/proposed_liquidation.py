@@ -26,7 +26,7 @@ from openpyxl.styles import Border, Side, Alignment
 class ProposedLiquidation(models.Model):
     _name = "ship.proposed.liquidation"
     _description = "Proposed liquidation records"
-    _inherit = ["utilities.approval.status"]
+    _inherit = ["utilities.approval.status", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -57,9 +57,7 @@ class ProposedLiquidation(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.proposed.liquidation"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.proposed.liquidation")
         result = super(ProposedLiquidation, self).create(vals_list)
 
         return result
@@ -109,49 +107,21 @@ class ProposedLiquidation(models.Model):
                 }
             )
 
-    def custom_export_proposal_form_to_xlsx(self):
-        # Function to adjust merged cells after inserting rows
-
-        # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/dntl.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
-
-        ###
+    def _fill_replacement_diary_rows(self, worksheet, row):
+        """
+        Fill one row per replacement diary from ``row``
+        :return: the row following the last filled row
+        """
         align_center = Alignment(horizontal="center", vertical="center")
         side_border = Border(
             left=Side(style="thin"), right=Side(style="thin"), top=Side(style="thin")
         )
-        ###Đề nghị số
-        worksheet.cell(row=2, column=1, value=f"Đề nghị số: {self.name}")
-        worksheet.merge_cells("A2:K2")
-        worksheet[f"A2"].alignment = align_center
-        ### Tên tàu
-        worksheet.cell(row=7, column=1, value=f"{self.company_id.name}")
-        worksheet.merge_cells("A7:B7")
-        worksheet[f"A7"].alignment = align_center
-        ### Ngày thanh lý
-        worksheet.cell(row=7, column=5, value=f"{self.proposed_date}")
-        worksheet.merge_cells("E7:F7")
-        worksheet[f"E7"].alignment = align_center
-        ##Hình thức thanh lý
-        worksheet.cell(row=7, column=7, value=f"{self.liquidation_method}")
-        worksheet[f"A2"].alignment = align_center
-        ###Vị trí thanh lý
-        worksheet.cell(row=7, column=8, value=f"{self.liquidation_location}")
-        worksheet.merge_cells("H7:J7")
-        worksheet[f"H7"].alignment = align_center
-        ## Đơn vị tiếp nhận
-        worksheet.cell(row=7, column=11, value=f"{self.liquidation_agency}")
+        replacement_diary_ids = self.replacement_diary_ids
+        self.env["ship.xlsx.template"]._insert_rows(
+            worksheet, row, len(replacement_diary_ids)
+        )
 
-        row = 11
-        index = 0
-        for replacement_diary_id in self.replacement_diary_ids:
-            worksheet.insert_rows(row)
-            index += 1
+        for index, replacement_diary_id in enumerate(replacement_diary_ids, start=1):
             worksheet.cell(row=row, column=1, value=index)
             if replacement_diary_id.material_entity_id:
                 worksheet.cell(
@@ -197,6 +167,42 @@ class ProposedLiquidation(models.Model):
                 cell.alignment = align_center
 
             row += 1
+
+        return row
+
+    def custom_export_proposal_form_to_xlsx(self):
+        # Function to adjust merged cells after inserting rows
+
+        # Load the custom XLSX template
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("dntl.xlsx")
+        worksheet = workbook.active
+
+        ###
+        align_center = Alignment(horizontal="center", vertical="center")
+        ###Đề nghị số
+        worksheet.cell(row=2, column=1, value=f"Đề nghị số: {self.name}")
+        worksheet.merge_cells("A2:K2")
+        worksheet[f"A2"].alignment = align_center
+        ### Tên tàu
+        worksheet.cell(row=7, column=1, value=f"{self.company_id.name}")
+        worksheet.merge_cells("A7:B7")
+        worksheet[f"A7"].alignment = align_center
+        ### Ngày thanh lý
+        worksheet.cell(row=7, column=5, value=f"{self.proposed_date}")
+        worksheet.merge_cells("E7:F7")
+        worksheet[f"E7"].alignment = align_center
+        ##Hình thức thanh lý
+        worksheet.cell(row=7, column=7, value=f"{self.liquidation_method}")
+        worksheet[f"A2"].alignment = align_center
+        ###Vị trí thanh lý
+        worksheet.cell(row=7, column=8, value=f"{self.liquidation_location}")
+        worksheet.merge_cells("H7:J7")
+        worksheet[f"H7"].alignment = align_center
+        ## Đơn vị tiếp nhận
+        worksheet.cell(row=7, column=11, value=f"{self.liquidation_agency}")
+
+        row = self._fill_replacement_diary_rows(worksheet, 11)
         ##alingment
 
         worksheet.merge_cells(f"A{row+10}:D{row+10}")
@@ -214,60 +220,21 @@ class ProposedLiquidation(models.Model):
         worksheet.merge_cells(f"H{row+11}:K{row+11}")
         worksheet[f"H{row+11}"].alignment = align_center
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
+        binary_data = xlsx_template._save_workbook(workbook)
 
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
-
-        # Create an attachment
         filename = f"Đề nghị thanh lý số {self.name}.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def custom_export_decision_form_to_xlsx(self):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/qdtl.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("qdtl.xlsx")
+        worksheet = workbook.active
 
         ###
         align_center = Alignment(horizontal="center", vertical="center")
-        side_border = Border(
-            left=Side(style="thin"), right=Side(style="thin"), top=Side(style="thin")
-        )
         date_object = fields.Date.from_string(self.proposed_date)
         day = date_object.day
         month = date_object.month
@@ -282,61 +249,22 @@ class ProposedLiquidation(models.Model):
             column=1,
             value=f" Điều 1: Thanh lý các phụ tùng, vật tư trong bản đề nghị số: {self.name}, ngày {day} tháng {month} năm {year} của {self.company_id.name} ",
         )
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
+        binary_data = xlsx_template._save_workbook(workbook)
 
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
-
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
-
-        # Create an attachment
         filename = f"Quyết định thanh lý số {self.name_decision}.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     def custom_export_agreement_form_to_xlsx(self):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/bbtl.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("bbtl.xlsx")
+        worksheet = workbook.active
 
         ###
 
         align_center = Alignment(horizontal="center", vertical="center")
-        side_border = Border(
-            left=Side(style="thin"), right=Side(style="thin"), top=Side(style="thin")
-        )
         date_object = fields.Date.from_string(self.proposed_date)
         day = date_object.day
         month = date_object.month
@@ -370,56 +298,7 @@ class ProposedLiquidation(models.Model):
         ## Đơn vị tiếp nhận
         worksheet.cell(row=7, column=11, value=f"{self.liquidation_agency}")
 
-        row = 11
-        index = 0
-        for replacement_diary_id in self.replacement_diary_ids:
-            worksheet.insert_rows(row)
-            index += 1
-            worksheet.cell(row=row, column=1, value=index)
-            if replacement_diary_id.material_entity_id:
-                worksheet.cell(
-                    row=row,
-                    column=2,
-                    value=f"{replacement_diary_id.material_id.name} (Vật tư thực tế {replacement_diary_id.material_entity_id.ref})",
-                )
-            else:
-                worksheet.cell(
-                    row=row,
-                    column=2,
-                    value=replacement_diary_id.material_id.name,
-                )
-            worksheet.cell(
-                row=row,
-                column=3,
-                value=replacement_diary_id.material_description,
-            )
-            worksheet.cell(
-                row=row,
-                column=4,
-                value=replacement_diary_id.internal_code,
-            )
-            worksheet.cell(
-                row=row, column=5, value=replacement_diary_id.material_id.unit
-            )
-            worksheet.cell(
-                row=row,
-                column=6,
-                value=replacement_diary_id.quantity,
-            )
-            worksheet.cell(row=row, column=7, value=replacement_diary_id.reason)
-            worksheet.cell(row=row, column=8, value=replacement_diary_id.date)
-            worksheet.cell(
-                row=row,
-                column=9,
-                value=(replacement_diary_id.year_used),
-            )
-            worksheet.cell(row=row, column=10, value=replacement_diary_id.condition)
-            for col in range(1, 12):  # Column A to K (1 to 11 in 1-indexed system)
-                cell = worksheet.cell(row=row, column=col)
-                cell.border = side_border
-                cell.alignment = align_center
-
-            row += 1
+        row = self._fill_replacement_diary_rows(worksheet, 11)
         ##alingment
 
         worksheet.merge_cells(f"E{row+12}:G{row+12}")
@@ -431,43 +310,10 @@ class ProposedLiquidation(models.Model):
         worksheet.merge_cells(f"H{row+12}:K{row+12}")
         worksheet[f"H{row+12}"].alignment = align_center
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
-
-        # Create an attachment
         filename = f"Biên bản thanh lý số {self.name_agreement}.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(self, filename, binary_data)
 
     # def action_approve(self):
     #     self.ensure_one()
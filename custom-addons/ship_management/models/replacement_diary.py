@@ -27,7 +27,7 @@ from openpyxl.styles import Border, Side, Alignment
 class ReplacementDiary(models.Model):
     _name = "ship.replacement.diary"
     _description = "Replacement diary records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     date = fields.Date("Date", tracking=True)
@@ -91,8 +91,7 @@ class ReplacementDiary(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.replacement.diary")
+        self._fill_sequence_refs(vals_list, "ship.replacement.diary")
         return super(ReplacementDiary, self).create(vals_list)
 
     def name_get(self):
@@ -149,12 +148,8 @@ class ReplacementDiary(models.Model):
 
     def custom_export_diary_to_xlsx(self):
         # Load the custom XLSX template
-        template_path = "/mnt/extra-addons/report_template/nktr.xlsx"  # Replace with the actual path
-        try:
-            workbook = load_workbook(template_path)
-            worksheet_names = workbook.sheetnames
-        except Exception as e:
-            raise UserError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("nktr.xlsx")
 
         # Function to adjust merged cells after inserting rows
         align_center = Alignment(horizontal="center", vertical="center")
@@ -234,33 +229,9 @@ class ReplacementDiary(models.Model):
             )
             worksheet.cell(row=current_row, column=12, value=diary["proposed_date"])
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified workbook to the temporary file
-            workbook.save(temp_file.name)
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
-
-        # Create an attachment
         filename = f"Replacement Diary.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": self._name,
-                "res_id": self.id,
-                "public": True,
-                "res_field": "custom_export_diary_to_xlsx",
-            }
+        return xlsx_template._get_export_action(
+            self, filename, binary_data, res_field="custom_export_diary_to_xlsx"
         )
-
-        # Create an action to open the attachment
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        return action
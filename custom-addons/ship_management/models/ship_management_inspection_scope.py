@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class ShipManagementInspectionScope(models.Model):
     _name = "ship.ship.management.inspection.scope"
     _description = "Ship management inspection scope records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char(
@@ -56,9 +56,7 @@ class ShipManagementInspectionScope(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.ship.management.inspection.scope"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.ship.management.inspection.scope")
         result = super(ShipManagementInspectionScope, self).create(vals_list)
 
         for record in result:
@@ -8,7 +8,7 @@ from . import CONST
 class ShipManagementInspectionScopeMetadata(models.Model):
     _name = "ship.ship.management.inspection.scope.metadata"
     _description = "Ship management inspection scope metadata records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -38,9 +38,9 @@ class ShipManagementInspectionScopeMetadata(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.ship.management.inspection.scope.metadata"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(
+            vals_list, "ship.ship.management.inspection.scope.metadata"
+        )
         return super(ShipManagementInspectionScopeMetadata, self).create(vals_list)
 
     def name_get(self):
@@ -10,7 +10,7 @@ from odoo.exceptions import ValidationError
 class ShipManagementInspectionTask(models.Model):
     _name = "ship.ship.management.inspection.task"
     _description = "Ship management inspection task records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # related
@@ -89,9 +89,7 @@ class ShipManagementInspectionTask(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.ship.management.inspection.task"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.ship.management.inspection.task")
 
         result = super(ShipManagementInspectionTask, self).create(vals_list)
         return result
@@ -0,0 +1,245 @@
+from bisect import bisect_left
+from collections import defaultdict
+
+import numpy as np
+
+from odoo import models
+from odoo.tools import float_round, ormcache
+from odoo.tools.lru import LRU
+from . import CONST
+
+
+def interpolate(xs, ys, x):
+    """
+    Linear interpolation of ``x`` on the sorted curve ``xs`` -> ``ys``
+    :param x: a number or an array of numbers
+    :return: the interpolated value(s), NaN where ``x`` is outside the curve
+    """
+    if not len(xs):
+        return np.full(np.shape(x), np.nan)
+    return np.interp(x, xs, ys, left=np.nan, right=np.nan)
+
+
+def round_value(value):
+    return float_round(value, precision_digits=CONST.SOUNDING_PRECISION_DIGITS)
+
+
+def _build_curve(rows, key, columns):
+    # sort by key then by value so that duplicated keys keep their smallest
+    # value, as the old ``min(...)`` lookups did
+    rows = sorted(rows, key=lambda row: tuple(row[name] for name in (key,) + columns))
+    xs = []
+    ys = {column: [] for column in columns}
+    for row in rows:
+        if xs and xs[-1] == row[key]:
+            continue
+        xs.append(row[key])
+        for column in columns:
+            ys[column].append(row[column])
+    return _readonly_array(xs), {
+        column: _readonly_array(values) for column, values in ys.items()
+    }
+
+
+def _readonly_array(values):
+    # arrays are shared through the ormcache, they must never be modified
+    array = np.array(values, dtype=float)
+    array.setflags(write=False)
+    return array
+
+
+class SoundingBookCurves:
+    """
+    Sounding rows of one (company, tank, table type), sorted per trim/heel
+    value, with a memo of the most recent lookups.
+    """
+
+    __slots__ = ("table_values", "curves", "memo")
+
+    def __init__(self, rows):
+        rows_by_table_value = defaultdict(list)
+        for row in rows:
+            rows_by_table_value[round_value(row["table_value"])].append(row)
+
+        self.table_values = tuple(sorted(rows_by_table_value))
+        self.curves = tuple(
+            {
+                "volume": _build_curve(
+                    rows_by_table_value[table_value], "volume", ("sound", "ullage")
+                ),
+                "sound": _build_curve(
+                    rows_by_table_value[table_value], "sound", ("volume",)
+                ),
+                "ullage": _build_curve(
+                    rows_by_table_value[table_value], "ullage", ("volume",)
+                ),
+            }
+            for table_value in self.table_values
+        )
+        self.memo = LRU(CONST.SOUNDING_MEMO_SIZE)
+
+    def _interpolate_on_curve(self, index, key, column, xs):
+        curve_xs, curve_ys = self.curves[index][key]
+        return interpolate(curve_xs, curve_ys[column], xs)
+
+    def interpolate(self, table_value, key, column, xs):
+        """
+        Bilinear lookup: interpolate every value of ``xs`` on the two curves
+        surrounding ``table_value``, then interpolate linearly between them.
+        :return: an array shaped like ``xs``, NaN where no value can be found
+        """
+        table_values = self.table_values
+        index = bisect_left(table_values, table_value)
+        if index < len(table_values) and table_values[index] == table_value:
+            return self._interpolate_on_curve(index, key, column, xs)
+        if index == 0 or index == len(table_values):
+            return np.full(np.shape(xs), np.nan)
+
+        low_table_value, high_table_value = table_values[index - 1 : index + 1]
+        low_values = self._interpolate_on_curve(index - 1, key, column, xs)
+        high_values = self._interpolate_on_curve(index, key, column, xs)
+        return low_values + (table_value - low_table_value) * (
+            high_values - low_values
+        ) / (high_table_value - low_table_value)
+
+    def lookup(self, table_value, key, column, xs):
+        """
+        Same as :meth:`interpolate`, answering from the memo when possible
+        :param xs: a list of rounded values
+        """
+        results = np.empty(len(xs))
+        missing = []
+        for position, x in enumerate(xs):
+            value = self.memo.get((table_value, key, column, x))
+            if value is None:
+                missing.append(position)
+            else:
+                results[position] = value
+
+        if missing:
+            missing_xs = [xs[position] for position in missing]
+            values = self.interpolate(table_value, key, column, missing_xs)
+            results[missing] = values
+            for x, value in zip(missing_xs, values.tolist()):
+                self.memo[(table_value, key, column, x)] = value
+        return results
+
+
+class SoundingEngine(models.AbstractModel):
+    _name = "ship.sounding.engine"
+    _description = "Sounding table calculation engine"
+
+    @ormcache("company_id", "tank_name", "table_type")
+    def _get_sounding_book_curves(self, company_id, tank_name, table_type):
+        """
+        Load every sounding row of a tank once, so lookups never hit the
+        database again until a sounding book or table is modified.
+        """
+        rows = (
+            self.env["ship.sounding.table"]
+            .sudo()
+            .search_read(
+                [
+                    ("sounding_book_id.company_id", "=", company_id),
+                    ("sounding_book_id.tank_name", "=", tank_name),
+                    ("sounding_book_id.table_type", "=", table_type),
+                ],
+                ["table_value", "sound", "ullage", "volume"],
+            )
+        )
+        return SoundingBookCurves(rows)
+
+    def _lookup(self, company_id, tank_name, table_type, table_value, key, xs, column):
+        if not tank_name or not company_id:
+            return np.full(len(xs), np.nan)
+        book_curves = self._get_sounding_book_curves(company_id, tank_name, table_type)
+        return book_curves.lookup(round_value(table_value), key, column, xs)
+
+    def _group_positions(self, keys):
+        positions_by_key = defaultdict(list)
+        for position, key in enumerate(keys):
+            positions_by_key[key].append(position)
+        return positions_by_key
+
+    def measurements_for(self, lines, volumes, trims=CONST.SOUNDING_TRIMS):
+        """
+        :param lines: records having company_id, tank_name and measure_type
+        :param volumes: the volume (m3) of each line
+        :param trims: trims (m) to compute the measurements at
+        :return: for each line, the list of its sound/ullage (m) at each trim,
+            0 when not found
+        """
+        volumes = [round_value(volume) for volume in volumes]
+        results = np.zeros((len(volumes), len(trims)))
+        positions_by_key = self._group_positions(
+            (line.company_id.id, line.tank_name, line.measure_type) for line in lines
+        )
+        for key, positions in positions_by_key.items():
+            company_id, tank_name, measure_type = key
+            if measure_type not in ("sound", "ullage"):
+                continue
+            group_volumes = [volumes[position] for position in positions]
+            for column, trim in enumerate(trims):
+                results[positions, column] = self._lookup(
+                    company_id,
+                    tank_name,
+                    "trim",
+                    trim,
+                    "volume",
+                    group_volumes,
+                    measure_type,
+                )
+        return [
+            [round_value(value) for value in row]
+            for row in np.nan_to_num(results).tolist()
+        ]
+
+    def volumes_for(self, tanks, measurements, trim, heel):
+        """
+        :param tanks: records having company_id, tank_name and measure_type
+        :param measurements: the sound/ullage (m) of each tank
+        :param trim: the trim (m), a number or a list with one trim per tank
+        :param heel: the heel, a number or a list with one heel per tank
+        :return: for each tank, its volume (m3), i.e. the trim table volume
+            plus the heel table volume, 0 when not found
+        """
+        count = len(measurements)
+        measurements = [round_value(measurement) for measurement in measurements]
+        trims = np.broadcast_to(np.asarray(trim, dtype=float), (count,)).tolist()
+        heels = np.broadcast_to(np.asarray(heel, dtype=float), (count,)).tolist()
+        results = np.zeros(count)
+        positions_by_key = self._group_positions(
+            (
+                tank.company_id.id,
+                tank.tank_name,
+                "ullage" if tank.measure_type == "ullage" else "sound",
+                round_value(tank_trim),
+                round_value(tank_heel),
+            )
+            for tank, tank_trim, tank_heel in zip(tanks, trims, heels)
+        )
+        for key, positions in positions_by_key.items():
+            company_id, tank_name, measure_type, group_trim, group_heel = key
+            group_measurements = [measurements[position] for position in positions]
+            trim_volumes = self._lookup(
+                company_id,
+                tank_name,
+                "trim",
+                group_trim,
+                measure_type,
+                group_measurements,
+                "volume",
+            )
+            heel_volumes = self._lookup(
+                company_id,
+                tank_name,
+                "heel",
+                group_heel,
+                measure_type,
+                group_measurements,
+                "volume",
+            )
+            results[positions] = np.nan_to_num(trim_volumes) + np.nan_to_num(
+                heel_volumes
+            )
+        return [round_value(value) for value in results.tolist()]
@@ -10,7 +10,7 @@ from . import CONST
 class Supplier(models.Model):
     _name = "ship.supplier"
     _description = "Supplier records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
 
     name = fields.Char("Name", required=True, tracking=True)
     email = fields.Char("Email", required=True, tracking=True)
@@ -46,12 +46,11 @@ class Supplier(models.Model):
     port_ids = fields.One2many("ship.port", "supplier_id", string="Job", tracking=True)
 
     # sequential
-    ref = fields.Char(string="Code", default=lambda self: _("New"))
+    ref = fields.Char(string="Code", default=lambda self: _("New"), index=True)
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.supplier")
+        self._fill_sequence_refs(vals_list, "ship.supplier")
         return super(Supplier, self).create(vals_list)
 
     def name_get(self):
@@ -84,7 +83,7 @@ class Supplier(models.Model):
 
         return result
 
-    def action_refresh_all_supplier_quote_portal_access_token(self):
+    def action_refresh_supplier_quote_portal_access_token(self):
         for record in self.search([]):
             record.access_token = generate_token()
 
@@ -129,15 +128,13 @@ class Supplier(models.Model):
             ).id
 
             base_url = self.env["ir.config_parameter"].sudo().get_param("web.base.url")
-            params = f"supplier_ref={self.ref}&access_token={self.access_token}"
-            portal_access_url = (
-                f"{base_url}/material-paint-quotes/{quote_req_ref}?{params}"
-            )
-
             context = {
                 "supplier_name": self.name,
-                "quote_req_deadline": quote_req_deadline,
-                "portal_access_url": portal_access_url,
+                "quote_requests": [
+                    self._get_quote_portal_change_values(
+                        base_url, quote_req_ref, quote_req_deadline
+                    )
+                ],
             }
             email_values = {
                 "email_to": self.email,
@@ -149,6 +146,17 @@ class Supplier(models.Model):
             logging.error(e)
             raise e
 
+    def _get_quote_portal_change_values(
+        self, base_url, quote_req_ref, quote_req_deadline
+    ):
+        self.ensure_one()
+        params = f"supplier_ref={self.ref}&access_token={self.access_token}"
+        return {
+            "quote_req_ref": quote_req_ref,
+            "quote_req_deadline": quote_req_deadline,
+            "portal_access_url": f"{base_url}/material-paint-quotes/{quote_req_ref}?{params}",
+        }
+
     # def send_email_notify_fuel_quote_portal_change(self):
     #     self.ensure_one()
     #     try:
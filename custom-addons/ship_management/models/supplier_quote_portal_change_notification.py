@@ -49,20 +49,39 @@ class SupplierQuotePortalChangeNotification(models.Model):
             record.supplier_name = record.supplier_id.name
 
     def send_email_notify_quote_portal_change(self):
-        self.ensure_one()
-        self.is_notified = True
-        try:
-            quote_req_ref = self.material_paint_quotes_request_id.ref
-            quote_req_deadline = format_field_date(
-                self.material_paint_quotes_request_id.deadline
+        """
+        Send one mail per supplier listing the quotes requests of its
+        notifications, and mark the notifications of the mailed suppliers
+        as notified.
+        """
+        rfq_mail = self.env["ship.rfq.mail"]
+        template = self.env.ref(
+            "ship_management.email_notify_supplier_quote_portal_change"
+        )
+        base_url = rfq_mail._get_base_url()
+
+        values_by_supplier = {}
+        for record in self:
+            supplier = record.supplier_id
+            values = values_by_supplier.setdefault(
+                supplier,
+                {
+                    "email_to": supplier.email,
+                    "supplier_name": supplier.name,
+                    "quote_requests": [],
+                },
             )
-            self.supplier_id.send_email_notify_quote_portal_change(
-                quote_req_ref, quote_req_deadline
+            quote_request = record.material_paint_quotes_request_id
+            quote_request_values = supplier._get_quote_portal_change_values(
+                base_url, quote_request.ref, format_field_date(quote_request.deadline)
             )
-            self.notified_at = fields.Datetime.now()
-        except Exception as e:
-            self.is_notified = False
-            raise e
+            if quote_request_values not in values["quote_requests"]:
+                values["quote_requests"].append(quote_request_values)
+
+        notified_suppliers = rfq_mail._send_batch(template, values_by_supplier)
+        self.filtered(lambda record: record.supplier_id in notified_suppliers).write(
+            {"is_notified": True, "notified_at": fields.Datetime.now()}
+        )
 
     def get_unsent_notifications(self, age_stale_in_days=1):
         """
@@ -74,6 +93,4 @@ class SupplierQuotePortalChangeNotification(models.Model):
         """
         Send batch email notifications for unsent notifications.
         """
-        unsent_notifications = self.get_unsent_notifications()
-        for unsent_notification in unsent_notifications:
-            unsent_notification.send_email_notify_quote_portal_change()
+        self.get_unsent_notifications().send_email_notify_quote_portal_change()
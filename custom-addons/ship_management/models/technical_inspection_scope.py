@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class TechnicalInspectionScope(models.Model):
     _name = "ship.technical.inspection.scope"
     _description = "Technical inspection scope records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char(
@@ -54,9 +54,7 @@ class TechnicalInspectionScope(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.technical.inspection.scope"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.technical.inspection.scope")
         result = super(TechnicalInspectionScope, self).create(vals_list)
 
         for record in result:
@@ -10,7 +10,7 @@ from odoo.exceptions import ValidationError
 class TechnicalInspectionTask(models.Model):
     _name = "ship.technical.inspection.task"
     _description = "Technical inspection task records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     # related
@@ -92,9 +92,7 @@ class TechnicalInspectionTask(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.technical.inspection.task"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.technical.inspection.task")
 
         result = super(TechnicalInspectionTask, self).create(vals_list)
         return result
@@ -8,7 +8,7 @@ from . import CONST
 class TechnicalInspectionTaskMetadata(models.Model):
     _name = "ship.technical.inspection.task.metadata"
     _description = "Technical inspection task metadata records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     name = fields.Char("Name", tracking=True)
@@ -37,9 +37,7 @@ class TechnicalInspectionTaskMetadata(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "ship.technical.inspection.task.metadata"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "ship.technical.inspection.task.metadata")
         return super(TechnicalInspectionTaskMetadata, self).create(vals_list)
 
     def name_get(self):
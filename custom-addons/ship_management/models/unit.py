@@ -8,7 +8,7 @@ from . import CONST
 class Unit(models.Model):
     _name = "ship.unit"
     _description = "Unit records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
 
     name = fields.Char("Name", tracking=True)
     description = fields.Char("Description", tracking=True)
@@ -41,8 +41,7 @@ class Unit(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.unit")
+        self._fill_sequence_refs(vals_list, "ship.unit")
         return super(Unit, self).create(vals_list)
 
     def name_get(self):
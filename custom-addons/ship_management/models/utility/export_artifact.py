@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import base64
+import hashlib
+import io
+import zipfile
+from datetime import timedelta
+
+from odoo import api, fields, models
+from .. import CONST
+
+
+class ExportArtifact(models.Model):
+    _name = "ship.export.artifact"
+    _description = "Export artifact records"
+    _order = "expires_at"
+
+    name = fields.Char("File name", required=True)
+    checksum = fields.Char("Checksum", required=True, index=True)
+    res_model = fields.Char("Resource model", required=True)
+    res_id = fields.Many2oneReference(
+        "Resource id", model_field="res_model", required=True
+    )
+    expires_at = fields.Datetime("Expires at", required=True, index=True)
+
+    # relations
+    attachment_id = fields.Many2one(
+        "ir.attachment", string="Attachment", required=True, ondelete="cascade"
+    )
+
+    def _get_expiration_date(self):
+        return fields.Datetime.now() + timedelta(hours=CONST.EXPORT_ARTIFACT_TTL_HOURS)
+
+    def _get_checksum(self, binary_data):
+        """
+        Checksum of the content of an export. The members of an xlsx are
+        hashed without their zip timestamps and without the document
+        properties, openpyxl writes the save time in both, so exporting the
+        same data twice gives the same checksum.
+        """
+        buffer = io.BytesIO(binary_data)
+        if not zipfile.is_zipfile(buffer):
+            return hashlib.sha256(binary_data).hexdigest()
+
+        digest = hashlib.sha256()
+        with zipfile.ZipFile(buffer) as archive:
+            for name in sorted(archive.namelist()):
+                if name in CONST.EXPORT_VOLATILE_MEMBERS:
+                    continue
+                content = archive.read(name)
+                digest.update(f"{name}\0{len(content)}\0".encode())
+                digest.update(content)
+        return digest.hexdigest()
+
+    def _store(self, record, filename, binary_data, res_field="custom_export"):
+        """
+        Store an exported file of the record. An identical export that has
+        not expired yet is served from its existing attachment.
+        :return: the attachment of the file
+        """
+        checksum = self._get_checksum(binary_data)
+        artifact = self.sudo().search(
+            [
+                ("checksum", "=", checksum),
+                ("name", "=", filename),
+                ("res_model", "=", record._name),
+                ("res_id", "=", record.id),
+            ],
+            limit=1,
+        )
+        if artifact:
+            artifact.expires_at = self._get_expiration_date()
+            return artifact.attachment_id
+
+        attachment = self.env["ir.attachment"].create(
+            {
+                "name": filename,
+                "type": "binary",
+                "datas": base64.b64encode(binary_data),
+                "res_model": record._name,
+                "res_id": record.id,
+                "public": True,
+                "res_field": res_field,
+            }
+        )
+        self.sudo().create(
+            {
+                "name": filename,
+                "checksum": checksum,
+                "res_model": record._name,
+                "res_id": record.id,
+                "expires_at": self._get_expiration_date(),
+                "attachment_id": attachment.id,
+            }
+        )
+        return attachment
+
+    @api.model
+    def _cron_vacuum_expired_artifacts(self):
+        """
+        Delete the expired exports in bulk, and the export attachments made
+        before the artifact store. The files are reclaimed by the filestore
+        garbage collector.
+        """
+        now = fields.Datetime.now()
+        self.env.cr.execute(
+            """
+            SELECT attachment_id FROM ship_export_artifact WHERE expires_at <= %s
+            UNION
+            SELECT attachment.id FROM ir_attachment attachment
+            WHERE attachment.res_field IN %s
+                AND attachment.create_date <= %s
+                AND NOT EXISTS (
+                    SELECT 1 FROM ship_export_artifact artifact
+                    WHERE artifact.attachment_id = attachment.id
+                )
+            """,
+            [
+                now,
+                tuple(CONST.EXPORT_ATTACHMENT_FIELDS),
+                now - timedelta(hours=CONST.EXPORT_ARTIFACT_TTL_HOURS),
+            ],
+        )
+        attachment_ids = [row[0] for row in self.env.cr.fetchall()]
+        # the artifacts are deleted in cascade
+        self.env["ir.attachment"].sudo().browse(attachment_ids).unlink()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import base64
+import binascii
+
+from odoo import api, fields, models, tools
+from odoo.exceptions import UserError
+from odoo.tools.image import ImageProcess
+from .. import CONST
+
+
+class ImageMixin(models.AbstractModel):
+    _name = "ship.image.mixin"
+    _description = "Downscaled photo with its variants"
+
+    image = fields.Image(
+        "Image", max_width=CONST.IMAGE_MAX_SIZE, max_height=CONST.IMAGE_MAX_SIZE
+    )
+    # stored as their own attachments, lists and previews never load the
+    # full image
+    image_512 = fields.Image(
+        "Image 512", related="image", max_width=512, max_height=512, store=True
+    )
+    image_128 = fields.Image(
+        "Image 128", related="image", max_width=128, max_height=128, store=True
+    )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if vals.get("image"):
+                vals["image"] = self._prepare_image(vals["image"])
+        return super(ImageMixin, self).create(vals_list)
+
+    def write(self, vals):
+        if vals.get("image"):
+            vals = dict(vals, image=self._prepare_image(vals["image"]))
+        return super(ImageMixin, self).write(vals)
+
+    @api.model
+    def _prepare_image(self, value):
+        """
+        Downscale a photo and drop its EXIF metadata (GPS position, camera,
+        thumbnail) in a single encoding. The orientation of the EXIF is
+        applied to the pixels first. An image already small and without
+        metadata is kept as it is, so copying an image does not encode it
+        again.
+        :param value: the base64 content of the image
+        :return: the base64 content to store
+        """
+        try:
+            image = ImageProcess(base64.b64decode(value), verify_resolution=True)
+        except (binascii.Error, UserError):
+            # not an image, the field raises the error
+            return value
+        if not image.image:
+            return value
+
+        width, height = image.image.size
+        if (
+            "exif" not in image.image.info
+            and max(width, height) <= CONST.IMAGE_MAX_SIZE
+        ):
+            return value
+
+        image.resize(CONST.IMAGE_MAX_SIZE, CONST.IMAGE_MAX_SIZE)
+        quality = CONST.IMAGE_JPEG_QUALITY if image.original_format == "JPEG" else 0
+        return base64.b64encode(image.image_quality(quality=quality))
+
+    def _init_image_variants(self):
+        """
+        Downscale the images stored before the variants and make their
+        variants. The variants have no column, so the update does not
+        compute them for the existing records. Only the records whose
+        image has no 128px variant yet are processed.
+        """
+        self.env.cr.execute(
+            """
+            SELECT image.res_id FROM ir_attachment image
+            WHERE image.res_model = %s
+                AND image.res_field = 'image'
+                AND NOT EXISTS (
+                    SELECT 1 FROM ir_attachment variant
+                    WHERE variant.res_model = image.res_model
+                        AND variant.res_id = image.res_id
+                        AND variant.res_field = 'image_128'
+                )
+            ORDER BY image.res_id
+            """,
+            [self._name],
+        )
+        res_ids = [row[0] for row in self.env.cr.fetchall()]
+        variant_fields = [self._fields["image_512"], self._fields["image_128"]]
+        for batch_ids in tools.split_every(CONST.IMAGE_INIT_BATCH_SIZE, res_ids):
+            records = self.browse(batch_ids).exists()
+            for record in records:
+                image = record._prepare_image(record.image)
+                if image != record.image:
+                    record.image = image
+            for field in variant_fields:
+                self.env.add_to_compute(field, records)
+            self.env.flush_all()
+            self.env.invalidate_all()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo import fields, models
+
+
+class PendingWork(models.Model):
+    _name = "ship.pending.work"
+    _description = "Pending work records"
+    _order = "id"
+    # every node works its own queue
+    _replicate = False
+
+    queue = fields.Char("Queue", required=True, index=True)
+    res_id = fields.Integer("Record id", required=True)
+
+    _sql_constraints = [
+        (
+            "unique_queue_res_id",
+            "unique (queue, res_id)",
+            "A record can only be pending once per queue.",
+        ),
+    ]
+
+    def _enqueue(self, queue, records):
+        """
+        Mark the records as pending for the queue, a record already pending
+        is kept once.
+        """
+        if not records:
+            return
+        self.env.cr.execute(
+            """
+            INSERT INTO ship_pending_work (queue, res_id)
+            SELECT %s, unnest(%s)
+            ON CONFLICT (queue, res_id) DO NOTHING
+            """,
+            [queue, list(records.ids)],
+        )
+
+    def _pop(self, queue, model_name, limit=None):
+        """
+        Take the pending records of the queue out of it. The records are
+        pending again if the transaction is rolled back, parallel workers
+        never take the same records.
+        :return: the existing records of ``model_name``
+        """
+        self.env.cr.execute(
+            """
+            DELETE FROM ship_pending_work WHERE id IN (
+                SELECT id FROM ship_pending_work
+                WHERE queue = %s
+                ORDER BY id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING res_id
+            """,
+            [queue, limit],
+        )
+        res_ids = [row[0] for row in self.env.cr.fetchall()]
+        return self.env[model_name].browse(res_ids).exists()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+
+from odoo import models
+
+_logger = logging.getLogger(__name__)
+
+
+class RfqMail(models.AbstractModel):
+    _name = "ship.rfq.mail"
+    _description = "Batched supplier mails"
+
+    def _get_base_url(self):
+        return self.env["ir.config_parameter"].sudo().get_param("web.base.url")
+
+    def _send_batch(self, template, values_by_record):
+        """
+        Queue one mail per record, the template is rendered for all the
+        records at once. The values of a record are read by the template
+        through ``ctx["rfq_mail_values"][object.id]``, they must contain the
+        ``email_to`` of the mail.
+        A record failing to render or to queue is logged and skipped, the
+        other mails are still queued.
+        :param template: a mail.template of the model of the records
+        :param values_by_record: {record: values}
+        :return: the records whose mail is queued
+        """
+        values_by_id = {
+            record.id: values for record, values in values_by_record.items()
+        }
+        template = template.with_context(rfq_mail_values=values_by_id)
+
+        mail_values_by_id = {}
+        self._run_in_savepoints(
+            list(values_by_id),
+            lambda res_ids: mail_values_by_id.update(
+                self._render_mails(template, res_ids)
+            ),
+        )
+        for res_id, mail_values in mail_values_by_id.items():
+            mail_values["email_to"] = values_by_id[res_id]["email_to"]
+
+        queued_ids = self._run_in_savepoints(
+            list(mail_values_by_id),
+            lambda res_ids: self.env["mail.mail"]
+            .sudo()
+            .create([mail_values_by_id[res_id] for res_id in res_ids]),
+        )
+        return self.env[template.model].browse(queued_ids)
+
+    def _render_mails(self, template, res_ids):
+        subjects = template._render_field("subject", res_ids)
+        bodies = template._render_field("body_html", res_ids, post_process=True)
+        email_froms = (
+            template._render_field("email_from", res_ids) if template.email_from else {}
+        )
+
+        mail_values_by_id = {}
+        for res_id in res_ids:
+            mail_values = {
+                "subject": subjects[res_id],
+                "body_html": bodies[res_id],
+                "model": template.model,
+                "res_id": res_id,
+                "auto_delete": template.auto_delete,
+                "mail_server_id": template.mail_server_id.id,
+            }
+            if email_froms.get(res_id):
+                mail_values["email_from"] = email_froms[res_id]
+            mail_values_by_id[res_id] = mail_values
+        return mail_values_by_id
+
+    def _run_in_savepoints(self, res_ids, func):
+        """
+        Call ``func`` on all the ids in one savepoint, when it fails call it
+        again on each id in its own savepoint.
+        :return: the ids for which ``func`` succeeded
+        """
+        if not res_ids:
+            return []
+        try:
+            with self.env.cr.savepoint():
+                func(res_ids)
+            return res_ids
+        except Exception:
+            if len(res_ids) == 1:
+                _logger.exception("Supplier mail of record %s failed", res_ids[0])
+                return []
+
+        done_ids = []
+        for res_id in res_ids:
+            done_ids += self._run_in_savepoints([res_id], func)
+        return done_ids
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import io
+import os
+import pickle
+import threading
+
+from openpyxl import load_workbook
+
+from odoo import models
+from odoo.exceptions import UserError
+from .. import CONST
+
+# {template path: (mtime, pickled workbook)}, shared by every worker thread
+_template_cache = {}
+_template_cache_lock = threading.Lock()
+
+
+class XlsxTemplate(models.AbstractModel):
+    _name = "ship.xlsx.template"
+    _description = "XLSX template rendering"
+
+    def _load_template(self, template_name):
+        """
+        Parse a template of the report template directory once per file
+        version, every call gets its own copy of the parsed workbook.
+        :param template_name: the file name, e.g. "pms.xlsx"
+        :return: an openpyxl workbook
+        """
+        template_path = os.path.join(CONST.REPORT_TEMPLATE_DIR, template_name)
+        try:
+            mtime = os.stat(template_path).st_mtime
+            with _template_cache_lock:
+                cached = _template_cache.get(template_path)
+            if not cached or cached[0] != mtime:
+                workbook = load_workbook(template_path)
+                cached = (mtime, pickle.dumps(workbook, pickle.HIGHEST_PROTOCOL))
+                with _template_cache_lock:
+                    _template_cache[template_path] = cached
+            return pickle.loads(cached[1])
+        except Exception as e:
+            raise UserError(f"Error loading the template: {str(e)}")
+
+    def _insert_rows(self, worksheet, row, amount):
+        """
+        Make room for ``amount`` rows at ``row`` with a single shift of the
+        rows below, instead of one shift per inserted row.
+        """
+        if amount > 0:
+            worksheet.insert_rows(row, amount)
+
+    def _save_workbook(self, workbook):
+        """
+        :return: the content of the workbook as xlsx bytes
+        """
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return buffer.getvalue()
+
+    def _get_export_action(
+        self, record, filename, binary_data, res_field="custom_export"
+    ):
+        """
+        Store the exported file for the record
+        :return: an action downloading the file
+        """
+        attachment = self.env["ship.export.artifact"]._store(
+            record, filename, binary_data, res_field
+        )
+
+        return {
+            "name": filename,
+            "type": "ir.actions.act_url",
+            "url": f"/web/content/{attachment.id}/{filename}",
+            "target": "self",
+        }
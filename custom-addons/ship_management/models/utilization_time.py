@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError
 class UtilizationTime(models.Model):
     _name = "ship.utilization.time"
     _description = "UtilizationTime records"
-    _inherit = ["ship.date", "utilities.notification"]
+    _inherit = ["ship.date", "utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     utilization_time = fields.Integer("Utilization time", default=0, tracking=True)
@@ -67,8 +67,7 @@ class UtilizationTime(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            vals["ref"] = self.env["ir.sequence"].next_by_code("ship.utilization.time")
+        self._fill_sequence_refs(vals_list, "ship.utilization.time")
 
         result = super(UtilizationTime, self).create(vals_list)
 
@@ -22,14 +22,9 @@ class MaintenanceScopeReportXlsx(models.AbstractModel):
         # Function to adjust merged cells after inserting rows
 
         # Load the custom XLSX template
-        template_path = (
-            "/mnt/extra-addons/report_template/pms.xlsx"  # Replace with the actual path
-        )
-        try:
-            workbook = load_workbook(template_path)
-            worksheet = workbook.active
-        except Exception as e:
-            raise ValidationError(f"Error loading the template: {str(e)}")
+        xlsx_template = self.env["ship.xlsx.template"]
+        workbook = xlsx_template._load_template("pms.xlsx")
+        worksheet = workbook.active
 
         ###
 
@@ -70,8 +65,8 @@ class MaintenanceScopeReportXlsx(models.AbstractModel):
             row = 6
             index = 0
             worksheet = workbook[department_name]
+            xlsx_template._insert_rows(worksheet, row, len(pms_data_dep))
             for maintainance_data in pms_data_dep:
-                worksheet.insert_rows(row)
                 index += 1
                 worksheet.cell(row=row, column=1, value=index)
                 worksheet.cell(
@@ -135,54 +130,21 @@ class MaintenanceScopeReportXlsx(models.AbstractModel):
                     )
                 row += 1
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_file:
-            # Save the modified XLSX file to the temporary file
-            border_style = Border(
-                left=Side(border_style="thin"),
-                right=Side(border_style="thin"),
-                top=Side(border_style="thin"),
-                bottom=Side(border_style="thin"),
-            )
-            worksheet_name = ["Boong", "Máy"]
-            for ws in worksheet_name:
-                worksheet = workbook[ws]
-                for row in range(6, index + 1):
-                    for col in range(1, 19):
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.border = border_style
-
-            workbook.save(temp_file.name)
-
-            # Load the saved XLSX file for further processing
-            temp_workbook = load_workbook(temp_file.name)
-            temp_worksheet = temp_workbook.active
-
-            # Save the modified workbook back to the temporary file
-            temp_workbook.save(temp_file.name)
+        border_style = Border(
+            left=Side(border_style="thin"),
+            right=Side(border_style="thin"),
+            top=Side(border_style="thin"),
+            bottom=Side(border_style="thin"),
+        )
+        worksheet_name = ["Boong", "Máy"]
+        for ws in worksheet_name:
+            worksheet = workbook[ws]
+            for row in range(6, index + 1):
+                for col in range(1, 19):
+                    cell = worksheet.cell(row=row, column=col)
+                    cell.border = border_style
 
-        # Read the temporary XLSX file as binary data
-        with open(temp_file.name, "rb") as file:
-            binary_data = file.read()
+        binary_data = xlsx_template._save_workbook(workbook)
 
-        # Create an attachment
         filename = f"Kế hoạch PMS.xlsx"
-        attachment = self.env["ir.attachment"].create(
-            {
-                "name": filename,
-                "type": "binary",
-                "datas": base64.b64encode(binary_data),
-                "res_model": report_id._name,
-                "res_id": report_id.id,
-                "public": True,
-                "res_field": "custom_export",  # Replace with the appropriate field name
-            }
-        )
-
-        action = {
-            "name": filename,
-            "type": "ir.actions.act_url",
-            "url": f"/web/content/{attachment.id}/{filename}",
-            "target": "self",
-        }
-        # Return an action to open the attachment
-        return action
+        return xlsx_template._get_export_action(report_id, filename, binary_data)
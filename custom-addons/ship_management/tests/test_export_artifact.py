@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import io
+import re
+import zipfile
+
+from openpyxl import Workbook
+
+from odoo.tests import common
+
+
+class TestExportArtifact(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.artifact_model = self.env["ship.export.artifact"]
+        self.xlsx_template = self.env["ship.xlsx.template"]
+        self.record = self.env.company
+
+    def _export(self, value):
+        workbook = Workbook()
+        workbook.active["A1"] = value
+        return self.xlsx_template._save_workbook(workbook)
+
+    def _save_later(self, binary_data):
+        """
+        :return: the same export as saved at another time, with other zip
+            timestamps and another modified date
+        """
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(binary_data)) as source, zipfile.ZipFile(
+            buffer, "w", zipfile.ZIP_DEFLATED
+        ) as target:
+            for info in source.infolist():
+                content = source.read(info.filename)
+                if info.filename == "docProps/core.xml":
+                    content = re.sub(
+                        rb"<dcterms:modified([^>]*)>[^<]*<",
+                        rb"<dcterms:modified\1>2000-01-01T00:00:00Z<",
+                        content,
+                    )
+                info.date_time = (2000, 1, 1, 0, 0, 0)
+                target.writestr(info, content)
+        return buffer.getvalue()
+
+    def _get_artifacts(self):
+        return self.artifact_model.search(
+            [("res_model", "=", self.record._name), ("res_id", "=", self.record.id)]
+        )
+
+    def test_same_export_is_stored_once(self):
+        binary_data = self._export("value")
+        later_binary_data = self._save_later(binary_data)
+        self.assertNotEqual(binary_data, later_binary_data)
+
+        attachment = self.artifact_model._store(self.record, "a.xlsx", binary_data)
+        later_attachment = self.artifact_model._store(
+            self.record, "a.xlsx", later_binary_data
+        )
+        self.assertEqual(attachment, later_attachment)
+        self.assertEqual(len(self._get_artifacts()), 1)
+
+    def test_other_export_is_stored_again(self):
+        attachment = self.artifact_model._store(
+            self.record, "a.xlsx", self._export("value")
+        )
+        other_attachment = self.artifact_model._store(
+            self.record, "a.xlsx", self._export("other value")
+        )
+        self.assertNotEqual(attachment, other_attachment)
+        self.assertEqual(len(self._get_artifacts()), 2)
@@ -1,2 +1,3 @@
 from . import create_utilization_time_wiz
 from . import export_report
+from . import sounding_book_import_wiz
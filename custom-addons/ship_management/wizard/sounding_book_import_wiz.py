@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import base64
+import csv
+import io
+
+from openpyxl import load_workbook
+
+from odoo import fields, models, _
+from ..models import CONST
+from odoo.exceptions import UserError, ValidationError
+
+STAGING_TABLE = "ship_sounding_table_staging"
+SOUNDING_COLUMNS = ["table_value", "sound", "ullage", "volume"]
+
+
+class SoundingBookImportWiz(models.TransientModel):
+    _name = "ship.sounding.book.import.wiz"
+    _description = "Sounding book import wiz records"
+
+    file = fields.Binary("File", required=True)
+    file_name = fields.Char("File name")
+
+    # relations
+    sounding_book_id = fields.Many2one(
+        "ship.sounding.book", string="Sounding Book", required=True
+    )
+
+    def action_import(self):
+        """
+        Replace the sounding table of the book by the rows of the file:
+        the rows are copied into a staging table, validated with set-based
+        queries, then swapped in within the current transaction.
+        """
+        self.ensure_one()
+        SoundingTable = self.env["ship.sounding.table"]
+        SoundingTable.check_access_rights("create")
+        SoundingTable.check_access_rights("unlink")
+        self.sounding_book_id.check_access_rule("write")
+
+        self._create_staging_table()
+        self._copy_rows_to_staging_table()
+        self._validate_staging_table()
+        self._swap_sounding_table()
+        return {"type": "ir.actions.act_window_close"}
+
+    def _get_rows(self):
+        content = base64.b64decode(self.file)
+        file_name = (self.file_name or "").lower()
+        if file_name.endswith(".xlsx"):
+            workbook = load_workbook(
+                io.BytesIO(content), read_only=True, data_only=True
+            )
+            rows = workbook.active.iter_rows(values_only=True)
+        elif file_name.endswith(".csv"):
+            rows = csv.reader(io.StringIO(content.decode("utf-8-sig")))
+        else:
+            raise UserError(_("Only .csv and .xlsx files can be imported."))
+
+        header = [str(cell or "").strip().lower() for cell in next(rows, [])]
+        missing_columns = set(SOUNDING_COLUMNS) - set(header)
+        if missing_columns:
+            raise UserError(
+                _("Missing columns in the file: %s")
+                % ", ".join(sorted(missing_columns))
+            )
+        positions = [header.index(column) for column in SOUNDING_COLUMNS]
+        for row in rows:
+            if not any(cell not in (None, "") for cell in row):
+                continue
+            yield [
+                row[position] if position < len(row) else None for position in positions
+            ]
+
+    def _create_staging_table(self):
+        self.env.cr.execute(
+            f"""
+            DROP TABLE IF EXISTS {STAGING_TABLE};
+            CREATE TEMP TABLE {STAGING_TABLE} (
+                line integer,
+                table_value double precision,
+                sound double precision,
+                ullage double precision,
+                volume double precision
+            ) ON COMMIT DROP
+            """
+        )
+
+    def _copy_rows_to_staging_table(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # the header is line 1 of the file
+        for line, row in enumerate(self._get_rows(), start=2):
+            try:
+                values = [
+                    "" if cell in (None, "") else float(str(cell).replace(",", "."))
+                    for cell in row
+                ]
+            except ValueError:
+                raise ValidationError(_("Line %s: invalid number in %s") % (line, row))
+            writer.writerow([line] + values)
+        buffer.seek(0)
+        self.env.cr.copy_expert(
+            f"COPY {STAGING_TABLE} (line, {', '.join(SOUNDING_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+    def _validate_staging_table(self):
+        cr = self.env.cr
+        errors = []
+
+        cr.execute(f"SELECT count(*) FROM {STAGING_TABLE}")
+        if not cr.fetchone()[0]:
+            raise ValidationError(_("The file does not contain any sounding row."))
+
+        cr.execute(
+            f"""
+            SELECT line FROM {STAGING_TABLE}
+            WHERE table_value IS NULL OR sound IS NULL
+                OR ullage IS NULL OR volume IS NULL
+            ORDER BY line LIMIT %s
+            """,
+            [CONST.SOUNDING_IMPORT_MAX_ERRORS],
+        )
+        errors += [_("Line %s: missing value") % line for line, in cr.fetchall()]
+
+        cr.execute(
+            f"""
+            SELECT table_value, volume, array_agg(line ORDER BY line)
+            FROM {STAGING_TABLE}
+            GROUP BY table_value, volume
+            HAVING count(*) > 1
+            LIMIT %s
+            """,
+            [CONST.SOUNDING_IMPORT_MAX_ERRORS],
+        )
+        errors += [
+            _("Lines %s: duplicated volume %s for the value %s")
+            % (", ".join(map(str, lines)), volume, table_value)
+            for table_value, volume, lines in cr.fetchall()
+        ]
+
+        # when the volume grows, the sound must grow and the ullage must drop
+        cr.execute(
+            f"""
+            SELECT line, table_value FROM (
+                SELECT line, table_value, sound, ullage,
+                    lag(sound) OVER curve AS previous_sound,
+                    lag(ullage) OVER curve AS previous_ullage
+                FROM {STAGING_TABLE}
+                WINDOW curve AS (PARTITION BY table_value ORDER BY volume)
+            ) AS staging
+            WHERE sound < previous_sound OR ullage > previous_ullage
+            ORDER BY line LIMIT %s
+            """,
+            [CONST.SOUNDING_IMPORT_MAX_ERRORS],
+        )
+        errors += [
+            _("Line %s: the curve of the value %s is not monotonic")
+            % (line, table_value)
+            for line, table_value in cr.fetchall()
+        ]
+
+        if errors:
+            raise ValidationError("\n".join(errors))
+
+    def _swap_sounding_table(self):
+        SoundingTable = self.env["ship.sounding.table"]
+        SoundingTable.flush_model()
+        sounding_book_id = self.sounding_book_id
+        self.env.cr.execute(
+            "DELETE FROM ship_sounding_table WHERE sounding_book_id = %s",
+            [sounding_book_id.id],
+        )
+        self.env.cr.execute(
+            f"""
+            INSERT INTO ship_sounding_table (
+                sounding_book_id, company_id, table_value, sound, ullage, volume,
+                create_uid, write_uid, create_date, write_date
+            )
+            SELECT %(book_id)s, %(company_id)s, table_value, sound, ullage, volume,
+                %(uid)s, %(uid)s, now() at time zone 'UTC', now() at time zone 'UTC'
+            FROM {STAGING_TABLE}
+            ORDER BY table_value, volume
+            """,
+            {
+                "book_id": sounding_book_id.id,
+                "company_id": sounding_book_id.company_id.id,
+                "uid": self.env.uid,
+            },
+        )
+        SoundingTable.invalidate_model()
+        sounding_book_id.invalidate_recordset(["sounding_table_ids"])
+        self.env["ship.sounding.engine"].clear_caches()
@@ -51,3 +51,4 @@ fields.Selection.convert_to_cache = convert_to_cache
 
 
 from . import controllers
+from . import models
@@ -15,7 +15,7 @@ class Home(CustomerPortal):
             docking_plan_list = (
                 request.env["docking.docking.plan"]
                 .sudo()
-                .search([("supplier_emails", "ilike", supplier.email)])
+                .search([("supplier_ids", "in", supplier.id)])
             )
             vals = {
                 "docking_plan_list": docking_plan_list,
@@ -48,7 +48,7 @@ class Home(CustomerPortal):
                 .search(
                     [
                         ("ref", "=", list_ref),
-                        ("supplier_emails", "ilike", supplier.email),
+                        ("supplier_ids", "in", supplier.id),
                     ],
                     limit=1,
                 )
@@ -17,7 +17,7 @@ class Home(CustomerPortal):
             material_paint_quotes_list = (
                 request.env["ship.material.paint.quotes.request"]
                 .sudo()
-                .search([("supplier_emails", "ilike", supplier.email)])
+                .search([("supplier_ids", "in", supplier.id)])
             )
             vals = {
                 "material_paint_quotes_list": material_paint_quotes_list,
@@ -50,7 +50,7 @@ class Home(CustomerPortal):
                 .search(
                     [
                         ("ref", "=", list_ref),
-                        ("supplier_emails", "ilike", supplier.email),
+                        ("supplier_ids", "in", supplier.id),
                     ],
                     limit=1,
                 )
@@ -1,25 +1,86 @@
 from odoo.http import request
 import qrcode
 import base64
+import hmac
+import time
 from io import BytesIO
 
+from odoo.tools.lru import LRU
+
 SHIP_MANAGEMENT = "SHIP_MANAGEMENT"
 DOCKING = "DOCKING"
+SUPPLIER_MODELS = {
+    SHIP_MANAGEMENT: "ship.supplier",
+    DOCKING: "docking.supplier",
+}
+
+# validated tokens are kept for a short time so that the other workers see a
+# rotated token after at most ACCESS_TOKEN_CACHE_TTL seconds
+ACCESS_TOKEN_CACHE_TTL = 60
+# the refs come from the url, the least recently used entries are dropped so
+# random refs cannot grow the cache
+ACCESS_TOKEN_CACHE_SIZE = 1024
+# {(dbname, module, supplier_ref): (expires_at, supplier_id, access_token)}
+_access_token_cache = LRU(ACCESS_TOKEN_CACHE_SIZE)
+
+
+def _get_supplier_access_token(type, supplier_ref):
+    """
+    :return: the id and the access token of the supplier, from the cache when
+        possible. Unknown refs are never cached.
+    """
+    key = (request.env.cr.dbname, type, supplier_ref)
+    now = time.monotonic()
+    cached = _access_token_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1], cached[2]
+
+    supplier = (
+        request.env[SUPPLIER_MODELS[type]]
+        .sudo()
+        .search([("ref", "=", supplier_ref)], limit=1)
+    )
+    if supplier.access_token:
+        _access_token_cache[key] = (
+            now + ACCESS_TOKEN_CACHE_TTL,
+            supplier.id,
+            supplier.access_token,
+        )
+    elif cached:
+        _drop_cached_access_token(key)
+    return supplier.id, supplier.access_token
+
+
+def _drop_cached_access_token(key):
+    try:
+        _access_token_cache.pop(key)
+    except KeyError:
+        pass
+
+
+def invalidate_access_token_cache(dbname, type, supplier_refs):
+    for supplier_ref in supplier_refs:
+        _drop_cached_access_token((dbname, type, supplier_ref))
 
 
 def validate_access_token(type, get_params=False):
     params = request.get_http_params()
     access_token = params.get("access_token")
     supplier_ref = params.get("supplier_ref")
-    model = None
-
-    if type == SHIP_MANAGEMENT:
-        model = "ship.supplier"
-    elif type == DOCKING:
-        model = "docking.supplier"
 
-    supplier = request.env[model].sudo().search([("ref", "=", supplier_ref)])
-    is_validate = access_token == supplier.access_token
+    supplier_id, supplier_access_token = False, False
+    if supplier_ref:
+        supplier_id, supplier_access_token = _get_supplier_access_token(
+            type, supplier_ref
+        )
+    supplier = request.env[SUPPLIER_MODELS[type]].sudo().browse(supplier_id)
+    is_validate = bool(
+        access_token
+        and supplier_access_token
+        and hmac.compare_digest(
+            str(access_token).encode(), supplier_access_token.encode()
+        )
+    )
 
     if is_validate:
         if get_params:
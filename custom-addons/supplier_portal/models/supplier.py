@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo import models
+from ..help_func import invalidate_access_token_cache, SHIP_MANAGEMENT, DOCKING
+
+PORTAL_ACCESS_FIELDS = ("access_token", "ref")
+
+
+class PortalSupplierMixin(models.AbstractModel):
+    _name = "supplier.portal.supplier.mixin"
+    _description = "Supplier portal access token cache invalidation"
+
+    _portal_module = None
+
+    def _invalidate_portal_access_token_cache(self):
+        invalidate_access_token_cache(
+            self.env.cr.dbname, self._portal_module, set(self.mapped("ref"))
+        )
+
+    def write(self, vals):
+        if not any(field in vals for field in PORTAL_ACCESS_FIELDS):
+            return super().write(vals)
+
+        self._invalidate_portal_access_token_cache()
+        result = super().write(vals)
+        self._invalidate_portal_access_token_cache()
+        return result
+
+    def unlink(self):
+        self._invalidate_portal_access_token_cache()
+        return super().unlink()
+
+
+class ShipSupplier(models.Model):
+    _name = "ship.supplier"
+    _inherit = ["ship.supplier", "supplier.portal.supplier.mixin"]
+
+    _portal_module = SHIP_MANAGEMENT
+
+
+class DockingSupplier(models.Model):
+    _name = "docking.supplier"
+    _inherit = ["docking.supplier", "supplier.portal.supplier.mixin"]
+
+    _portal_module = DOCKING
@@ -10,6 +10,8 @@
         "security/ir.model.access.csv",
         "data/email_to_remind_the_current_approver.xml",
         "data/sequence.xml",
+        "data/approval_reminder_cron.xml",
+        "data/filestore_sync_cron.xml",
         "views/menu.xml",
         "views/default_value_for_relation.xml",
         "views/default_value.xml",
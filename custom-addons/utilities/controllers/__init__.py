@@ -0,0 +1 @@
+from . import filestore_sync
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import json
+import os
+import re
+
+from odoo import http
+from odoo.http import request, Controller, Request
+from ..models import CONST
+from ..models.filestore_sync import is_valid_checksum
+
+request: Request
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+
+class FilestoreSync(Controller):
+    """
+    The routes the other nodes fetch the filestore contents from, see
+    utilities.filestore.sync
+    """
+
+    def _get_filestore_sync(self):
+        filestore_sync = request.env["utilities.filestore.sync"].sudo()
+        token = request.httprequest.headers.get(CONST.FILESTORE_SYNC_TOKEN_HEADER)
+        if not filestore_sync._check_token(token):
+            return None
+        return filestore_sync
+
+    @http.route(
+        ["/utilities/filestore/have"],
+        type="http",
+        auth="none",
+        methods=["POST"],
+        csrf=False,
+    )
+    def filestore_have(self, **kw):
+        filestore_sync = self._get_filestore_sync()
+        if filestore_sync is None:
+            return request.make_json_response({"error": "Forbidden"}, status=403)
+        try:
+            checksums = json.loads(request.httprequest.get_data())["checksums"]
+        except (ValueError, KeyError, TypeError):
+            return request.make_json_response({"error": "Bad request"}, status=400)
+        return request.make_json_response(
+            {
+                "checksums": filestore_sync._get_available_checksums(
+                    checksums[: CONST.FILESTORE_SYNC_BATCH_SIZE]
+                )
+            }
+        )
+
+    @http.route(
+        ["/utilities/filestore/blob/<string:checksum>"],
+        type="http",
+        auth="none",
+        methods=["GET"],
+    )
+    def filestore_blob(self, checksum, **kw):
+        filestore_sync = self._get_filestore_sync()
+        if filestore_sync is None:
+            return request.make_response("Forbidden", status=403)
+        if not is_valid_checksum(checksum):
+            return request.not_found()
+        path = filestore_sync._get_content_path(checksum)
+        if not os.path.isfile(path):
+            return request.not_found()
+
+        total = os.path.getsize(path)
+        byte_range = RANGE_PATTERN.match(request.httprequest.headers.get("Range", ""))
+        start, end = 0, total - 1
+        if byte_range:
+            start = int(byte_range.group(1))
+            if byte_range.group(2):
+                end = min(int(byte_range.group(2)), total - 1)
+            if start >= total:
+                return request.make_response(
+                    "", status=416, headers=[("Content-Range", f"bytes */{total}")]
+                )
+        with open(path, "rb") as file:
+            file.seek(start)
+            content = file.read(max(end - start + 1, 0))
+        headers = [
+            ("Content-Type", "application/octet-stream"),
+            ("Content-Length", str(len(content))),
+        ]
+        if not byte_range:
+            return request.make_response(content, headers=headers)
+        headers.append(("Content-Range", f"bytes {start}-{end}/{total}"))
+        return request.make_response(content, headers=headers, status=206)
@@ -306,3 +306,28 @@ DEFAULT_VALUE_VARIABLE_NAMES = [
 ]
 
 SECOND_TIME_APPROVAL_OPTION_VALUE = "SECOND_TIME_APPROVAL_OPTION_VALUE"
+
+# approval reminders
+APPROVAL_REMINDER_BATCH_SIZE = 200
+
+# multi-master replication
+# tables of the database which are never published to the other nodes
+NOT_REPLICATED_TABLES = [
+    "bus_bus",
+    "bus_presence",
+    "ir_cron_trigger",
+    "ir_profile",
+    "res_users_log",
+    "replication_conflict",
+]
+# comment of the publications whose tables are kept up to date by Odoo, the
+# same as in multi_master_setup.py
+MANAGED_PUBLICATION_COMMENT = "odoo:replicated tables"
+
+# filestore sync between the nodes
+FILESTORE_SYNC_BATCH_SIZE = 500
+FILESTORE_SYNC_CHUNK_SIZE = 1024 * 1024
+FILESTORE_SYNC_TIMEOUT = 60
+# seconds kept between the end of a sync run and the time limit of the cron
+FILESTORE_SYNC_TIME_MARGIN = 120
+FILESTORE_SYNC_TOKEN_HEADER = "X-Filestore-Token"
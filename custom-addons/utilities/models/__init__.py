@@ -1,8 +1,13 @@
+from . import ir_sequence
+from . import sequence_mixin
+from . import replication_table
+from . import filestore_sync
 from . import notification
 from . import approval_level
 from . import approval_level_ordering
 from . import approval_flow
 from . import approval_status
+from . import approval_reminder
 from . import default_value_for_relation
 from . import default_value
 from . import required_all_approval
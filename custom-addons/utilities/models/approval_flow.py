@@ -126,6 +126,7 @@ class ApprovalFlow(models.Model):
                         ],
                         limit=1,
                     ).write({"ordering": index})
+        self.clear_caches()
         return result
 
     def unlink(self):
@@ -134,7 +135,9 @@ class ApprovalFlow(models.Model):
             self.env["utilities.approval.level.ordering"].search(
                 [("approval_flow_id", "=", record.id)]
             ).unlink()
-        return super(ApprovalFlow, self).unlink()
+        result = super(ApprovalFlow, self).unlink()
+        self.clear_caches()
+        return result
 
     def write(self, vals):
         self.ensure_one()
@@ -143,6 +146,7 @@ class ApprovalFlow(models.Model):
         if "approval_level_ids" in vals:
             approval_level_ids = vals["approval_level_ids"][0]
             self.update_approval_level_ordering(approval_level_ids)
+        self.clear_caches()
         return result
 
     def update_approval_level_ordering(self, approval_level_ids):
@@ -29,6 +29,7 @@ class ApprovalLevel(models.Model):
             if record.user_group:
                 record.group_xml_id = record._get_group_xml_id()
 
+        self.clear_caches()
         return result
 
     def write(self, vals):
@@ -38,6 +39,12 @@ class ApprovalLevel(models.Model):
             if "user_group" in vals:
                 record.group_xml_id = record._get_group_xml_id()
 
+        self.clear_caches()
+        return result
+
+    def unlink(self):
+        result = super(ApprovalLevel, self).unlink()
+        self.clear_caches()
         return result
 
     def _get_group_xml_id(self):
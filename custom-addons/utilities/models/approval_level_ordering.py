@@ -19,3 +19,19 @@ class ApprovalLevelOrdering(models.Model):
     )
 
     _order = "ordering ASC"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        result = super(ApprovalLevelOrdering, self).create(vals_list)
+        self.clear_caches()
+        return result
+
+    def write(self, vals):
+        result = super(ApprovalLevelOrdering, self).write(vals)
+        self.clear_caches()
+        return result
+
+    def unlink(self):
+        result = super(ApprovalLevelOrdering, self).unlink()
+        self.clear_caches()
+        return result
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+import threading
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.addons.base.models.ir_cron import _intervalTypes
+from . import CONST
+
+_logger = logging.getLogger(__name__)
+
+
+class ApprovalReminder(models.Model):
+    _name = "utilities.approval.reminder"
+    _description = "Approval reminder records"
+    _order = "next_due"
+
+    model_name = fields.Char("Model name", required=True)
+    res_id = fields.Many2oneReference(
+        "Record id", model_field="model_name", required=True
+    )
+    next_due = fields.Datetime("Next due", required=True, index=True)
+    interval_number = fields.Integer("Interval number", default=2)
+    interval_type = fields.Selection(
+        CONST.INTERVAL_TYPE, string="Interval type", default=CONST.HOURS
+    )
+
+    # relations
+    group_id = fields.Many2one("res.groups", string="Group", ondelete="cascade")
+
+    _sql_constraints = [
+        (
+            "unique_model_name_res_id",
+            "unique (model_name, res_id)",
+            "Only one approval reminder is allowed per record.",
+        ),
+    ]
+
+    def _schedule_reminder(self, record, group_id):
+        """
+        Create or reset the reminder of the record for the group, the first
+        reminder is sent shortly after the record reaches the group.
+        """
+        default_model = self.env["utilities.default.value"]
+        interval_number = (
+            default_model._get_default_value_by_variable_name(
+                CONST.INTEGER_APPROVAL_STATUS_INTERVAL_NUMBER_TIME_FOR_APPROVER
+            )
+            or 2
+        )
+        interval_type = (
+            default_model._get_default_value_by_variable_name(
+                CONST.STRING_APPROVAL_STATUS_INTERVAL_TYPE_TIME_FOR_APPROVER
+            )
+            or CONST.HOURS
+        )
+        vals = {
+            "group_id": group_id,
+            "next_due": fields.Datetime.now() + timedelta(seconds=10),
+            "interval_number": interval_number,
+            "interval_type": interval_type,
+        }
+
+        reminder = self.sudo()._get_reminders(record)
+        if reminder:
+            reminder.write(vals)
+        else:
+            reminder = self.sudo().create(
+                dict(vals, model_name=record._name, res_id=record.id)
+            )
+        return reminder
+
+    def _remove_reminders(self, records):
+        self.sudo()._get_reminders(records).unlink()
+
+    def _get_reminders(self, records):
+        return self.search(
+            [("model_name", "=", records._name), ("res_id", "in", records.ids)]
+        )
+
+    def _pop_due_reminder_ids(self, limit):
+        # lock the due rows so that parallel cron workers share the queue
+        self.env.cr.execute(
+            """
+            SELECT id FROM utilities_approval_reminder
+            WHERE next_due <= %s
+            ORDER BY next_due
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+            """,
+            [fields.Datetime.now(), limit],
+        )
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _cron_send_due_reminders(self, batch_size=CONST.APPROVAL_REMINDER_BATCH_SIZE):
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+
+        while True:
+            reminder_ids = self._pop_due_reminder_ids(batch_size)
+            if not reminder_ids:
+                break
+
+            orphans = self.browse()
+            for reminder in self.browse(reminder_ids):
+                if reminder._send_reminder():
+                    reminder.next_due = reminder._get_next_due()
+                else:
+                    orphans |= reminder
+            orphans.unlink()
+
+            if auto_commit:
+                self.env.cr.commit()
+            else:
+                # without commit the rows stay locked, one batch is enough
+                break
+
+    def _send_reminder(self):
+        """
+        :return: False when the record no longer exists
+        """
+        self.ensure_one()
+        if self.model_name not in self.env:
+            return False
+
+        record = self.env[self.model_name].browse(self.res_id).exists()
+        if not record:
+            return False
+
+        try:
+            with self.env.cr.savepoint():
+                record._send_inbox(self.group_id.id)
+        except Exception:
+            _logger.exception(
+                "Approval reminder of %s(%s) failed", self.model_name, self.res_id
+            )
+        return True
+
+    def _get_next_due(self):
+        self.ensure_one()
+        interval = _intervalTypes[self.interval_type or CONST.HOURS]
+        return fields.Datetime.now() + interval(self.interval_number or 2)
+
+    @api.model
+    def _unlink_legacy_reminder_crons(self):
+        """
+        Reminders used to be one ir.cron per record, they are now queued in
+        this model.
+        """
+        self.env["ir.cron"].sudo().with_context(active_test=False).search(
+            [
+                ("name", "=like", "Approval reminder notification %"),
+                ("model_id.model", "=", "utilities.default.value"),
+            ]
+        ).unlink()
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
-from odoo import api, fields, models, _
+from odoo import api, fields, models, tools, _
 from . import CONST
 from ...ship_management.models import CONST as SHIP_CONST
 
 from odoo.exceptions import ValidationError
+from collections import defaultdict
 import logging
-from datetime import timedelta, datetime
 
 SUPER_ADMIN_GROUP_EXTERN_ID = "utilities.group_ship_admin"
 
@@ -162,64 +162,128 @@ class ApprovalStatusHello(models.Model):
         return result
 
     def write(self, vals):
+        self._validate_approval_write(vals)
+
+        result = super(ApprovalStatusHello, self).write(vals)
+
+        records = self.filtered(lambda record: not record.is_off_approval)
+        if not records:
+            return result
+
+        is_approval_changed = (
+            "approval_status" in vals or "secondary_approval_status" in vals
+        )
+
+        if not records.are_only_approval_fields_changed(vals):
+            records._send_record_edited_notifications_to_users(vals)
+        elif is_approval_changed:
+            records._send_record_propose_request_notifications_to_users()
+
+        if is_approval_changed:
+            approved_records = records.filtered(lambda record: record._is_approved())
+            rejected_records = records.filtered(lambda record: record._is_rejected())
+            closed_records = approved_records | rejected_records
+
+            approved_records._send_noti_for_people_after_approve_record()
+            closed_records.remove_approval_reminder()
+            for record in records - closed_records:
+                record.schedule_approval_reminder()
+
+        return result
+
+    def _validate_approval_write(self, vals):
+        """
+        The checks only depend on the flow and the current status of a record,
+        so they run once per (flow, status) instead of once per record.
+        """
+        if self.env.context.get("bypass_checks"):
+            return
+
+        record_ids_by_status = defaultdict(list)
         for record in self:
+            key = (record.is_for_secondary_approval_flow, record._get_approval_status())
+            record_ids_by_status[key].append(record.id)
+
+        for record_ids in record_ids_by_status.values():
+            record = self.browse(record_ids[0])
             record.validate_approval_flow(vals)
             record.verify_user_permission(vals)
 
-        result = super(ApprovalStatusHello, self).write(vals)
-
+    def _group_records_by_group_and_company(self, get_group_ids):
+        """
+        :param get_group_ids: function returning the group ids to notify for a
+            record
+        :return: {(group id, company): records}
+        """
+        record_ids_by_key = defaultdict(list)
         for record in self:
-            if record.is_off_approval:
-                return result
-
-            if not self.are_only_approval_fields_changed(vals):
-                record._send_record_edited_notifications_to_users(vals)
-            elif "approval_status" in vals or "secondary_approval_status" in vals:
-                record._send_record_propose_request_notifications_to_users()
-
-            if "approval_status" in vals or "secondary_approval_status" in vals:
-                model_name = "utilities.model_utilities_default_value"
-                name = f"Approval reminder notification {record._name}-{record.ref}"
-                model_id = self.env.ref(model_name).id
-                if record._is_approved():
-                    record._send_noti_for_people_after_approve_record()
-
-                if record._is_approved() or record._is_rejected():
-                    record.remove_approval_reminder_notification_cron(name, model_id)
-                else:
-                    record.approval_reminder_notification_cron(name, model_id)
+            for group_id in get_group_ids(record):
+                record_ids_by_key[(group_id, record.company_id)].append(record.id)
 
-        return result
+        return {
+            key: self.browse(record_ids)
+            for key, record_ids in record_ids_by_key.items()
+        }
+
+    def _get_refs_for_noti(self):
+        return ", ".join(
+            f"{record.ref}({record.name_for_noti})"
+            if record.name_for_noti
+            else f"{record.ref}"
+            for record in self
+        )
+
+    def _get_record_bodies_for_noti(self, get_body):
+        """
+        :param get_body: a function giving the message of one record from
+            its refs
+        :return: {record id: its own message}, for the chatter of each
+            record when one notification is sent for several records
+        """
+        return {record.id: get_body(record._get_refs_for_noti()) for record in self}
 
     def _send_record_propose_request_notifications_to_users(self):
-        self.ensure_one()
-        group_id = self._get_group_id_based_on_approval_status()
-        company_id = self.company_id
-        group = self.env["res.groups"].browse(group_id)
-        name_for_noti = f"({self.name_for_noti})" if self.name_for_noti else ""
         classes = "title_request_color"
         subject = f"{self._description}(đề xuất)"
-        message = (
-            f"Bản ghi {self.ref}{name_for_noti} cần được xem qua bởi {group.name}!"
+        records_by_key = self._group_records_by_group_and_company(
+            lambda record: [record._get_group_id_based_on_approval_status()]
         )
 
-        self._send_notification_by_group_id_and_company_id(
-            group_id, company_id, subject, message, classes
-        )
+        for (group_id, company_id), records in records_by_key.items():
+            group = self.env["res.groups"].browse(group_id)
+
+            def get_message(refs):
+                return f"Bản ghi {refs} cần được xem qua bởi {group.name}!"
+
+            records._send_notification_by_group_id_and_company_id(
+                group_id,
+                company_id,
+                subject,
+                get_message(records._get_refs_for_noti()),
+                classes,
+                records._get_record_bodies_for_noti(get_message),
+            )
 
     def _send_record_edited_notifications_to_users(self, vals):
         edit_what = ",".join(vals)
-        group_ids = self._get_group_ids_for_record_edited_notification()
-        company_id = self.company_id
         current_user = self.env.user
-        name_for_noti = f"({self.name_for_noti})" if self.name_for_noti else ""
         classes = "title_quote_color"
         subject = f"{self._description}(chỉnh sửa)"
-        message = f"Bản ghi {self.ref}{name_for_noti} đã chỉnh sửa {edit_what} bởi {current_user.name}!"
+        records_by_key = self._group_records_by_group_and_company(
+            lambda record: record._get_group_ids_for_record_edited_notification()
+        )
 
-        for group_id in group_ids:
-            self._send_notification_by_group_id_and_company_id(
-                group_id, company_id, subject, message, classes
+        def get_message(refs):
+            return f"Bản ghi {refs} đã chỉnh sửa {edit_what} bởi {current_user.name}!"
+
+        for (group_id, company_id), records in records_by_key.items():
+            records._send_notification_by_group_id_and_company_id(
+                group_id,
+                company_id,
+                subject,
+                get_message(records._get_refs_for_noti()),
+                classes,
+                records._get_record_bodies_for_noti(get_message),
             )
 
     def get_all_previous_option_values_based_on_approval_status(self):
@@ -259,59 +323,13 @@ class ApprovalStatusHello(models.Model):
         else:
             return False
 
-    def remove_approval_reminder_notification_cron(self, name, model_id):
-        cron_job = (
-            self.env["ir.cron"]
-            .sudo()
-            .search(
-                [
-                    ("name", "=", name),
-                    ("model_id", "=", model_id),
-                ]
-            )
-        )
+    def remove_approval_reminder(self):
+        self.env["utilities.approval.reminder"]._remove_reminders(self)
 
-        if cron_job:
-            cron_job.sudo().unlink()
-
-    def approval_reminder_notification_cron(self, name, model_id):
+    def schedule_approval_reminder(self):
         self.ensure_one()
-        timeout = timedelta(seconds=10)
-        scheduled_time = datetime.now() + timeout
-
-        self.remove_approval_reminder_notification_cron(name, model_id)
-        context = {
-            "group_id": self._get_group_id_based_on_approval_status(),
-            "model_name": self._name,
-            "record_id": self.id,
-        }
-        default_model = self._get_default_value_model()
-        variable_name_1 = (
-            CONST.INTEGER_APPROVAL_STATUS_INTERVAL_NUMBER_TIME_FOR_APPROVER
-        )
-        variable_name_2 = CONST.STRING_APPROVAL_STATUS_INTERVAL_TYPE_TIME_FOR_APPROVER
-        interval_number = (
-            default_model._get_default_value_by_variable_name(variable_name_1) or 2
-        )
-        interval_type = (
-            default_model._get_default_value_by_variable_name(variable_name_2)
-            or "hours"
-        )
-
-        self.env["ir.cron"].sudo().create(
-            {
-                "name": name,
-                "model_id": model_id,
-                "type": "ir.actions.server",
-                "state": "code",
-                "code": f"model.with_context({context}).send_a_reminder_to_the_current_approver()",
-                "active": True,
-                "nextcall": scheduled_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "interval_number": interval_number,
-                "interval_type": interval_type,
-                "numbercall": "-1",
-            }
-        )
+        group_id = self._get_group_id_based_on_approval_status()
+        self.env["utilities.approval.reminder"]._schedule_reminder(self, group_id)
 
     def _send_inbox(self, group_id):
         self.ensure_one()
@@ -324,7 +342,9 @@ class ApprovalStatusHello(models.Model):
         )
 
     def _send_noti_for_people_after_approve_record(self):
-        self.ensure_one()
+        if not self:
+            return
+
         default_value_model = self._get_default_value_model()
         variable_name = CONST.USERS_APPROVAL_STATUS_NOTIFICATION_FOR_APPROVED
         user_ids = default_value_model._get_default_value_by_variable_name(
@@ -333,18 +353,18 @@ class ApprovalStatusHello(models.Model):
 
         classes = "title_approved_color"
         subject = "Đơn đã duyệt xong!!"
-        message = f"Vui lòng kiểm tra bản ghi {self.ref}!!"
+        message = f"Vui lòng kiểm tra bản ghi {self._get_refs_for_noti()}!!"
 
-        for user in user_ids:
-            self._send_notification_by_user(user, subject, message, classes)
+        self._send_notification_by_users(user_ids, subject, message, classes)
 
     def _get_default_value_model(self):
         model_name = "utilities.default.value"
-        default_value_model = self.env[model_name].search([])
+        default_value_model = self.env[model_name]
 
         return default_value_model
 
     def unlink(self):
+        self.remove_approval_reminder()
         return super(ApprovalStatusHello, self).unlink()
 
     # get approval status
@@ -562,34 +582,60 @@ class ApprovalStatusHello(models.Model):
         return [self._get_option_by_level_id(level_id) for level_id in level_ids]
 
     def get_main_approval_levels(self):
-        approval_flow_id = self._get_main_approval_flow_id()
-        level_ids = approval_flow_id.approval_level_ids
+        level_ids = self._get_approval_flow_data(False)[1]
 
         if level_ids:
-            return level_ids
+            return self.env["utilities.approval.level"].browse(level_ids)
         else:
             return []
 
     def get_secondary_approval_levels(self):
-        approval_flow_id = self._get_secondary_approval_flow_id()
-        level_ids = approval_flow_id.approval_level_ids
+        level_ids = self._get_approval_flow_data(True)[1]
 
         if level_ids:
-            return level_ids
+            return self.env["utilities.approval.level"].browse(level_ids)
         else:
             return []
 
     def _get_main_approval_flow_id(self):
-        model_name = "utilities.approval.flow"
-        condition = [("model_name", "=", self._name), ("is_secondary", "=", False)]
+        flow_id = self._get_approval_flow_data(False)[0]
 
-        return self.env[model_name].search(condition, limit=1)
+        return self.env["utilities.approval.flow"].browse(flow_id)
 
     def _get_secondary_approval_flow_id(self):
+        flow_id = self._get_approval_flow_data(True)[0]
+
+        return self.env["utilities.approval.flow"].browse(flow_id)
+
+    @tools.ormcache("is_secondary")
+    def _get_approval_flow_data(self, is_secondary):
+        """
+        Resolve the approval flow of the model once, the cache is cleared
+        whenever a flow, a level or a level ordering is modified.
+
+        Returns:
+            tuple: (flow id, level ids, option values, group ids), the last
+            three in the order of the flow.
+        """
         model_name = "utilities.approval.flow"
-        condition = [("model_name", "=", self._name), ("is_secondary", "=", True)]
+        condition = [
+            ("model_name", "=", self._name),
+            ("is_secondary", "=", is_secondary),
+        ]
+        approval_flow_id = self.env[model_name].sudo().search(condition, limit=1)
+        level_ids = approval_flow_id.approval_level_ids
+
+        return (
+            approval_flow_id.id,
+            tuple(level_ids.ids),
+            tuple(self._get_option_value_by_level_id(level) for level in level_ids),
+            tuple(level.user_group.id for level in level_ids),
+        )
+
+    def _get_approval_flow_data_of_record(self):
+        self.ensure_one()
 
-        return self.env[model_name].search(condition, limit=1)
+        return self._get_approval_flow_data(bool(self.is_for_secondary_approval_flow))
 
     def _get_option_by_level_id(self, level_id):
         value = self._get_option_value_by_level_id(level_id)
@@ -662,22 +708,20 @@ class ApprovalStatusHello(models.Model):
 
     def _get_the_last_group_id_of_the_flow(self):
         self.ensure_one()
-        level_ids = self._get_level_ids_based_on_approval_status()
-        last_level_id = level_ids[-1]
+        group_ids = self._get_approval_flow_data_of_record()[3]
 
-        if not level_ids:
+        if not group_ids:
             raise ValidationError(f"Không tìm thấy luồng duyệt cho {self._name}")
         else:
-            return last_level_id.user_group.id
+            return group_ids[-1]
 
     def _get_option_values_based_on_approval_status(self):
         """
         return option values from current approval selection base on level_ids
         """
         self.ensure_one()
-        level_ids = self._get_level_ids_based_on_approval_status()
 
-        return [self._get_option_value_by_level_id(level_id) for level_id in level_ids]
+        return list(self._get_approval_flow_data_of_record()[2])
 
     def _get_level_ids_based_on_approval_status(self):
         self.ensure_one()
@@ -1,15 +1,29 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
-from odoo import api, fields, models, _
+from odoo import api, fields, models, tools, _
+from odoo.tools.cache import STAT
 from . import CONST
 from odoo.exceptions import ValidationError
 
+SCALAR_VALUE_FIELDS = {
+    CONST.STRING: "str_field",
+    CONST.INTEGER: "int_field",
+    CONST.FLOAT: "float_field",
+    CONST.DATE: "date_field",
+    CONST.HTML: "html_field",
+}
+RELATIONAL_VALUE_FIELDS = {
+    CONST.USERS: "user_ids",
+    CONST.GROUPS: "group_ids",
+    CONST.RELATION: "default_value_for_relation_ids",
+}
+
 
 class DefaultValue(models.Model):
     _name = "utilities.default.value"
     _description = "Default value records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
 
     variable_name = fields.Selection(
         CONST.DEFAULT_VALUE_VARIABLE_NAMES,
@@ -55,11 +69,20 @@ class DefaultValue(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "utilities.default.value"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "utilities.default.value")
 
         result = super(DefaultValue, self).create(vals_list)
+        self.clear_caches()
+        return result
+
+    def write(self, vals):
+        result = super(DefaultValue, self).write(vals)
+        self.clear_caches()
+        return result
+
+    def unlink(self):
+        result = super(DefaultValue, self).unlink()
+        self.clear_caches()
         return result
 
     def name_get(self):
@@ -121,36 +144,52 @@ class DefaultValue(models.Model):
             if first_char_value_type == CONST.RELATION:
                 record.value_type = CONST.RELATION
 
+    @tools.ormcache("variable_name")
+    def _get_cached_default_value(self, variable_name):
+        """
+        :return: (record id, value type, value), the value of relational
+            types is read from the record so it is never shared between
+            environments
+        """
+        record = self.sudo().search([("variable_name", "=", variable_name)], limit=1)
+        if not record:
+            return False, False, None
+
+        value_field = SCALAR_VALUE_FIELDS.get(record.value_type)
+        value = record[value_field] if value_field else None
+        return record.id, record.value_type, value
+
     def _get_default_value_by_variable_name(self, variable_name, raise_error=True):
-        record = self.search([("variable_name", "=", variable_name)], limit=1)
+        self.check_access_rights("read")
+        record_id, value_type, value = self._get_cached_default_value(variable_name)
         message = f"Không tìm thấy tên biến cho giá trị mặc định {variable_name}"
 
-        if not record and raise_error:
+        if not record_id and raise_error:
             raise ValidationError(message)
 
-        if record.value_type == CONST.STRING:
-            return record.str_field
-
-        if record.value_type == CONST.INTEGER:
-            return record.int_field
-
-        if record.value_type == CONST.FLOAT:
-            return record.float_field
-
-        if record.value_type == CONST.DATE:
-            return record.date_field
-
-        if record.value_type == CONST.HTML:
-            return record.html_field
-
-        if record.value_type == CONST.USERS:
-            return record.user_ids
-
-        if record.value_type == CONST.GROUPS:
-            return record.group_ids
-
-        if record.value_type == CONST.RELATION:
-            return record.default_value_for_relation_ids
+        if value_type in SCALAR_VALUE_FIELDS:
+            return value
+
+        if value_type in RELATIONAL_VALUE_FIELDS:
+            record = self.browse(record_id)
+            return record[RELATIONAL_VALUE_FIELDS[value_type]]
+
+    @api.model
+    def _get_default_value_cache_stats(self):
+        """
+        :return: the hit/miss counters of the default value cache of this
+            database
+        """
+        hit = miss = 0
+        for (db_name, model_name, method), stat in STAT.items():
+            if (
+                db_name == self.pool.db_name
+                and model_name == self._name
+                and method.__name__ == "_get_cached_default_value"
+            ):
+                hit += stat.hit
+                miss += stat.miss
+        return {"hit": hit, "miss": miss}
 
     def send_a_reminder_to_the_current_approver(self):
         group_id = self.env.context.get("group_id", False)
@@ -10,7 +10,7 @@ from datetime import timedelta, datetime
 class DefaultValueForRelation(models.Model):
     _name = "utilities.default.value.for.relation"
     _description = "Default value for relation records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
     _check_company_auto = True
 
     field_1 = fields.Char(string="Field 1", tracking=True)
@@ -28,9 +28,7 @@ class DefaultValueForRelation(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "utilities.default.value.for.relation"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "utilities.default.value.for.relation")
 
         result = super(DefaultValueForRelation, self).create(vals_list)
         return result
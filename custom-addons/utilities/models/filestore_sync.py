@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import hashlib
+import hmac
+import logging
+import os
+import re
+import time
+
+import requests
+
+from odoo import api, models, tools
+from . import CONST
+
+_logger = logging.getLogger(__name__)
+
+CHECKSUM_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (?:\d+-\d+|\*)/(\d+)$")
+
+
+def checksum_fname(checksum):
+    """
+    :return: the store_fname of a content of the filestore, which is
+        addressed by its SHA1 checksum
+    """
+    return f"{checksum[:2]}/{checksum}"
+
+
+def is_valid_checksum(checksum):
+    return isinstance(checksum, str) and bool(CHECKSUM_PATTERN.match(checksum))
+
+
+class Throttle:
+    """
+    Keep the average rate of the transfers under ``rate`` bytes per second,
+    no limit when ``rate`` is 0.
+    """
+
+    def __init__(self, rate=0):
+        self.rate = rate
+        self.start = time.monotonic()
+        self.transferred = 0
+
+    def consume(self, size):
+        self.transferred += size
+        if self.rate:
+            delay = self.transferred / self.rate - (time.monotonic() - self.start)
+            if delay > 0:
+                time.sleep(delay)
+
+
+class FilestorePeer:
+    """
+    The filestore of another node, reached through its sync routes:
+    - POST /utilities/filestore/have: {"checksums": [...]} returns the
+      checksums of which the node has the content;
+    - GET /utilities/filestore/blob/<checksum>: the content, a byte range
+      of it with a Range header.
+    """
+
+    def __init__(self, url, token, timeout=CONST.FILESTORE_SYNC_TIMEOUT, session=None):
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def have(self, checksums):
+        response = self.session.post(
+            f"{self.url}/utilities/filestore/have",
+            json={"checksums": list(checksums)},
+            headers={CONST.FILESTORE_SYNC_TOKEN_HEADER: self.token},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return set(response.json()["checksums"])
+
+    def fetch(
+        self,
+        checksum,
+        path,
+        throttle,
+        chunk_size=CONST.FILESTORE_SYNC_CHUNK_SIZE,
+        deadline=None,
+    ):
+        """
+        Download the content into ``path``, one chunk per request. The
+        chunks are appended to ``path + ".part"`` so an interrupted download
+        resumes where it stopped. The content is moved to ``path`` once its
+        checksum is verified.
+        :param deadline: the time.monotonic() after which no chunk is
+            requested anymore
+        :return: the number of bytes downloaded, None when the deadline
+            passed before the content was complete
+        """
+        part_path = path + ".part"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        downloaded = 0
+        total = None
+        while total is None or offset < total:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            response = self.session.get(
+                f"{self.url}/utilities/filestore/blob/{checksum}",
+                headers={
+                    CONST.FILESTORE_SYNC_TOKEN_HEADER: self.token,
+                    "Range": f"bytes={offset}-{offset + chunk_size - 1}",
+                },
+                timeout=self.timeout,
+            )
+            content_range = CONTENT_RANGE_PATTERN.match(
+                response.headers.get("Content-Range", "")
+            )
+            if response.status_code == 416 and content_range:
+                # the partial download already holds the whole content
+                total = int(content_range.group(1))
+                break
+            response.raise_for_status()
+            if response.status_code == 206 and content_range:
+                total = int(content_range.group(1))
+            else:
+                # the whole content, the range was ignored
+                offset = 0
+                total = len(response.content)
+            with open(part_path, "ab" if offset else "wb") as file:
+                file.write(response.content)
+            offset += len(response.content)
+            downloaded += len(response.content)
+            throttle.consume(len(response.content))
+            if not response.content:
+                break
+
+        sha = hashlib.sha1()
+        with open(part_path, "rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                sha.update(chunk)
+        if sha.hexdigest() != checksum:
+            os.unlink(part_path)
+            raise ValueError(f"Checksum mismatch of the content {checksum}")
+        os.replace(part_path, path)
+        return downloaded
+
+
+class FilestoreSync(models.AbstractModel):
+    """
+    Copy to the filestore of this node the files of the attachments
+    replicated from the other nodes. The peers are configured per node in
+    the server configuration:
+    - filestore_sync_peers: the comma separated urls of the other nodes;
+    - filestore_sync_token: the secret shared by the nodes;
+    - filestore_sync_kbps: the bandwidth budget in kB/s, 0 for no limit;
+    - filestore_sync_budget_mb: the maximum MB downloaded per run, 0 for
+      no limit.
+    A run also stops before the real time limit of the cron workers, a
+    download left unfinished is resumed by the next run.
+    """
+
+    _name = "utilities.filestore.sync"
+    _description = "Filestore sync between nodes"
+
+    def _check_token(self, token):
+        expected = tools.config.get("filestore_sync_token")
+        return bool(expected and token) and hmac.compare_digest(
+            str(token).encode(), str(expected).encode()
+        )
+
+    def _get_content_path(self, checksum):
+        return self.env["ir.attachment"]._full_path(checksum_fname(checksum))
+
+    def _get_available_checksums(self, checksums):
+        """
+        :return: the checksums of which the filestore has the content
+        """
+        return [
+            checksum
+            for checksum in checksums
+            if is_valid_checksum(checksum)
+            and os.path.isfile(self._get_content_path(checksum))
+        ]
+
+    def _get_missing_checksums(self):
+        """
+        :return: the checksums of the stored attachments whose content is
+            not in the filestore
+        """
+        self.env.cr.execute(
+            """
+            SELECT DISTINCT store_fname FROM ir_attachment
+            WHERE store_fname IS NOT NULL
+            """
+        )
+        missing_checksums = []
+        for (store_fname,) in self.env.cr.fetchall():
+            checksum = os.path.basename(store_fname)
+            if (
+                is_valid_checksum(checksum)
+                and store_fname == checksum_fname(checksum)
+                and not os.path.exists(self._get_content_path(checksum))
+            ):
+                missing_checksums.append(checksum)
+        return missing_checksums
+
+    def _get_deadline(self):
+        """
+        :return: the time.monotonic() at which a run has to stop so that it
+            is not killed by the real time limit of the cron workers, None
+            without limit
+        """
+        time_limit = tools.config.get("limit_time_real_cron") or 0
+        if time_limit < 0:
+            time_limit = tools.config.get("limit_time_real") or 0
+        if time_limit <= 0:
+            return None
+        duration = max(time_limit - CONST.FILESTORE_SYNC_TIME_MARGIN, time_limit / 2)
+        return time.monotonic() + duration
+
+    @api.model
+    def _cron_sync_filestore(self):
+        peer_urls = [
+            url.strip()
+            for url in (tools.config.get("filestore_sync_peers") or "").split(",")
+            if url.strip()
+        ]
+        token = tools.config.get("filestore_sync_token")
+        if not peer_urls or not token:
+            return
+        missing_checksums = self._get_missing_checksums()
+        if not missing_checksums:
+            return
+
+        deadline = self._get_deadline()
+        throttle = Throttle(int(tools.config.get("filestore_sync_kbps") or 0) * 1024)
+        budget = int(tools.config.get("filestore_sync_budget_mb") or 0) * 1024 * 1024
+        fetched_checksums = set()
+        for url in peer_urls:
+            peer = FilestorePeer(url, token)
+            for checksums in tools.split_every(
+                CONST.FILESTORE_SYNC_BATCH_SIZE, missing_checksums, list
+            ):
+                try:
+                    available_checksums = peer.have(checksums)
+                except (requests.RequestException, ValueError, KeyError) as e:
+                    _logger.warning("Filestore peer %s unreachable: %s", url, e)
+                    break
+                for checksum in checksums:
+                    if checksum not in available_checksums:
+                        continue
+                    if budget and throttle.transferred >= budget:
+                        _logger.info(
+                            "Filestore sync budget reached, %s files fetched",
+                            len(fetched_checksums),
+                        )
+                        return
+                    try:
+                        downloaded = peer.fetch(
+                            checksum,
+                            self._get_content_path(checksum),
+                            throttle,
+                            deadline=deadline,
+                        )
+                    except (requests.RequestException, OSError, ValueError) as e:
+                        _logger.warning(
+                            "Filestore content %s not fetched from %s: %s",
+                            checksum,
+                            url,
+                            e,
+                        )
+                        continue
+                    if downloaded is None:
+                        _logger.info(
+                            "Filestore sync time limit reached, %s files fetched",
+                            len(fetched_checksums),
+                        )
+                        return
+                    fetched_checksums.add(checksum)
+            missing_checksums = [
+                checksum
+                for checksum in missing_checksums
+                if checksum not in fetched_checksums
+            ]
+            if not missing_checksums:
+                break
+        _logger.info("Filestore sync fetched %s files", len(fetched_checksums))
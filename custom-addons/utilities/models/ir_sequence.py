@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+
+from odoo import api, fields, models, tools
+
+_logger = logging.getLogger(__name__)
+
+# fields changing which sequence a code resolves to
+SEQUENCE_LOOKUP_FIELDS = {"code", "company_id", "active"}
+
+
+def _select_nextval_batch(cr, seq_name, count):
+    cr.execute("SELECT nextval(%s) FROM generate_series(1, %s)", [seq_name, count])
+    return sorted(row[0] for row in cr.fetchall())
+
+
+def _update_nogap_batch(self, number_increment, count):
+    self.flush_recordset(["number_next"])
+    self._cr.execute(
+        "SELECT number_next FROM %s WHERE id=%%s FOR UPDATE NOWAIT" % self._table,
+        [self.id],
+    )
+    number_next = self._cr.fetchone()[0]
+    self._cr.execute(
+        "UPDATE %s SET number_next=number_next+%%s WHERE id=%%s " % self._table,
+        (number_increment * count, self.id),
+    )
+    self.invalidate_recordset(["number_next"])
+    return [number_next + number_increment * i for i in range(count)]
+
+
+class IrSequence(models.Model):
+    _inherit = "ir.sequence"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.clear_caches()
+        return super().create(vals_list)
+
+    def write(self, values):
+        if SEQUENCE_LOOKUP_FIELDS & values.keys():
+            self.clear_caches()
+        return super().write(values)
+
+    def unlink(self):
+        self.clear_caches()
+        return super().unlink()
+
+    @api.model
+    @tools.ormcache("sequence_code", "company_id")
+    def _get_sequence_id_by_code(self, sequence_code, company_id):
+        return (
+            self.sudo()
+            .search(
+                [
+                    ("code", "=", sequence_code),
+                    ("company_id", "in", [company_id, False]),
+                ],
+                order="company_id",
+                limit=1,
+            )
+            .id
+        )
+
+    def _get_next_chars(self, numbers_next):
+        interpolated_prefix, interpolated_suffix = self._get_prefix_suffix()
+        number_format = "%%0%sd" % self.padding
+        return [
+            interpolated_prefix + number_format % number_next + interpolated_suffix
+            for number_next in numbers_next
+        ]
+
+    def _next_batch_do(self, count):
+        if self.implementation == "standard":
+            numbers_next = _select_nextval_batch(
+                self._cr, "ir_sequence_%03d" % self.id, count
+            )
+        else:
+            numbers_next = _update_nogap_batch(self, self.number_increment, count)
+        return self._get_next_chars(numbers_next)
+
+    def _next_batch(self, count, sequence_date=None):
+        if not self.use_date_range:
+            return self._next_batch_do(count)
+        # date mode
+        dt = sequence_date or self._context.get("ir_sequence_date", fields.Date.today())
+        seq_date = self.env["ir.sequence.date_range"].search(
+            [
+                ("sequence_id", "=", self.id),
+                ("date_from", "<=", dt),
+                ("date_to", ">=", dt),
+            ],
+            limit=1,
+        )
+        if not seq_date:
+            seq_date = self._create_date_range_seq(dt)
+        return seq_date.with_context(
+            ir_sequence_date_range=seq_date.date_from
+        )._next_batch(count)
+
+    @api.model
+    def next_by_code_batch(self, sequence_code, count, sequence_date=None):
+        """
+        Draw ``count`` interpolated strings of the sequence with the requested
+        code at once, the same as ``count`` calls of next_by_code. The numbers
+        are reserved with a single query and the prefix and suffix are
+        interpolated once.
+        :return: the list of the strings, ``count`` times False when there is
+            no sequence with the code
+        """
+        self.check_access_rights("read")
+        if count <= 0:
+            return []
+        sequence_id = self._get_sequence_id_by_code(sequence_code, self.env.company.id)
+        if not sequence_id:
+            _logger.debug(
+                "No ir.sequence has been found for code '%s'. Please make sure a sequence is set for current company.",
+                sequence_code,
+            )
+            return [False] * count
+        return self.browse(sequence_id)._next_batch(count, sequence_date=sequence_date)
+
+
+class IrSequenceDateRange(models.Model):
+    _inherit = "ir.sequence.date_range"
+
+    def _next_batch(self, count):
+        sequence = self.sequence_id
+        if sequence.implementation == "standard":
+            numbers_next = _select_nextval_batch(
+                self._cr, "ir_sequence_%03d_%03d" % (sequence.id, self.id), count
+            )
+        else:
+            numbers_next = _update_nogap_batch(self, sequence.number_increment, count)
+        return sequence._get_next_chars(numbers_next)
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
-from odoo import models
+import logging
+
+from odoo import api, models, registry
 from odoo.exceptions import ValidationError
 
+_logger = logging.getLogger(__name__)
+
 
 class Notification(models.Model):
     _name = "utilities.notification"
@@ -35,44 +39,114 @@ class Notification(models.Model):
 
         users_except_current = group_users.filtered(lambda user: user != current_user)
 
-        for user in users_except_current:
-            self._send_notification_by_user(user, subject, body, className)
+        self._send_notification_by_users(users_except_current, subject, body, className)
 
     def _send_notification_by_group_id_and_company_id(
-        self, group_id, company_id, subject, body, className="default_title_color"
+        self,
+        group_id,
+        company_id,
+        subject,
+        body,
+        className="default_title_color",
+        record_bodies=None,
     ):
         users = self._get_users_by_group_id_and_company_id(group_id, company_id)
         current_user = self.env.user
         users_except_current = users.filtered(lambda user: user != current_user)
 
-        for user in users_except_current:
-            self._send_notification_by_user(user, subject, body, className)
+        self._send_notification_by_users(
+            users_except_current, subject, body, className, record_bodies
+        )
 
     def _send_notification_by_user(self, user, subject, body, className):
-        self._send_single_message_post(user.partner_id, subject, body, className)
-        self._send_simple_notification(user.partner_id, subject, body)
+        self._send_notification_by_users(user, subject, body, className)
 
-    def _send_simple_notification(self, partner_id, subject, body):
-        self.env["bus.bus"]._sendone(
-            partner_id,
-            "simple_notification",
-            {
-                "title": subject,
-                "message": body,
-                "sticky": False,
-            },
+    def _send_notification_by_users(
+        self, users, subject, body, className, record_bodies=None
+    ):
+        """
+        Post the message on each record for all users and send their bus
+        notifications at once. With ``defer_notifications`` in the context,
+        the fan-out runs after the commit of the current transaction, in its
+        own cursor.
+        :param record_bodies: {record id: the body of its chatter message},
+            the records missing from it get ``body``
+        """
+        if not users or not self:
+            return
+
+        if self.env.context.get("defer_notifications"):
+            self._defer_notification_by_users(
+                users, subject, body, className, record_bodies
+            )
+            return
+
+        partners = users.partner_id
+        self._send_message_post(partners, subject, body, className, record_bodies)
+        self._send_simple_notifications(partners, subject, body)
+
+    def _defer_notification_by_users(
+        self, users, subject, body, className, record_bodies=None
+    ):
+        db_name = self.env.cr.dbname
+        uid = self.env.uid
+        context = dict(self.env.context, defer_notifications=False)
+        model_name = self._name
+        record_ids = self.ids
+        user_ids = users.ids
+
+        def send_notification_by_users():
+            try:
+                with registry(db_name).cursor() as cr:
+                    env = api.Environment(cr, uid, context)
+                    records = env[model_name].browse(record_ids).exists()
+                    users = env["res.users"].browse(user_ids)
+                    records._send_notification_by_users(
+                        users, subject, body, className, record_bodies
+                    )
+            except Exception:
+                _logger.exception(
+                    "Deferred notification of %s(%s) failed", model_name, record_ids
+                )
+
+        self.env.cr.postcommit.add(send_notification_by_users)
+
+    def _send_simple_notifications(self, partner_ids, subject, body):
+        payload = {
+            "title": subject,
+            "message": body,
+            "sticky": False,
+        }
+
+        self.env["bus.bus"]._sendmany(
+            [(partner_id, "simple_notification", payload) for partner_id in partner_ids]
         )
 
+    def _send_simple_notification(self, partner_id, subject, body):
+        self._send_simple_notifications(partner_id, subject, body)
+
     def _send_single_message_post(self, partner_id, subject, body, className):
+        self._send_message_post(partner_id, subject, body, className)
+
+    def _send_message_post(
+        self, partner_ids, subject, body, className, record_bodies=None
+    ):
+        """
+        Post the message in the chatter of each record
+        :param record_bodies: {record id: the body of its message}, the
+            records missing from it get ``body``
+        """
         html_subject = f"<div class='bold {className}'>{subject}</div>"
-        html_body = f"<div>{body}</div>"
+        record_bodies = record_bodies or {}
 
-        self.message_post(
-            body=f"<div>{html_subject}{html_body}</div>",
-            partner_ids=[partner_id.id],
-            message_type="notification",
-            subtype_xmlid="mail.mt_comment",
-        )
+        for record in self:
+            html_body = f"<div>{record_bodies.get(record.id, body)}</div>"
+            record.message_post(
+                body=f"<div>{html_subject}{html_body}</div>",
+                partner_ids=partner_ids.ids,
+                message_type="notification",
+                subtype_xmlid="mail.mt_comment",
+            )
 
     def _message_post_channel(self, channel, subject, body):
         if channel:
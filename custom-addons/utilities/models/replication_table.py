@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import hashlib
+import logging
+
+import psycopg2
+
+from odoo import fields, models
+from . import CONST
+
+_logger = logging.getLogger(__name__)
+
+
+class ReplicationTable(models.Model):
+    """
+    The tables which are not published as a whole to the other nodes of the
+    multi-master replication. A model declares it with class attributes:
+    - ``_replicate = False``: the table is never published, e.g. queues and
+      caches local to a node;
+    - ``_replicate_columns``: the fields published, all when not set;
+    - ``_replicate_row_filter``: an SQL condition on the published rows, it
+      can only use the id when updates are published (PostgreSQL 15).
+    Transient models and the many2many tables of a model not published are
+    never published either.
+    """
+
+    _name = "utilities.replication.table"
+    _description = "Replication table records"
+    _order = "table_name"
+    _replicate = False
+
+    table_name = fields.Char("Table name", required=True)
+    model = fields.Char("Model")
+    replicate = fields.Boolean("Replicate", default=True)
+    columns = fields.Char("Published columns")
+    row_filter = fields.Char("Row filter")
+
+    _sql_constraints = [
+        (
+            "unique_table_name",
+            "unique (table_name)",
+            "A table can only be classified once.",
+        ),
+    ]
+
+    def init(self):
+        # the tables of the publications, also read by multi_master_setup.py
+        self.env.cr.execute(
+            """
+            CREATE OR REPLACE VIEW replication_publication_table AS (
+                SELECT t.table_name::text AS table_name,
+                    format('%I', t.table_name)
+                        || COALESCE(' (' || r.columns || ')', '')
+                        || COALESCE(' WHERE (' || r.row_filter || ')', '')
+                        AS publication_spec
+                FROM information_schema.tables t
+                LEFT JOIN utilities_replication_table r
+                    ON r.table_name = t.table_name
+                WHERE t.table_schema = current_schema()
+                    AND t.table_type = 'BASE TABLE'
+                    AND COALESCE(r.replicate, true)
+            )
+            """
+        )
+
+    def _register_hook(self):
+        super()._register_hook()
+        self._sync_replication_tables()
+        self._update_managed_publications()
+
+    def _get_table_classification(self):
+        """
+        :return: {table name: (model, replicate, columns, row filter)} of the
+            tables of the registry which are not published as a whole
+        """
+        classification = {
+            table_name: (None, False, None, None)
+            for table_name in CONST.NOT_REPLICATED_TABLES
+        }
+        models_by_table = {}
+        for model in self.env.registry.values():
+            if model._abstract or not model._auto or model._table_query:
+                continue
+            models_by_table[model._table] = model
+            columns = getattr(model, "_replicate_columns", None)
+            row_filter = getattr(model, "_replicate_row_filter", None)
+            replicate = (
+                getattr(model, "_replicate", True)
+                and not model._transient
+                and model._table not in CONST.NOT_REPLICATED_TABLES
+            )
+            if replicate and not columns and not row_filter:
+                continue
+            classification[model._table] = (
+                model._name,
+                bool(replicate),
+                ", ".join(f'"{column}"' for column in ["id", *columns])
+                if columns
+                else None,
+                row_filter or None,
+            )
+
+        for model in models_by_table.values():
+            for field in model._fields.values():
+                if field.type != "many2many" or not field.store:
+                    continue
+                comodel = self.env.registry.get(field.comodel_name)
+                tables = [model._table, comodel._table if comodel else None]
+                if any(
+                    table in classification and not classification[table][1]
+                    for table in tables
+                ):
+                    classification[field.relation] = (None, False, None, None)
+        return classification
+
+    def _sync_replication_tables(self):
+        classification = self._get_table_classification()
+        cr = self.env.cr
+        cr.execute(
+            """
+            SELECT table_name, model, replicate, columns, row_filter
+            FROM utilities_replication_table
+            """
+        )
+        if {row[0]: tuple(row[1:]) for row in cr.fetchall()} == classification:
+            return
+        cr.execute(
+            "DELETE FROM utilities_replication_table WHERE NOT table_name = ANY(%s)",
+            [list(classification)],
+        )
+        cr.execute(
+            """
+            INSERT INTO utilities_replication_table
+                (table_name, model, replicate, columns, row_filter)
+            SELECT * FROM unnest(
+                %s::varchar[], %s::varchar[], %s::bool[], %s::varchar[], %s::varchar[]
+            )
+            ON CONFLICT (table_name) DO UPDATE SET
+                model = EXCLUDED.model,
+                replicate = EXCLUDED.replicate,
+                columns = EXCLUDED.columns,
+                row_filter = EXCLUDED.row_filter
+            """,
+            [list(classification), *map(list, zip(*classification.values()))],
+        )
+
+    def _update_managed_publications(self):
+        """
+        Set the tables of the publications created by multi_master_setup.py,
+        so a module adding or removing tables updates them. The checksum of
+        the tables is kept in the comment of the publication, a publication
+        is only altered when its tables change.
+        """
+        cr = self.env.cr
+        cr.execute(
+            """
+            SELECT pubname, obj_description(oid, 'pg_publication')
+            FROM pg_publication
+            WHERE obj_description(oid, 'pg_publication') LIKE %s
+            """,
+            [CONST.MANAGED_PUBLICATION_COMMENT + "%"],
+        )
+        publications = cr.fetchall()
+        if not publications:
+            return
+        cr.execute(
+            "SELECT publication_spec FROM replication_publication_table ORDER BY 1"
+        )
+        publication_specs = [row[0] for row in cr.fetchall()]
+        checksum = hashlib.sha1(", ".join(publication_specs).encode()).hexdigest()
+        comment = f"{CONST.MANAGED_PUBLICATION_COMMENT}:{checksum}"
+
+        for publication_name, current_comment in publications:
+            if current_comment == comment:
+                continue
+            try:
+                with cr.savepoint():
+                    cr.execute(
+                        f'ALTER PUBLICATION "{publication_name}" SET TABLE '
+                        + ", ".join(publication_specs)
+                    )
+                    cr.execute(
+                        f'COMMENT ON PUBLICATION "{publication_name}" IS %s', [comment]
+                    )
+                _logger.info(
+                    "Publication %s updated to %s tables",
+                    publication_name,
+                    len(publication_specs),
+                )
+            except psycopg2.Error as e:
+                _logger.warning(
+                    "Publication %s could not be updated: %s", publication_name, e
+                )
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo import models
+
+
+class SequenceMixin(models.AbstractModel):
+    _name = "utilities.sequence.mixin"
+    _description = "Sequence references"
+
+    def _fill_sequence_refs(self, vals_list, sequence_code, field_name="ref"):
+        """
+        Set the next reference of the sequence in ``field_name`` of every
+        values of ``vals_list``, all the references are drawn at once.
+        """
+        refs = self.env["ir.sequence"].next_by_code_batch(sequence_code, len(vals_list))
+        for vals, ref in zip(vals_list, refs):
+            vals[field_name] = ref
@@ -9,7 +9,7 @@ from . import CONST
 class ThisAllApprovalGroup(models.Model):
     _name = "utilities.this.all.approval.group"
     _description = "This all approval group records"
-    _inherit = ["utilities.notification"]
+    _inherit = ["utilities.notification", "utilities.sequence.mixin"]
 
     model_name = fields.Char(string="Name", tracking=True)
     # relations
@@ -25,9 +25,7 @@ class ThisAllApprovalGroup(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            model_name = "utilities.this.all.approval.group"
-            vals["ref"] = self.env["ir.sequence"].next_by_code(model_name)
+        self._fill_sequence_refs(vals_list, "utilities.this.all.approval.group")
         return super(ThisAllApprovalGroup, self).create(vals_list)
 
     def unlink(self):
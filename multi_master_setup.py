@@ -1,7 +1,19 @@
 import psycopg2
 import yaml
 import argparse
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_RETRIES = 3
+DEFAULT_MONITOR_INTERVAL = 60
+DEFAULT_MAX_SLOT_RETENTION_MB = 10240
+DEFAULT_MAX_LAG_SECONDS = 300
+# comment of the publications whose tables are kept up to date by the Odoo
+# utilities module, see utilities.replication.table
+MANAGED_PUBLICATION_COMMENT = 'odoo:replicated tables'
 
 def create_replication_user(connection, repl_username, repl_password):
     with connection.cursor() as cursor:
@@ -12,16 +24,47 @@ def create_replication_user(connection, repl_username, repl_password):
         else:
             print(f"User '{repl_username}' already exists.")
 
+def get_publication_specs(cursor):
+    """
+    Return the tables to publish, with their column list and row filter, as
+    classified by the Odoo modules. None when the database has no
+    classification, then all the tables are published.
+    """
+    cursor.execute("SELECT to_regclass('replication_publication_table') IS NOT NULL;")
+    if not cursor.fetchone()[0]:
+        return None
+    cursor.execute("SELECT publication_spec FROM replication_publication_table ORDER BY 1;")
+    return [row[0] for row in cursor.fetchall()]
+
 def create_publication(connection, publication_name):
     with connection.cursor() as cursor:
-        cursor.execute("SELECT 1 FROM pg_publication WHERE pubname=%s", (publication_name,))
-        if cursor.fetchone() is None:
+        cursor.execute("SELECT puballtables FROM pg_publication WHERE pubname=%s", (publication_name,))
+        publication = cursor.fetchone()
+        publication_specs = get_publication_specs(cursor)
+        if publication is not None and (not publication[0] or publication_specs is None):
+            print(f"Publication '{publication_name}' already exists.")
+            return
+        if publication_specs is None:
             command = f"CREATE PUBLICATION {publication_name} FOR ALL TABLES;"
             print(f"Creating publication '{publication_name}' with command: {command}")
             cursor.execute(command)
             print(f"Publication '{publication_name}' created for all tables.")
-        else:
-            print(f"Publication '{publication_name}' already exists.")
+            return
+
+        # a filtered publication, owned by the owner of the database so Odoo
+        # can update its tables when modules are installed or updated
+        cursor.execute("SELECT pg_get_userbyid(datdba) FROM pg_database WHERE datname = current_database();")
+        owner = cursor.fetchone()[0]
+        command = f"""
+            {f"DROP PUBLICATION {publication_name};" if publication else ""}
+            CREATE PUBLICATION {publication_name} FOR TABLE {", ".join(publication_specs)};
+            COMMENT ON PUBLICATION {publication_name} IS '{MANAGED_PUBLICATION_COMMENT}';
+            ALTER PUBLICATION {publication_name} OWNER TO "{owner}";
+        """
+        print(f"{'Replacing' if publication else 'Creating'} publication '{publication_name}' for {len(publication_specs)} tables")
+        # replaced in a single transaction, the subscriptions keep their slots
+        cursor.execute("BEGIN;" + command + "COMMIT;")
+        print(f"Publication '{publication_name}' created for the replicated tables.")
 
 def create_subscription(connection, subscription_name, slot_name, repl_username, repl_password, source_config):
     with connection.cursor() as cursor:
@@ -36,7 +79,9 @@ def create_subscription(connection, subscription_name, slot_name, repl_username,
             cursor.execute(command)
             print(f"Subscription '{subscription_name}' created.")
         else:
-            print(f"Subscription '{subscription_name}' already exists.")
+            # pick up the tables added to or removed from the publication
+            cursor.execute(f"ALTER SUBSCRIPTION {subscription_name} REFRESH PUBLICATION WITH (copy_data = false);")
+            print(f"Subscription '{subscription_name}' already exists, publication refreshed.")
 
 def remove_subscriptions(connection):
     with connection.cursor() as cursor:
@@ -56,111 +101,406 @@ def remove_publications(connection):
             cursor.execute(f"DROP PUBLICATION {pub_name};")
             print(f"Publication '{pub_name}' dropped.")
 
-def connect_to_db(config):
-    return psycopg2.connect(
+def connect_to_db(config, timeout=None):
+    params = dict(
         host=config['host'],
         port=config['port'],
         dbname=config['dbname'],
         user=config['user'],
         password=config['password']
     )
+    if timeout:
+        # bound both the connection and every statement, CREATE SUBSCRIPTION
+        # waits on the remote server to create its replication slot
+        params['connect_timeout'] = timeout
+        params['options'] = f"-c statement_timeout={int(timeout * 1000)}"
+    return psycopg2.connect(**params)
 
-def process_server(config, repl_username, repl_password, create_repl_user_only, all_configs, is_land_server=False):
-    connection = None
-    try:
-        connection = connect_to_db(config)
-        connection.autocommit = True
-        create_replication_user(connection, repl_username, repl_password)
-        if create_repl_user_only:
-            if connection:
-                connection.close()
-            return
-        
-        # wait for 1 seconds for the replication user to be created
-        print("Waiting for 1 seconds for the replication user to be created...")
-        time.sleep(1)
-
+def plan_replication(all_configs):
+    """
+    Return the desired state of the full mesh: every server publishes all its
+    tables and subscribes to the publication of every other server.
+    {server name: {'publication': name, 'subscriptions': {name: (slot name, source config)}}}
+    """
+    plan = {}
+    for config in all_configs:
+        subscriptions = {}
         for other_config in all_configs:
             if other_config != config:
                 subscription_name = f"ship_{other_config['name']}_subscription"
                 slot_name = f"from_{config['name']}_to_{other_config['name']}_sub_slot"
-                create_subscription(connection, subscription_name, slot_name, repl_username, repl_password, other_config)
-    except Exception as e:
-        print(f"Error connecting to {config['host']}:{config['port']} - {e}")
-    finally:
-        if connection:
-            connection.close()
+                subscriptions[subscription_name] = (slot_name, other_config)
+        plan[config['name']] = {
+            'publication': config['publication_name'],
+            'subscriptions': subscriptions,
+        }
+    return plan
 
-def create_resolve_conflicts_handling_triggers(connection):
+def get_replication_state(connection):
+    """
+    Return the publications and subscriptions of the database:
+    (set of publication names, {subscription name: (slot name, [publication names])})
+    """
     with connection.cursor() as cursor:
+        cursor.execute("SELECT pubname FROM pg_publication;")
+        publications = {row[0] for row in cursor.fetchall()}
         cursor.execute("""
-            SELECT table_name 
-            FROM information_schema.columns 
-            WHERE column_name = 'write_date' AND table_schema = 'public';
+            SELECT subname, subslotname, subpublications
+            FROM pg_subscription
+            WHERE subdbid = (SELECT oid FROM pg_database WHERE datname = current_database());
         """)
-        tables = cursor.fetchall()
-        
-        for table in tables:
-            table_name = table[0]
-            trigger_function = f"""
-            CREATE OR REPLACE FUNCTION {table_name}_resolve_conflict() RETURNS TRIGGER AS $$
+        subscriptions = {name: (slot_name, list(pubs)) for name, slot_name, pubs in cursor.fetchall()}
+    return publications, subscriptions
+
+def diff_replication_state(server_plan, state):
+    """
+    Return the differences between the desired and the actual state of a
+    server, as lines: "+" is missing, "-" is not planned, "~" differs.
+    """
+    publications, subscriptions = state
+    lines = []
+    if server_plan['publication'] not in publications:
+        lines.append(f"+ publication {server_plan['publication']}")
+    for publication_name in sorted(publications - {server_plan['publication']}):
+        lines.append(f"- publication {publication_name}")
+    for subscription_name, (slot_name, source_config) in sorted(server_plan['subscriptions'].items()):
+        if subscription_name not in subscriptions:
+            lines.append(f"+ subscription {subscription_name} to {source_config['publication_name']}@{source_config['name']}")
+            continue
+        actual_slot_name, actual_publications = subscriptions[subscription_name]
+        if actual_slot_name != slot_name or actual_publications != [source_config['publication_name']]:
+            lines.append(f"~ subscription {subscription_name}: slot {actual_slot_name}, publications {', '.join(actual_publications)}"
+                         f" (planned slot {slot_name}, publication {source_config['publication_name']})")
+    for subscription_name in sorted(set(subscriptions) - set(server_plan['subscriptions'])):
+        lines.append(f"- subscription {subscription_name}")
+    return lines
+
+def print_replication_diff(plan, states):
+    for server_name, server_plan in plan.items():
+        state = states.get(server_name)
+        if isinstance(state, Exception) or state is None:
+            print(f"[{server_name}] unknown state: {state}")
+            continue
+        lines = diff_replication_state(server_plan, state)
+        if not lines:
+            print(f"[{server_name}] in sync")
+        for line in lines:
+            print(f"[{server_name}] {line}")
+
+def run_on_servers(all_configs, func, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, jobs=None):
+    """
+    Call ``func(connection, config)`` on every server at the same time, each
+    with its own autocommit connection. A server failing is retried up to
+    ``retries`` times with a growing delay, ``func`` must be idempotent.
+    Return {server name: result of func, or the last exception}
+    """
+    def run(config):
+        for attempt in range(1, retries + 2):
+            connection = None
+            try:
+                connection = connect_to_db(config, timeout)
+                connection.autocommit = True
+                return func(connection, config)
+            except Exception as e:
+                print(f"[{config['name']}] attempt {attempt} failed on {config['host']}:{config['port']} - {e}")
+                if attempt > retries:
+                    return e
+                time.sleep(2 ** (attempt - 1))
+            finally:
+                if connection:
+                    connection.close()
+
+    with ThreadPoolExecutor(max_workers=jobs or len(all_configs)) as executor:
+        results = executor.map(run, all_configs)
+        return {config['name']: result for config, result in zip(all_configs, results)}
+
+def setup_replication(all_configs, repl_username, repl_password, create_repl_user_only=False,
+                      dry_run=False, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, jobs=None):
+    """
+    Set up the full mesh in parallel. The replication users and publications
+    of all the servers are created first, as a subscription needs both on its
+    source server, then every server creates its missing subscriptions.
+    Everything already in place is kept, running it again is a no-op.
+    Return True when the fleet matches the plan.
+    """
+    plan = plan_replication(all_configs)
+
+    def read_state(connection, config):
+        return get_replication_state(connection)
+
+    def setup_publisher(connection, config):
+        create_replication_user(connection, repl_username, repl_password)
+        create_publication(connection, config['publication_name'])
+        return get_replication_state(connection)
+
+    def setup_subscriber(connection, config):
+        subscriptions = plan[config['name']]['subscriptions']
+        for subscription_name, (slot_name, source_config) in subscriptions.items():
+            create_subscription(connection, subscription_name, slot_name, repl_username, repl_password, source_config)
+        return get_replication_state(connection)
+
+    if dry_run:
+        print("----------Replication diff (desired vs actual)...")
+        print_replication_diff(plan, run_on_servers(all_configs, read_state, timeout, retries, jobs))
+        return False
+
+    print(f"----------Creating replication users and publications on {len(all_configs)} servers...")
+    states = run_on_servers(all_configs, setup_publisher, timeout, retries, jobs)
+    print("----------Replication diff (desired vs actual)...")
+    print_replication_diff(plan, states)
+    failed_publishers = [name for name, state in states.items() if isinstance(state, Exception)]
+    if failed_publishers:
+        print(f"Not creating subscriptions, servers unreachable: {', '.join(failed_publishers)}")
+        return False
+    if create_repl_user_only:
+        return True
+
+    print(f"----------Creating subscriptions on {len(all_configs)} servers...")
+    states = run_on_servers(all_configs, setup_subscriber, timeout, retries, jobs)
+    print("----------Replication diff after setup...")
+    print_replication_diff(plan, states)
+    return all(
+        not isinstance(states[name], Exception) and not diff_replication_state(server_plan, states[name])
+        for name, server_plan in plan.items()
+    )
+
+CONFLICT_TABLE = 'replication_conflict'
+CONFLICT_FUNCTION = 'resolve_write_date_conflict'
+CONFLICT_TRIGGER = 'resolve_conflict_trigger'
+
+def get_write_date_tables(cursor):
+    cursor.execute("""
+        SELECT c.table_name
+        FROM information_schema.columns c
+        JOIN information_schema.tables t
+            ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+        WHERE c.column_name = 'write_date' AND c.table_schema = 'public'
+        AND t.table_type = 'BASE TABLE';
+    """)
+    return [row[0] for row in cursor.fetchall()]
+
+def create_resolve_conflicts_handling_triggers(connection):
+    """
+    Keep the most recent version of a row when a replicated update is older
+    than the local row (last write wins on write_date).
+    The triggers are enabled in replica mode only: they fire for the updates
+    applied by the subscriptions, never for the local writes. The function is
+    only called when the update loses (WHEN clause), it skips the update and
+    records the conflict in the conflict table. Conflicts recorded by an apply
+    worker are not published further (subscriptions use origin = none).
+    """
+    with connection.cursor() as cursor:
+        tables = get_write_date_tables(cursor)
+        commands = [f"""
+            CREATE TABLE IF NOT EXISTS {CONFLICT_TABLE} (
+                table_name text NOT NULL,
+                row_id bigint,
+                local_write_date timestamp,
+                remote_write_date timestamp,
+                create_date timestamp NOT NULL DEFAULT (now() AT TIME ZONE 'UTC')
+            );
+            CREATE OR REPLACE FUNCTION {CONFLICT_FUNCTION}() RETURNS TRIGGER AS $$
             BEGIN
-                -- Debug logging
-                RAISE NOTICE 'Trigger called on table: {table_name}, OLD.write_date: %, NEW.write_date: %', OLD.write_date, NEW.write_date;
-                
-                IF NEW.write_date > OLD.write_date THEN
-                    RAISE NOTICE 'NEW row accepted on table: {table_name}, NEW.write_date: %', NEW.write_date;
-                    RETURN NEW;
-                ELSE
-                    RAISE NOTICE 'OLD row retained on table: {table_name}, OLD.write_date: %', OLD.write_date;
-                    RETURN OLD;
-                END IF;
+                INSERT INTO {CONFLICT_TABLE} (table_name, row_id, local_write_date, remote_write_date)
+                VALUES (TG_TABLE_NAME, OLD.id, OLD.write_date, NEW.write_date);
+                RETURN NULL;
             END;
             $$ LANGUAGE plpgsql;
-            """
-            cursor.execute(trigger_function)
-            
-            # Drop the trigger if it already exists
-            drop_trigger = f"""
-            DROP TRIGGER IF EXISTS resolve_conflict_trigger ON {table_name};
-            """
-            cursor.execute(drop_trigger)
-            
-            # Create the trigger
-            trigger_creation = f"""
-            CREATE TRIGGER resolve_conflict_trigger
+        """]
+        for table_name in tables:
+            # the per-table functions are from the previous, always enabled triggers
+            commands.append(f"""
+            DROP TRIGGER IF EXISTS {CONFLICT_TRIGGER} ON {table_name};
+            DROP FUNCTION IF EXISTS {table_name}_resolve_conflict();
+            CREATE TRIGGER {CONFLICT_TRIGGER}
             BEFORE UPDATE ON {table_name}
             FOR EACH ROW
-            EXECUTE FUNCTION {table_name}_resolve_conflict();
-            """
-            cursor.execute(trigger_creation)
-            
-            # Enable the trigger always
-            enable_trigger = f"""
+            WHEN ((NEW.write_date > OLD.write_date) IS NOT TRUE)
+            EXECUTE FUNCTION {CONFLICT_FUNCTION}();
             ALTER TABLE {table_name}
-            ENABLE ALWAYS TRIGGER resolve_conflict_trigger;
-            """
-            cursor.execute(enable_trigger)
-            
-            print(f"Conflict resolution trigger created and enabled always for table {table_name}")
+            ENABLE REPLICA TRIGGER {CONFLICT_TRIGGER};
+            """)
+        # a single transaction for all the tables
+        cursor.execute("BEGIN;" + "".join(commands) + "COMMIT;")
+        print(f"Conflict resolution trigger created and enabled for replication on {len(tables)} tables, "
+              f"conflicts are recorded in {CONFLICT_TABLE}")
 
 def remove_resolve_conflicts_handling_triggers(connection):
+    # the conflict table is kept for auditing
     with connection.cursor() as cursor:
-        cursor.execute("""
-            SELECT table_name 
-            FROM information_schema.columns 
-            WHERE column_name = 'write_date' AND table_schema = 'public';
-        """)
-        tables = cursor.fetchall()
-        
-        for table in tables:
-            table_name = table[0]
-            trigger_removal = f"""
-            DROP TRIGGER IF EXISTS resolve_conflict_trigger ON {table_name};
+        tables = get_write_date_tables(cursor)
+        commands = [
+            f"""
+            DROP TRIGGER IF EXISTS {CONFLICT_TRIGGER} ON {table_name};
             DROP FUNCTION IF EXISTS {table_name}_resolve_conflict();
             """
-            cursor.execute(trigger_removal)
-            print(f"Conflict resolution trigger removed for table {table_name}")
+            for table_name in tables
+        ]
+        commands.append(f"DROP FUNCTION IF EXISTS {CONFLICT_FUNCTION}();")
+        cursor.execute("BEGIN;" + "".join(commands) + "COMMIT;")
+        print(f"Conflict resolution trigger removed for {len(tables)} tables")
+
+SUBSCRIPTION_STATS_QUERY = """
+    SELECT subname AS name,
+        pid IS NOT NULL AS active,
+        pg_wal_lsn_diff(received_lsn, '0/0')::bigint AS received_bytes,
+        EXTRACT(EPOCH FROM now() - last_msg_receipt_time)::float AS last_msg_age_seconds
+    FROM pg_stat_subscription
+    WHERE relid IS NULL;
+"""
+SLOT_STATS_QUERY = """
+    SELECT slot_name AS name,
+        active,
+        pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn)::bigint AS retained_bytes,
+        pg_wal_lsn_diff(pg_current_wal_lsn(), confirmed_flush_lsn)::bigint AS lag_bytes,
+        wal_status,
+        safe_wal_size
+    FROM pg_replication_slots
+    WHERE slot_type = 'logical';
+"""
+SENDER_STATS_QUERY = """
+    SELECT application_name AS name,
+        client_addr::text AS client_addr,
+        state,
+        pg_wal_lsn_diff(sent_lsn, '0/0')::bigint AS sent_bytes,
+        pg_wal_lsn_diff(pg_current_wal_lsn(), replay_lsn)::bigint AS lag_bytes,
+        EXTRACT(EPOCH FROM replay_lag)::float AS lag_seconds
+    FROM pg_stat_replication;
+"""
+
+def fetch_dicts(cursor, query):
+    cursor.execute(query)
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+def get_replication_stats(connection):
+    """
+    Return the replication statistics of a server as lists of rows:
+    {'subscription': [...], 'slot': [...], 'sender': [...]}
+    """
+    with connection.cursor() as cursor:
+        return {
+            'subscription': fetch_dicts(cursor, SUBSCRIPTION_STATS_QUERY),
+            'slot': fetch_dicts(cursor, SLOT_STATS_QUERY),
+            'sender': fetch_dicts(cursor, SENDER_STATS_QUERY),
+        }
+
+class ReplicationMonitor:
+    """
+    Turn the polled statistics of the servers into time series samples and
+    alerts. The apply and send rates are computed from the byte counters of
+    two consecutive polls.
+    """
+    # {kind: byte counter the rate is computed from}
+    RATE_COUNTERS = {'subscription': 'received_bytes', 'sender': 'sent_bytes'}
+
+    def __init__(self, max_slot_retention_bytes, max_lag_seconds):
+        self.max_slot_retention_bytes = max_slot_retention_bytes
+        self.max_lag_seconds = max_lag_seconds
+        # {(server, kind, name): (poll time, byte counter)}
+        self.counters = {}
+
+    def process(self, stats_by_server, poll_time):
+        """
+        :param stats_by_server: {server name: stats, or the exception raised polling it}
+        :return: (samples, alerts)
+        """
+        samples = []
+        alerts = []
+        timestamp = datetime.fromtimestamp(poll_time, timezone.utc).isoformat()
+        for server, stats in stats_by_server.items():
+            if isinstance(stats, Exception):
+                alerts.append(f"{server}: unreachable - {stats}")
+                continue
+            for kind, rows in stats.items():
+                for row in rows:
+                    sample = dict(row, time=timestamp, server=server, kind=kind)
+                    self._add_rate(sample, poll_time)
+                    samples.append(sample)
+                    alerts += self._check(sample)
+        return samples, alerts
+
+    def _add_rate(self, sample, poll_time):
+        counter_field = self.RATE_COUNTERS.get(sample['kind'])
+        counter = sample.get(counter_field)
+        if counter is None:
+            return
+        key = (sample['server'], sample['kind'], sample['name'])
+        previous = self.counters.get(key)
+        self.counters[key] = (poll_time, counter)
+        if previous and poll_time > previous[0] and counter >= previous[1]:
+            sample['bytes_per_second'] = (counter - previous[1]) / (poll_time - previous[0])
+
+    def _check(self, sample):
+        where = f"{sample['server']}: {sample['kind']} {sample['name']}"
+        alerts = []
+        if sample['kind'] == 'slot':
+            retained_bytes = sample['retained_bytes'] or 0
+            if retained_bytes >= self.max_slot_retention_bytes:
+                alerts.append(f"{where} retains {retained_bytes / 1024 ** 2:.0f} MB of WAL"
+                              f" (active: {sample['active']})")
+            if sample['wal_status'] in ('unreserved', 'lost'):
+                alerts.append(f"{where} WAL status is {sample['wal_status']}")
+        elif sample['kind'] == 'subscription':
+            if not sample['active']:
+                alerts.append(f"{where} has no running apply worker")
+            elif (sample['last_msg_age_seconds'] or 0) >= self.max_lag_seconds:
+                alerts.append(f"{where} received nothing for {sample['last_msg_age_seconds']:.0f} s")
+        elif sample['kind'] == 'sender':
+            if (sample['lag_seconds'] or 0) >= self.max_lag_seconds:
+                alerts.append(f"{where} is {sample['lag_seconds']:.0f} s behind")
+        return alerts
+
+def print_replication_stats(samples):
+    for sample in samples:
+        if sample['kind'] == 'subscription':
+            details = f"active {sample['active']}, last message {sample['last_msg_age_seconds']} s ago"
+        elif sample['kind'] == 'slot':
+            details = f"active {sample['active']}, retains {sample['retained_bytes']} bytes, lag {sample['lag_bytes']} bytes"
+        else:
+            details = f"{sample['state']}, lag {sample['lag_bytes']} bytes / {sample['lag_seconds']} s"
+        if 'bytes_per_second' in sample:
+            details += f", {sample['bytes_per_second']:.0f} bytes/s"
+        print(f"[{sample['server']}] {sample['kind']} {sample['name']}: {details}")
+
+def monitor_replication(all_configs, output_file=None, interval=DEFAULT_MONITOR_INTERVAL, count=0,
+                        max_slot_retention_mb=DEFAULT_MAX_SLOT_RETENTION_MB, max_lag_seconds=DEFAULT_MAX_LAG_SECONDS,
+                        timeout=DEFAULT_TIMEOUT, retries=0):
+    """
+    Poll the replication statistics of every server in parallel every
+    ``interval`` seconds, ``count`` times or forever when 0. The samples are
+    appended to ``output_file`` as JSON lines.
+    Return the number of alerts raised.
+    """
+    monitor = ReplicationMonitor(max_slot_retention_mb * 1024 ** 2, max_lag_seconds)
+    alert_count = 0
+    polls = 0
+    while True:
+        poll_time = time.time()
+        stats_by_server = run_on_servers(
+            all_configs, lambda connection, config: get_replication_stats(connection), timeout, retries
+        )
+        samples, alerts = monitor.process(stats_by_server, poll_time)
+        print(f"----------Replication stats at {datetime.fromtimestamp(poll_time, timezone.utc).isoformat()}")
+        print_replication_stats(samples)
+        for alert in alerts:
+            print(f"ALERT {alert}")
+        alert_count += len(alerts)
+        if output_file:
+            with open(output_file, 'a') as file:
+                for sample in samples:
+                    file.write(json.dumps(sample) + "\n")
+
+        polls += 1
+        if count and polls >= count:
+            return alert_count
+        time.sleep(max(interval - (time.time() - poll_time), 0))
+
+def load_server_configs(config_file):
+    with open(config_file, 'r') as file:
+        config = yaml.safe_load(file)
+    config['land_server']['name'] = 'land'
+    return [config['land_server']] + config['ship_servers']
 
 def main():
     parser = argparse.ArgumentParser(description='Create replication user, publication, and subscriptions in PostgreSQL databases.')
@@ -172,6 +512,10 @@ def main():
     repl_setup.add_argument('--repl_password', help='Password for the replication user.')
     repl_setup.add_argument('--publication_name', nargs='?', default='qlt_publication', help='Name of the publication to create (default: qlt_publication).')
     repl_setup.add_argument('--create_repl_user_only', action='store_true', help='Only create replication user and exit.')
+    repl_setup.add_argument('--dry_run', action='store_true', help='Only print the diff of the desired vs actual publications and subscriptions.')
+    repl_setup.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help=f'Connection and statement timeout per server in seconds (default: {DEFAULT_TIMEOUT}).')
+    repl_setup.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help=f'Retries per server on failure (default: {DEFAULT_RETRIES}).')
+    repl_setup.add_argument('--jobs', type=int, help='Number of servers processed at the same time (default: all).')
 
     repl_removal = subparsers.add_parser('remove', help="Remove replication settings in all servers.")
     repl_removal.add_argument('--config_file', help='Path to the YAML configuration file.')
@@ -182,33 +526,28 @@ def main():
     trigger_remove = subparsers.add_parser('remove_triggers', help="Remove triggers and functions handling duplicate key errors.")
     trigger_remove.add_argument('--config_file', help='Path to the YAML configuration file.')
 
+    repl_monitor = subparsers.add_parser('monitor', help="Monitor the replication lag, throughput and WAL retention of all servers.")
+    repl_monitor.add_argument('--config_file', help='Path to the YAML configuration file.')
+    repl_monitor.add_argument('--interval', type=int, default=DEFAULT_MONITOR_INTERVAL, help=f'Seconds between two polls (default: {DEFAULT_MONITOR_INTERVAL}).')
+    repl_monitor.add_argument('--count', type=int, default=0, help='Number of polls, 0 to poll until interrupted (default: 0).')
+    repl_monitor.add_argument('--output', help='Append the samples to this file as JSON lines.')
+    repl_monitor.add_argument('--max_slot_retention_mb', type=int, default=DEFAULT_MAX_SLOT_RETENTION_MB, help=f'Alert when a slot retains more WAL (default: {DEFAULT_MAX_SLOT_RETENTION_MB}).')
+    repl_monitor.add_argument('--max_lag_seconds', type=int, default=DEFAULT_MAX_LAG_SECONDS, help=f'Alert when a subscription or a sender lags more (default: {DEFAULT_MAX_LAG_SECONDS}).')
+    repl_monitor.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help=f'Connection and statement timeout per server in seconds (default: {DEFAULT_TIMEOUT}).')
+
     args = parser.parse_args()
 
     if args.command == 'repl':
         config_file, repl_username, repl_password, create_repl_user_only = \
             args.config_file, args.repl_username, args.repl_password, args.create_repl_user_only
-        with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
-
-        config['land_server']['name'] = 'land'
-
-        all_configs = [config['land_server']] + config['ship_servers']
-
-        # for each server, create publication
-        for server_config in all_configs:
-            connection = connect_to_db(server_config)
-            connection.autocommit = True
-            create_publication(connection, server_config['publication_name'])
-            connection.close()
-
-        # Process land server
-        print(f"----------Processing land server at {config['land_server']['host']}...")
-        process_server(config['land_server'], repl_username, repl_password, create_repl_user_only, all_configs, is_land_server=True)
+        all_configs = load_server_configs(config_file)
 
-        # Process ship servers
-        for ship_config in config['ship_servers']:
-            print(f"----------Processing ship server at {ship_config['host']}...")
-            process_server(ship_config, repl_username, repl_password, create_repl_user_only, all_configs)
+        in_sync = setup_replication(
+            all_configs, repl_username, repl_password, create_repl_user_only,
+            dry_run=args.dry_run, timeout=args.timeout, retries=args.retries, jobs=args.jobs
+        )
+        if not args.dry_run and not in_sync:
+            raise SystemExit(1)
     elif args.command == 'remove':
         config_file = args.config_file
         with open(config_file, 'r') as file:
@@ -244,6 +583,13 @@ def main():
             connection.autocommit = True
             remove_resolve_conflicts_handling_triggers(connection)
             connection.close()
+    elif args.command == 'monitor':
+        alert_count = monitor_replication(
+            load_server_configs(args.config_file), args.output, args.interval, args.count,
+            args.max_slot_retention_mb, args.max_lag_seconds, args.timeout
+        )
+        if alert_count:
+            raise SystemExit(1)
 
 if __name__ == "__main__":
     main()
@@ -7,6 +7,7 @@ from psycopg2 import sql
 
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
+from odoo.tools.sql import move_sequences_to_node_range, node_sequence_value
 
 _logger = logging.getLogger(__name__)
 
@@ -16,7 +17,7 @@ def _create_sequence(cr, seq_name, number_increment, number_next):
     if number_increment == 0:
         raise UserError(_('Step must not be zero.'))
     sql = "CREATE SEQUENCE %s INCREMENT BY %%s START WITH %%s" % seq_name
-    cr.execute(sql, (number_increment, number_next))
+    cr.execute(sql, (number_increment, node_sequence_value(number_next)))
 
 
 def _drop_sequences(cr, seq_names):
@@ -42,7 +43,7 @@ def _alter_sequence(cr, seq_name, number_increment=None, number_next=None):
         params.append(number_increment)
     if number_next is not None:
         statement += sql.SQL("RESTART WITH") + sql.Placeholder()
-        params.append(number_next)
+        params.append(node_sequence_value(number_next))
     cr.execute(statement.join(' '), params)
 
 
@@ -196,6 +197,12 @@ class IrSequence(models.Model):
         self.flush_model(values.keys())
         return res
 
+    def _register_hook(self):
+        # sequences created before the node id was set, by SQL or by the
+        # database template are moved into the range of the node
+        super()._register_hook()
+        move_sequences_to_node_range(self._cr)
+
     def _next_do(self):
         if self.implementation == 'standard':
             number_next = _select_nextval(self._cr, 'ir_sequence_%03d' % self.id)
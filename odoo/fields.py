@@ -1037,6 +1037,9 @@ class Field(MetaField('DummyField', (object,), {})):
             return
         if column['udt_name'] == self.column_type[0]:
             return
+        if column['udt_name'] == 'int8' and self.column_type[0] == 'int4':
+            # integer columns widened for the ids of multi-master nodes are kept
+            return
         if column['is_nullable'] == 'NO':
             sql.drop_not_null(model._cr, model._table, self.name)
         self._convert_db_column(model, column)
@@ -4704,12 +4707,13 @@ class Many2many(_RelationalMulti):
         comodel = model.env[self.comodel_name]
         if not sql.table_exists(cr, self.relation):
             query = """
-                CREATE TABLE "{rel}" ("{id1}" INTEGER NOT NULL,
-                                      "{id2}" INTEGER NOT NULL,
+                CREATE TABLE "{rel}" ("{id1}" {type} NOT NULL,
+                                      "{id2}" {type} NOT NULL,
                                       PRIMARY KEY("{id1}","{id2}"));
                 COMMENT ON TABLE "{rel}" IS %s;
                 CREATE INDEX ON "{rel}" ("{id2}","{id1}");
-            """.format(rel=self.relation, id1=self.column1, id2=self.column2)
+            """.format(rel=self.relation, id1=self.column1, id2=self.column2,
+                       type=sql.node_column_type('INTEGER'))
             cr.execute(query, ['RELATION BETWEEN %s AND %s' % (model._table, comodel._table)])
             _schema.debug("Create table %r: m2m relation between %r and %r", self.relation, model._table, comodel._table)
             model.pool.post_init(self.update_db_foreign_keys, model)
@@ -13,8 +13,13 @@ import odoo.sql_db
 from collections import defaultdict
 from contextlib import closing
 
+from .config import config
+
 _schema = logging.getLogger('odoo.schema')
 
+# size of the range of ids and sequence values of a node in a multi-master setup
+NODE_SEQUENCE_RANGE_SIZE = 10 ** 12
+
 _CONFDELTYPES = {
     'RESTRICT': 'r',
     'NO ACTION': 'a',
@@ -70,13 +75,71 @@ SQL_ORDER_BY_TYPE = defaultdict(lambda: 16, {
     'float8': 9,        # 8 bytes aligned on 8 bytes
 })
 
+def node_sequence_range():
+    """ Return the first and last values of the ids and sequences of this node
+        in a multi-master setup, or ``None`` when no node id is configured.
+    """
+    node_id = config.get('node_id')
+    if not node_id:
+        return None
+    return node_id * NODE_SEQUENCE_RANGE_SIZE, (node_id + 1) * NODE_SEQUENCE_RANGE_SIZE - 1
+
+def node_sequence_value(value):
+    """ Return the sequence value ``value`` moved into the range of this node,
+        a value counted from 1 keeps its offset in the range.
+    """
+    node_range = node_sequence_range()
+    if not node_range or node_range[0] <= value <= node_range[1]:
+        return value
+    if 0 < value < NODE_SEQUENCE_RANGE_SIZE:
+        return node_range[0] + value - 1
+    return node_range[0]
+
+def node_column_type(columntype):
+    """ Return the column type able to hold the ids of this node: integer
+        columns are created as bigint when a node id is configured.
+    """
+    if node_sequence_range():
+        return re.sub(r'^(int4|integer)\b', 'int8', columntype, flags=re.IGNORECASE)
+    return columntype
+
+def move_sequences_to_node_range(cr):
+    """ Restart at the first value of the node range the bigint sequences of
+        the current schema which are outside of it. The sequences of integer
+        columns are left as they are, their columns must be converted first.
+    """
+    node_range = node_sequence_range()
+    if not node_range:
+        return
+    cr.execute("""
+        SELECT s.sequencename, setval(format('%%I.%%I', s.schemaname, s.sequencename), %s, false)
+          FROM pg_sequences s
+         WHERE s.schemaname = current_schema()
+           AND s.data_type = 'bigint'::regtype
+           AND COALESCE(s.last_value, 0) NOT BETWEEN %s AND %s
+           AND NOT EXISTS (
+                SELECT 1
+                  FROM pg_depend d
+                  JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid
+                 WHERE d.classid = 'pg_class'::regclass
+                   AND d.objid = format('%%I.%%I', s.schemaname, s.sequencename)::regclass
+                   AND d.deptype IN ('a', 'i')
+                   AND a.atttypid <> 'int8'::regtype
+           )
+    """, [node_range[0], node_range[0], node_range[1]])
+    for sequencename, _value in cr.fetchall():
+        _schema.info("Sequence %r: restarted at %s for node %s", sequencename, node_range[0], config['node_id'])
+
 def create_model_table(cr, tablename, comment=None, columns=()):
     """ Create the table for a model. """
-    colspecs = ['id SERIAL NOT NULL'] + [
-        '"{}" {}'.format(columnname, columntype)
+    node_range = node_sequence_range()
+    colspecs = ['id BIGSERIAL NOT NULL' if node_range else 'id SERIAL NOT NULL'] + [
+        '"{}" {}'.format(columnname, node_column_type(columntype))
         for columnname, columntype, columncomment in columns
     ]
     cr.execute('CREATE TABLE "{}" ({}, PRIMARY KEY(id))'.format(tablename, ", ".join(colspecs)))
+    if node_range:
+        cr.execute("SELECT setval(pg_get_serial_sequence(%s, 'id'), %s, false)", [tablename, node_range[0]])
 
     queries, params = [], []
     if comment:
@@ -111,6 +174,7 @@ def column_exists(cr, tablename, columnname):
 
 def create_column(cr, tablename, columnname, columntype, comment=None):
     """ Create a column with the given type. """
+    columntype = node_column_type(columntype)
     coldefault = (columntype.upper()=='BOOLEAN') and 'DEFAULT false' or ''
     cr.execute('ALTER TABLE "{}" ADD COLUMN "{}" {} {}'.format(tablename, columnname, columntype, coldefault))
     if comment:
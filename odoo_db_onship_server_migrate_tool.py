@@ -2,11 +2,18 @@
 
 import argparse
 import psycopg2
-from psycopg2 import sql
+from psycopg2 import errorcodes, sql
+from psycopg2.pool import ThreadedConnectionPool
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import os
+import threading
+import time
 
 SEQUENCE_PADDING = 1000000000000
+DEFAULT_JOBS = 4
+# errors of a table rewrite waiting on the rewrite of a table it has a foreign key with
+LOCK_CONFLICT_PGCODES = (errorcodes.DEADLOCK_DETECTED, errorcodes.LOCK_NOT_AVAILABLE)
 
 def get_sequences(conn, schema=None, prefix=None, exclude_prefix=None):
     query = """
@@ -37,43 +44,148 @@ def get_sequences(conn, schema=None, prefix=None, exclude_prefix=None):
         sequences = cur.fetchall()
     return sequences
 
-def get_int_columns(conn, schema=None):
+def get_int_columns_by_table(conn, schema=None):
+    """
+    Return the int columns grouped per table, largest tables first:
+    [(table_schema, table_name, [column_name, ...], pg_relation_size), ...]
+    """
     query = """
-        SELECT table_schema, table_name, column_name 
-        FROM information_schema.columns 
-        WHERE ( data_type = 'integer' OR data_type = 'int4' )
-        AND table_schema NOT IN ('information_schema', 'pg_catalog')
+        SELECT c.table_schema, c.table_name,
+            array_agg(c.column_name::text ORDER BY c.ordinal_position),
+            pg_relation_size((quote_ident(c.table_schema) || '.' || quote_ident(c.table_name))::regclass)
+        FROM information_schema.columns c
+        JOIN information_schema.tables t
+            ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+        WHERE ( c.data_type = 'integer' OR c.data_type = 'int4' )
+        AND t.table_type = 'BASE TABLE'
+        AND c.table_schema NOT IN ('information_schema', 'pg_catalog')
     """
     if schema:
-        query += " AND table_schema = %s"
+        query += " AND c.table_schema = %s"
         params = (schema,)
     else:
         params = ()
-    
+    query += " GROUP BY c.table_schema, c.table_name ORDER BY 4 DESC, 1, 2"
+
     with conn.cursor() as cur:
         cur.execute(query, params)
-        columns = cur.fetchall()
-    return columns
+        tables = cur.fetchall()
+    return tables
 
-def convert_column_to_bigint(conn, table_schema, table_name, column_name):
+def convert_table_columns_to_bigint(conn, table_schema, table_name, column_names):
+    # a single ALTER TABLE for all the columns, postgres rewrites the table once
     with conn.cursor() as cur:
         try:
             alter_table_query = sql.SQL("""
                 ALTER TABLE {schema}.{table}
-                ALTER COLUMN {column} TYPE bigint
-                USING {column}::bigint
+                {alter_columns}
             """).format(
                 schema=sql.Identifier(table_schema),
                 table=sql.Identifier(table_name),
-                column=sql.Identifier(column_name)
+                alter_columns=sql.SQL(", ").join(
+                    sql.SQL("ALTER COLUMN {column} TYPE bigint USING {column}::bigint").format(
+                        column=sql.Identifier(column_name)
+                    )
+                    for column_name in column_names
+                )
             )
             cur.execute(alter_table_query)
             conn.commit()
         except Exception as e:
             conn.rollback()
-            print(f"Error converting {table_schema}.{table_name}.{column_name} to bigint: {e}")
+            print(f"Error converting {table_schema}.{table_name} ({', '.join(column_names)}) to bigint: {e}")
             raise e
-        print(f"Converted {table_schema}.{table_name}.{column_name} to bigint.")
+        print(f"Converted {table_schema}.{table_name} ({', '.join(column_names)}) to bigint.")
+
+def format_size(size):
+    for unit in ('B', 'kB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+def print_int_columns_plan(tables, jobs):
+    total_size = sum(size for _, _, _, size in tables)
+    total_columns = sum(len(column_names) for _, _, column_names, _ in tables)
+    print(f"Plan: convert {total_columns} int columns of {len(tables)} tables "
+          f"({format_size(total_size)}) to bigint with {jobs} parallel jobs")
+    for table_schema, table_name, column_names, size in tables:
+        print(f"  {table_schema}.{table_name} ({format_size(size)}): {', '.join(column_names)}")
+
+def convert_int_columns_to_bigint(conn_params, tables, jobs=DEFAULT_JOBS):
+    """
+    Convert the int columns of the tables to bigint, up to ``jobs`` tables at
+    the same time over a connection pool, largest tables first so the longest
+    rewrites do not end up running alone. The progress and the ETA are based
+    on the pg_relation_size of the converted tables.
+    A table that failed on a lock conflict with a parallel rewrite is converted
+    again once the others are done.
+    Return the tables which could not be converted.
+    """
+    total_size = sum(size for _, _, _, size in tables)
+    progress = {'tables': 0, 'size': 0}
+    progress_lock = threading.Lock()
+    start = time.monotonic()
+
+    def report_progress(size):
+        with progress_lock:
+            progress['tables'] += 1
+            progress['size'] += size
+            elapsed = time.monotonic() - start
+            done = progress['size'] / total_size if total_size else progress['tables'] / len(tables)
+            eta = format_duration(elapsed * (1 - done) / done) if done else "unknown"
+            print(f"Progress: {progress['tables']}/{len(tables)} tables, "
+                  f"{format_size(progress['size'])}/{format_size(total_size)} ({done:.1%}), "
+                  f"elapsed {format_duration(elapsed)}, ETA {eta}")
+
+    pool = ThreadedConnectionPool(1, max(jobs, 1), **conn_params)
+
+    def convert(table):
+        table_schema, table_name, column_names, size = table
+        conn = pool.getconn()
+        try:
+            convert_table_columns_to_bigint(conn, table_schema, table_name, column_names)
+        finally:
+            pool.putconn(conn)
+        report_progress(size)
+
+    failed_tables = []
+    lock_conflict_tables = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+            futures = {executor.submit(convert, table): table for table in tables}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except psycopg2.Error as e:
+                    if e.pgcode in LOCK_CONFLICT_PGCODES:
+                        lock_conflict_tables.append(futures[future])
+                    else:
+                        failed_tables.append(futures[future])
+                except Exception:
+                    failed_tables.append(futures[future])
+
+        for table in lock_conflict_tables:
+            print(f"Retrying {table[0]}.{table[1]} after a lock conflict.")
+            try:
+                convert(table)
+            except Exception:
+                failed_tables.append(table)
+    finally:
+        pool.closeall()
+    return failed_tables
+
+def print_failed_tables(failed_tables):
+    if failed_tables:
+        print("Failed to convert the following columns:")
+        for table_schema, table_name, column_names, _ in failed_tables:
+            for column_name in column_names:
+                print(f"{table_schema}.{table_name}.{column_name}")
 
 def get_sequence_last_value(conn, sequence_schema, sequence_name):
     with conn.cursor() as cur:
@@ -159,6 +271,27 @@ def restore_sequences_last_value(conn, backup_file):
     else:
         print(f"Successfully restored sequences' last values from {backup_file}")
 
+def print_sequences_plan(conn, schema, ship_no):
+    sequences = get_sequences(conn, schema)
+    print(f"Plan: convert {len(sequences)} sequences to bigint")
+    if int(ship_no) == 0:
+        return
+    sq_start_from = int(ship_no) * SEQUENCE_PADDING
+    sq_end_at = (int(ship_no) + 1) * SEQUENCE_PADDING - 1
+    print(f"Plan: set the last_value of the sequences outside [{sq_start_from}, {sq_end_at}] to {sq_start_from}")
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT schemaname, sequencename, last_value
+            FROM pg_sequences
+            WHERE (schemaname, sequencename) IN %s
+            ORDER BY 1, 2
+        """, (tuple(sequences) or (('', ''),),))
+        for sequence_schema, sequence_name, last_value in cur.fetchall():
+            if last_value is None or last_value < sq_start_from or last_value > sq_end_at:
+                print(f"  {sequence_schema}.{sequence_name}: {last_value} -> {sq_start_from}")
+            else:
+                print(f"  {sequence_schema}.{sequence_name}: {last_value} (already migrated)")
+
 def main():
     parser = argparse.ArgumentParser(description="Database Maintenance Tool")
     subparsers = parser.add_subparsers(dest='command')
@@ -171,6 +304,8 @@ def main():
     convert_int_parser.add_argument("--user", required=True, help="Database user")
     convert_int_parser.add_argument("--password", required=True, help="Database password")
     convert_int_parser.add_argument("--schema", default="public", help="Schema to filter tables (optional)")
+    convert_int_parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Number of tables converted in parallel")
+    convert_int_parser.add_argument("--dry-run", action="store_true", help="Only print the tables and columns to convert")
 
     # Subcommand for setting sequence last_value
     set_seq_value_parser = subparsers.add_parser('set_sequence_last_value', help="Set last_value of sequences")
@@ -202,6 +337,8 @@ def main():
     migrate_onship_parser.add_argument("--password", required=True, help="Database password")
     migrate_onship_parser.add_argument("--schema", default="public", help="Schema to filter tables (optional)")
     migrate_onship_parser.add_argument("--ship_no", type=int, required=True, help="Ship number. Start from 1. E.g: ship 1 should be 1, ship 2 should be 2")
+    migrate_onship_parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Number of tables converted in parallel")
+    migrate_onship_parser.add_argument("--dry-run", action="store_true", help="Only print the migration plan")
 
     restore_seq_parser = subparsers.add_parser('restore_sequences', help="Restore sequences' last values from a JSON file")
     restore_seq_parser.add_argument("--host", required=True, help="Database host")
@@ -215,26 +352,22 @@ def main():
 
     conn = None
     try:
-        conn = psycopg2.connect(
+        conn_params = dict(
             host=args.host,
             port=args.port,
             dbname=args.dbname,
             user=args.user,
             password=args.password
         )
+        conn = psycopg2.connect(**conn_params)
 
         if args.command == 'convert_int_to_bigint':
-            failed_columns = []
-            columns = get_int_columns(conn, args.schema)
-            for table_schema, table_name, column_name in columns:
-                try:
-                    convert_column_to_bigint(conn, table_schema, table_name, column_name)
-                except Exception as e:
-                    failed_columns.append((table_schema, table_name, column_name))
-            if failed_columns:
-                print("Failed to convert the following columns:")
-                for table_schema, table_name, column_name in failed_columns:
-                    print(f"{table_schema}.{table_name}.{column_name}")
+            tables = get_int_columns_by_table(conn, args.schema)
+            print_int_columns_plan(tables, args.jobs)
+            if args.dry_run:
+                return
+            failed_tables = convert_int_columns_to_bigint(conn_params, tables, args.jobs)
+            print_failed_tables(failed_tables)
 
         elif args.command == 'set_sequence_last_value':
             backup_sequences_last_value(conn, args.schema, args.ship_no, args.host)
@@ -265,20 +398,17 @@ def main():
 
         elif args.command == 'migrate_onship_server':
             print(f"Migrating on-ship server for ship number {args.ship_no}")
+            tables = get_int_columns_by_table(conn, args.schema)
+            if args.dry_run:
+                print_int_columns_plan(tables, args.jobs)
+                print_sequences_plan(conn, args.schema, args.ship_no)
+                return
             backup_sequences_last_value(conn, args.schema, args.ship_no, args.host)
 
             # convert_int_columns
-            failed_columns = []
-            columns = get_int_columns(conn, args.schema)
-            for table_schema, table_name, column_name in columns:
-                try:
-                    convert_column_to_bigint(conn, table_schema, table_name, column_name)
-                except Exception as e:
-                    failed_columns.append((table_schema, table_name, column_name))
-            if failed_columns:
-                print("Failed to convert the following columns:")
-                for table_schema, table_name, column_name in failed_columns:
-                    print(f"{table_schema}.{table_name}.{column_name}")
+            print_int_columns_plan(tables, args.jobs)
+            failed_tables = convert_int_columns_to_bigint(conn_params, tables, args.jobs)
+            print_failed_tables(failed_tables)
 
             # convert_sequences
             failed_sequences = []